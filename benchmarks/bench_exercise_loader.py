@@ -0,0 +1,84 @@
+"""
+Сравнение загрузки текстов упражнений из отдельных .txt файлов
+и из пакета с таблицей смещений (mmap) на корпусе из тысяч текстов.
+
+Запуск: python -m benchmarks.bench_exercise_loader [число текстов]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.Models.ExerciseBundle import ExerciseBundle, write_bundle
+
+TEXTS = 5_000
+SAMPLE = ("Тренажер печати. The quick brown fox jumps over the lazy dog. "
+          "我家住在山边。")
+
+
+def make_corpus(count: int) -> dict:
+    """Генерирует тексты по ключам (язык, сложность, уровень) из чисел."""
+    rnd = random.Random(0)
+    return {(i % 7, i // 7 % 11, i // 77): SAMPLE * rnd.randint(5, 60)
+            for i in range(count)}
+
+
+def _file_path(directory: str, key: tuple) -> str:
+    return os.path.join(directory, "{}_{}_{}.txt".format(*key))
+
+
+def measure(count: int = TEXTS) -> dict:
+    """
+    Читает весь корпус и случайные тексты обоими способами.
+
+    Args:
+        count: число текстов в корпусе
+
+    Returns:
+        dict: время чтения в миллисекундах
+    """
+    corpus = make_corpus(count)
+    keys = list(corpus)
+    random.Random(1).shuffle(keys)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for key, text in corpus.items():
+            with open(_file_path(tmp_dir, key), "w", encoding="utf-8") as f:
+                f.write(text)
+        bundle_path = os.path.join(tmp_dir, "corpus.bundle")
+        write_bundle(bundle_path, corpus)
+
+        start = time.perf_counter()
+        for key in keys:
+            with open(_file_path(tmp_dir, key), "r", encoding="utf-8") as f:
+                f.read()
+        files_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        bundle = ExerciseBundle(bundle_path)
+        open_ms = (time.perf_counter() - start) * 1000
+        for key in keys:
+            bundle.get(*key)
+        bundle_ms = (time.perf_counter() - start) * 1000
+        bundle.close()
+
+    return {"texts": count, "loose_files_ms": files_ms,
+            "bundle_open_ms": open_ms, "bundle_ms": bundle_ms}
+
+
+def run(count: int = TEXTS) -> list:
+    return [measure(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else TEXTS
+    for result in run(count):
+        print(f"{result['texts']} texts: loose files "
+              f"{result['loose_files_ms']:.1f} ms, bundle "
+              f"{result['bundle_ms']:.1f} ms "
+              f"(open {result['bundle_open_ms']:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Число кадров и байт, выведенных на терминал, при быстром вводе
+(автоповтор клавиши) и при вводе, скопившемся в очереди терминала.
+Упражнение идет в настоящем curses на псевдотерминале: сравнивается
+планировщик с ограничением 60 кадров в секунду и отрисовка без
+ограничения (кадр на каждое пробуждение).
+
+Запуск: python -m benchmarks.bench_frames
+"""
+import curses
+import json
+import os
+import pty
+import tempfile
+import time
+
+from src.Models.GameModel import GameModel
+from src.Models.SettingsModel import SettingsModel
+from src.Presenters.GamePresenter import GamePresenter
+from src.Views.ExerciseView import ExerciseView
+
+EXERCISE_SECONDS = 2
+KEYS_PER_SECOND = 250
+QUEUED_KEYS = 2_000
+# Без ограничения кадр рисуется после каждого нажатия
+UNCAPPED = 1_000_000
+
+
+def _child(frame_rate: int, result_path: str) -> None:
+    """Запускает упражнение в дочернем процессе и пишет замер в файл."""
+    os.environ["TERM"] = "xterm"
+
+    def run(stdscr: curses.window):
+        text = "a" * (KEYS_PER_SECOND * EXERCISE_SECONDS * 2)
+        game_model = GameModel()
+        game_model.set_exercise_text(text)
+        game_model.set_exercise_time(EXERCISE_SECONDS)
+        presenter = GamePresenter(stdscr, game_model, SettingsModel(),
+                                  frame_rate=frame_rate)
+        presenter.exercise_view = ExerciseView(text)
+        presenter._run_exercise()
+        return game_model.current_position, presenter.scheduler.frames
+
+    keys, frames = curses.wrapper(run)
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump({"frame_rate": frame_rate, "keys": keys,
+                   "frames": frames}, f)
+
+
+def measure(frame_rate: int, queued: bool = False) -> dict:
+    """
+    Печатает KEYS_PER_SECOND символов в секунду на псевдотерминал.
+
+    Args:
+        frame_rate: ограничение частоты кадров планировщика
+        queued: вместо равномерного ввода записать QUEUED_KEYS
+            символов разом, как после задержки соединения
+
+    Returns:
+        dict: нажатия, кадры и байты вывода на терминал
+    """
+    fd, result_path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    pid, master = pty.fork()
+    if pid == 0:
+        try:
+            _child(frame_rate, result_path)
+        finally:
+            os._exit(0)
+
+    os.set_blocking(master, False)
+    output = 0
+
+    def drain():
+        nonlocal output
+        try:
+            while True:
+                data = os.read(master, 65536)
+                if not data:
+                    return False
+                output += len(data)
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+
+    time.sleep(0.5)
+    drain()
+    os.write(master, b" ")
+    time.sleep(0.1)
+    drain()
+    started = output
+
+    deadline = time.monotonic() + EXERCISE_SECONDS - 0.2
+    if queued:
+        os.write(master, b"a" * QUEUED_KEYS)
+    while not queued and time.monotonic() < deadline:
+        os.write(master, b"a")
+        drain()
+        time.sleep(1 / KEYS_PER_SECOND)
+    while drain():
+        time.sleep(0.01)
+    os.waitpid(pid, 0)
+    os.close(master)
+
+    with open(result_path, encoding="utf-8") as f:
+        result = json.load(f)
+    os.remove(result_path)
+    result["output_bytes"] = output - started
+    result["queued"] = queued
+    return result
+
+
+def run() -> list:
+    """Замеряет планировщик с ограничением и без него."""
+    return [measure(60), measure(UNCAPPED), measure(UNCAPPED, queued=True)]
+
+
+def main():
+    for result in run():
+        rate = "uncapped" if result["frame_rate"] == UNCAPPED \
+            else f"{result['frame_rate']} fps"
+        if result["queued"]:
+            rate += ", queued"
+        print(f"{rate:>16}: {result['keys']} keys, "
+              f"{result['frames']} frames, "
+              f"{result['output_bytes']} bytes to the terminal")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Заезд на нескольких терминалах: время и процессор заезда из N игроков
+на псевдотерминалах против тех же упражнений по очереди в одном
+окне. Каждый игрок набирает текст со скоростью TYPING_RATE нажатий
+в секунду из своего потока.
+
+Запуск: python -m benchmarks.bench_heat [игроков ...]
+"""
+import os
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+from src.Models.ExerciseModel import ExerciseModel
+from src.Models.GameModel import GameModel
+from src.Models.SettingsModel import SettingsModel
+from src.Presenters.GamePresenter import GamePresenter
+from src.Presenters.HeatPresenter import HeatPresenter
+from src.Views.TerminalWindow import TerminalWindow
+
+PLAYER_COUNTS = (2, 4, 8)
+EXERCISE_SECONDS = 2
+TYPING_RATE = 8
+
+
+class _Pty:
+    """Псевдотерминал: окно игрока и поток, читающий вывод."""
+
+    def __init__(self):
+        self.master, self.slave = os.openpty()
+        self.window = TerminalWindow(fd=self.slave)
+        self.bytes_out = 0
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        try:
+            while chunk := os.read(self.master, 65536):
+                self.bytes_out += len(chunk)
+        except OSError:
+            pass
+
+    def type(self, text: str, start_delay: float):
+        time.sleep(start_delay)
+        os.write(self.master, b" ")
+        time.sleep(0.2)
+        for char in text:
+            os.write(self.master, char.encode("utf-8"))
+            time.sleep(1 / TYPING_RATE)
+
+    def close(self):
+        os.close(self.slave)
+        os.close(self.master)
+
+
+def _typists(ptys: list, text: str, start_delay: float) -> list:
+    threads = [threading.Thread(target=pty.type,
+                                args=(text[:EXERCISE_SECONDS *
+                                           TYPING_RATE], start_delay))
+               for pty in ptys]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def _measure(players: int, text: str, settings: SettingsModel) -> dict:
+    ptys = [_Pty() for _ in range(players)]
+    try:
+        heat = HeatPresenter([pty.window for pty in ptys], settings,
+                             EXERCISE_SECONDS)
+        threads = _typists(ptys, text, 0.2)
+        started, cpu = time.perf_counter(), time.process_time()
+        results = heat.play()
+        heat_wall = time.perf_counter() - started
+        heat_cpu = time.process_time() - cpu
+        for thread in threads:
+            thread.join()
+
+        # Те же упражнения по очереди, как в турнире на одном терминале
+        sequential_wall = 0.0
+        for pty in ptys:
+            game_model = GameModel()
+            game_model.set_exercise_time(EXERCISE_SECONDS)
+            presenter = GamePresenter(pty.window, game_model, settings)
+            threads = _typists([pty], text, 0.2)
+            started = time.perf_counter()
+            presenter.start_game()
+            sequential_wall += time.perf_counter() - started
+            for thread in threads:
+                thread.join()
+    finally:
+        for pty in ptys:
+            pty.close()
+    return {"players": players, "heat_wall": heat_wall,
+            "heat_cpu_percent": heat_cpu / heat_wall * 100,
+            "sequential_wall": sequential_wall,
+            "keystrokes": sum(result["correct_keystrokes"]
+                              for result in results)}
+
+
+def run(player_counts=PLAYER_COUNTS) -> list:
+    """Заезды всех размеров."""
+    settings = SettingsModel()
+    text = ExerciseModel(settings.current_difficulty,
+                         settings.current_level,
+                         settings.current_language).get_exercise_text()
+    with patch("curses.start_color"), patch("curses.init_pair"), \
+            patch("curses.color_pair", return_value=0), \
+            patch("curses.doupdate"), patch("curses.flushinp"):
+        return [_measure(players, text, settings)
+                for players in player_counts]
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or PLAYER_COUNTS
+    for report in run(counts):
+        print(f"{report['players']} players: heat "
+              f"{report['heat_wall']:.2f} s "
+              f"({report['heat_cpu_percent']:.1f}% CPU), one by one "
+              f"{report['sequential_wall']:.2f} s, "
+              f"{report['keystrokes']} correct keystrokes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Замер загрузки процессора во время упражнения без нажатий.
+Упражнение запускается в настоящем curses на псевдотерминале:
+сравнивается цикл GamePresenter._run_exercise и прежний цикл
+с nodelay(True), который крутился на getch().
+
+Запуск: python -m benchmarks.bench_idle_cpu
+"""
+import curses
+import json
+import os
+import pty
+import tempfile
+import time
+
+from src.Models.GameModel import GameModel
+from src.Models.SettingsModel import SettingsModel
+from src.Presenters.GamePresenter import GamePresenter
+
+EXERCISE_SECONDS = 2
+
+
+def _busy_spin_loop(stdscr: curses.window, seconds: float) -> None:
+    """Прежний цикл ожидания ввода с nodelay(True)."""
+    stdscr.nodelay(True)
+    start_time = time.time()
+    while time.time() - start_time < seconds:
+        key = stdscr.getch()
+        if key == -1:
+            continue
+    stdscr.nodelay(False)
+
+
+class _StartHook:
+    """
+    Обертка над окном: запоминает процессорное время в момент,
+    когда на стартовом экране нажата клавиша и начался цикл.
+    """
+
+    def __init__(self, window: curses.window):
+        self._window = window
+        self.cpu_start = None
+
+    def getch(self):
+        key = self._window.getch()
+        if self.cpu_start is None:
+            self.cpu_start = time.process_time()
+        return key
+
+    def __getattr__(self, name):
+        return getattr(self._window, name)
+
+
+def _child(mode: str, result_path: str) -> None:
+    """Запускает упражнение в дочернем процессе и пишет замер в файл."""
+    os.environ["TERM"] = "xterm"
+
+    def run(stdscr: curses.window):
+        if mode == "busy":
+            stdscr.getch()
+            cpu_start = time.process_time()
+            wall_start = time.monotonic()
+            _busy_spin_loop(stdscr, EXERCISE_SECONDS)
+            return (time.monotonic() - wall_start,
+                    time.process_time() - cpu_start)
+
+        game_model = GameModel()
+        game_model.set_exercise_time(EXERCISE_SECONDS)
+        window = _StartHook(stdscr)
+        presenter = GamePresenter(window, game_model, SettingsModel())
+        presenter._initialize_exercise()
+        result = presenter._run_exercise()
+        return (result["elapsed_time"],
+                time.process_time() - window.cpu_start)
+
+    wall, cpu = curses.wrapper(run)
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump({"mode": mode, "wall": wall, "cpu": cpu}, f)
+
+
+def measure(mode: str) -> dict:
+    """
+    Запускает упражнение на псевдотерминале без ввода.
+
+    Args:
+        mode: "event" - текущий цикл, "busy" - цикл с nodelay
+
+    Returns:
+        dict: длительность, процессорное время и доля загрузки ядра
+    """
+    fd, result_path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    pid, master = pty.fork()
+    if pid == 0:
+        try:
+            _child(mode, result_path)
+        finally:
+            os._exit(0)
+
+    # Нажимаем клавишу на стартовом экране и дальше молчим
+    time.sleep(0.5)
+    os.write(master, b" ")
+    while True:
+        try:
+            if not os.read(master, 4096):
+                break
+        except OSError:
+            break
+    os.waitpid(pid, 0)
+    os.close(master)
+
+    with open(result_path, encoding="utf-8") as f:
+        result = json.load(f)
+    os.remove(result_path)
+    result["cpu_share"] = result["cpu"] / result["wall"]
+    result["overshoot_ms"] = (result["wall"] - EXERCISE_SECONDS) * 1000
+    return result
+
+
+def run() -> list:
+    """Замеряет оба варианта цикла."""
+    return [measure("event"), measure("busy")]
+
+
+def main():
+    for result in run():
+        print(f"{result['mode']:>5}: wall {result['wall']:.3f} s, "
+              f"cpu {result['cpu']:.3f} s "
+              f"({result['cpu_share'] * 100:.1f}% of a core), "
+              f"deadline overshoot {result['overshoot_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Задержка от чтения нажатия до конца обновления экрана в настоящем
+curses на псевдотерминале при равномерном вводе: с ограничением
+60 кадров в секунду и без него, а также цена самих замеров.
+
+Запуск: python -m benchmarks.bench_latency
+"""
+import curses
+import os
+import pty
+import tempfile
+import time
+
+from src.Models.GameModel import GameModel
+from src.Models.LatencyModel import LatencyModel, LatencyRecorder
+from src.Models.SettingsModel import SettingsModel
+from src.Presenters.GamePresenter import GamePresenter
+from src.Views.ExerciseView import ExerciseView
+
+EXERCISE_SECONDS = 2
+KEYS_PER_SECOND = 100
+UNCAPPED = 1_000_000
+OVERHEAD_KEYS = 100_000
+
+
+def _child(frame_rate: int, metrics_file: str) -> None:
+    """Запускает упражнение с замером задержки в дочернем процессе."""
+    os.environ["TERM"] = "xterm"
+
+    def run(stdscr: curses.window):
+        text = "a" * (KEYS_PER_SECOND * EXERCISE_SECONDS * 2)
+        game_model = GameModel()
+        game_model.set_exercise_text(text)
+        game_model.set_exercise_time(EXERCISE_SECONDS)
+        presenter = GamePresenter(stdscr, game_model, SettingsModel(),
+                                  frame_rate=frame_rate,
+                                  latency_model=LatencyModel(metrics_file))
+        presenter.exercise_view = ExerciseView(text)
+        presenter._run_exercise()
+
+    curses.wrapper(run)
+
+
+def measure(frame_rate: int) -> dict:
+    """
+    Печатает KEYS_PER_SECOND символов в секунду на псевдотерминал.
+    Args:
+        frame_rate: ограничение частоты кадров планировщика
+    Returns:
+        dict: сводка задержек сессии
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        metrics_file = os.path.join(tmp_dir, "latency.jsonl")
+        pid, master = pty.fork()
+        if pid == 0:
+            try:
+                _child(frame_rate, metrics_file)
+            finally:
+                os._exit(0)
+
+        os.set_blocking(master, False)
+
+        def drain():
+            try:
+                while os.read(master, 65536):
+                    pass
+                return False
+            except BlockingIOError:
+                return True
+            except OSError:
+                return False
+
+        time.sleep(0.5)
+        drain()
+        os.write(master, b" ")
+        deadline = time.monotonic() + EXERCISE_SECONDS - 0.2
+        while time.monotonic() < deadline:
+            os.write(master, b"a")
+            drain()
+            time.sleep(1 / KEYS_PER_SECOND)
+        while drain():
+            time.sleep(0.01)
+        os.waitpid(pid, 0)
+        os.close(master)
+
+        session, = LatencyModel(metrics_file).get_last_sessions()
+    return session
+
+
+def measure_overhead(keys: int = OVERHEAD_KEYS) -> float:
+    """Цена замера на одно нажатие в микросекундах."""
+    recorder = LatencyRecorder()
+    batch = [("a", 1_000_000)]
+    start = time.perf_counter()
+    for i in range(keys):
+        recorder.processed(batch, 2_000_000 + i)
+        recorder.painted(9_000_000 + i)
+    return (time.perf_counter() - start) / keys * 1e6
+
+
+def run() -> dict:
+    """Замеряет задержку с ограничением кадров и без него."""
+    return {"sessions": [measure(60), measure(UNCAPPED)],
+            "overhead_us_per_key": measure_overhead()}
+
+
+def main():
+    results = run()
+    for session in results["sessions"]:
+        rate = "uncapped" if session["frame_rate"] == UNCAPPED \
+            else f"{session['frame_rate']} fps"
+        for stage in ("process", "paint", "total"):
+            stats = session[stage]
+            print(f"{rate:>9} {stage:>7}: {stats['count']} keys, "
+                  f"p50 {stats['p50_us']} us, p95 {stats['p95_us']} us, "
+                  f"p99 {stats['p99_us']} us, max {stats['max_us']} us")
+    print(f"recording overhead: "
+          f"{results['overhead_us_per_key']:.2f} us/key")
+
+
+if __name__ == "__main__":
+    main()
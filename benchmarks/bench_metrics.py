@@ -0,0 +1,98 @@
+"""
+Расчет метрик упражнения по журналу из 100k нажатий: прежние списковые
+включения GamePresenter, резервная реализация на array и NumPy.
+
+Запуск: python -m benchmarks.bench_metrics [число нажатий]
+"""
+import random
+import sys
+import time
+
+from src.Models import Metrics
+from src.Models.KeystrokeLog import KeystrokeLog, KeystrokeLogView
+from src.Models.Metrics import compute_metrics
+
+KEYSTROKES = 100_000
+REPEATS = 5
+
+
+def make_log(count: int) -> KeystrokeLog:
+    """Журнал нажатий со случайными интервалами 50-400 мс."""
+    rnd = random.Random(0)
+    log, now = KeystrokeLog(), 0
+    for position in range(count):
+        now += rnd.randint(50_000_000, 400_000_000)
+        log.append(now, position, rnd.random() > 0.05)
+    return log
+
+
+def list_metrics(view: KeystrokeLogView, chars_typed: int,
+                 correct_keystrokes: int, elapsed_time: float) -> tuple:
+    """Расчет, которым GamePresenter пользовался до модуля Metrics."""
+    intervals = [interval / 1e9 for interval in view.intervals_ns()]
+    accuracy = (correct_keystrokes / chars_typed) * 100
+    wpm = (chars_typed / 5) / (elapsed_time / 60)
+    ideal_interval = elapsed_time / chars_typed
+    deviations = [abs(interval - ideal_interval) for interval in intervals]
+    avg_deviation = sum(deviations) / len(deviations)
+    return accuracy, wpm, min(100, int(avg_deviation / ideal_interval * 100))
+
+
+def _best_ms(function, repeats: int = REPEATS) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def measure(count: int = KEYSTROKES) -> dict:
+    """
+    Замеряет лучшее из нескольких запусков время расчета метрик.
+
+    Args:
+        count: число нажатий в журнале
+
+    Returns:
+        dict: время расчета в миллисекундах
+    """
+    log = make_log(count)
+    view = KeystrokeLogView(log)
+    correct = sum(1 for entry in view if entry[2])
+    elapsed_time = (view[-1][0] - view[0][0]) / 1e9
+
+    def run_metrics(use_numpy):
+        with view.timestamps() as timestamps:
+            compute_metrics(timestamps, count, correct, elapsed_time,
+                            use_numpy=use_numpy)
+
+    result = {
+        "keystrokes": count,
+        "lists_ms": _best_ms(
+            lambda: list_metrics(view, count, correct, elapsed_time)),
+        "array_ms": _best_ms(lambda: run_metrics(False)),
+        "numpy_ms": None,
+    }
+    if Metrics.np is not None:
+        result["numpy_ms"] = _best_ms(lambda: run_metrics(True))
+    return result
+
+
+def run(count: int = KEYSTROKES) -> list:
+    return [measure(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else KEYSTROKES
+    for result in run(count):
+        numpy_ms = "n/a" if result["numpy_ms"] is None \
+            else f"{result['numpy_ms']:.2f} ms"
+        print(f"{result['keystrokes']} keystrokes: lists "
+              f"{result['lists_ms']:.2f} ms (uniformity only), "
+              f"array {result['array_ms']:.2f} ms, numpy {numpy_ms} "
+              f"(all metrics)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Сетевой турнир на localhost: боты играют матчи тура одновременно,
+каждый ждет реальную длительность упражнения. Сравнивается время
+турнира с последовательным турниром на одном терминале
+(два упражнения на каждый матч подряд).
+
+Запуск: python -m benchmarks.bench_network_tournament [игроков ...]
+"""
+import asyncio
+import sys
+import time
+
+from src.Models.tournament.TournamentBot import play_bot
+from src.Models.tournament.TournamentServer import TournamentServer
+
+PLAYER_COUNTS = (8, 32, 128)
+EXERCISE_SECONDS = 1
+
+
+async def _tournament(players: int) -> dict:
+    server = TournamentServer(players, exercise_seconds=EXERCISE_SECONDS,
+                              port=0, log=lambda line: None)
+    port = await server.start()
+    started = time.perf_counter()
+    report, *_ = await asyncio.gather(
+        server.run(), *(play_bot(f"bot{number}", port=port, seed=number)
+                        for number in range(players)))
+    report["wall_seconds"] = time.perf_counter() - started
+    return report
+
+
+def run(player_counts=PLAYER_COUNTS) -> list:
+    """Турниры всех размеров."""
+    results = []
+    for players in player_counts:
+        report = asyncio.run(_tournament(players))
+        report["players"] = players
+        report["sequential_seconds"] = \
+            report["matches"] * 2 * EXERCISE_SECONDS
+        results.append(report)
+    return results
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or PLAYER_COUNTS
+    for report in run(counts):
+        overhead = max(report["round_seconds"]) - EXERCISE_SECONDS
+        print(f"{report['players']:>4} players: {report['rounds']} rounds, "
+              f"{report['matches']} matches in "
+              f"{report['wall_seconds']:.2f} s "
+              f"(sequential {report['sequential_seconds']} s), "
+              f"worst round overhead {overhead * 1e3:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Время составления пар тура в швейцарской и круговой системах
+до тысяч игроков, обновление таблицы очков после матча и, для
+сравнения, пары швейцарского тура полным перебором по списку.
+
+Запуск: python -m benchmarks.bench_pairing [игроков ...]
+"""
+import random
+import sys
+import time
+
+from src.Models.SettingsModel import SettingsModel
+from src.Models.tournament.RoundRobinTable import RoundRobinTable
+from src.Models.tournament.SwissTable import SwissTable
+
+PLAYER_COUNTS = (1_000, 2_000, 5_000, 10_000)
+# Перебор растет как n^2 - только для небольших турниров
+BRUTE_FORCE_LIMIT = 2_000
+
+
+def _brute_force_round(standings) -> list:
+    """
+    Пары тура перебором: для каждого свободного игрока просматриваются
+    все игроки в поисках лучшего по очкам нового соперника.
+    """
+    count = len(standings.gamers)
+    points = standings.points
+    paired = bytearray(count)
+    pairs = []
+    for first in sorted(range(count), key=lambda index: -points[index]):
+        if paired[first]:
+            continue
+        best = None
+        for second in range(count):
+            if second == first or paired[second] \
+                    or standings.have_played(first, second):
+                continue
+            if best is None or points[second] > points[best]:
+                best = second
+        if best is None:
+            continue
+        paired[first] = paired[best] = 1
+        pairs.append((first, best))
+    return pairs
+
+
+def bench_swiss(players: int, seed: int = 0) -> dict:
+    """Все туры швейцарки со случайными победителями."""
+    table = SwissTable(list(range(players)), SettingsModel(), False)
+    rng = random.Random(seed)
+    pairing = updating = brute_force = 0.0
+    for round_number in range(1, table.rounds + 1):
+        if players <= BRUTE_FORCE_LIMIT:
+            started = time.perf_counter()
+            _brute_force_round(table.standings)
+            brute_force += time.perf_counter() - started
+
+        started = time.perf_counter()
+        matches = table.round_matches(round_number)
+        pairing += time.perf_counter() - started
+
+        winners = [rng.choice((gamer1, gamer2))
+                   for _, gamer1, gamer2 in matches]
+        started = time.perf_counter()
+        for (match, _, _), winner in zip(matches, winners):
+            table.set_winner(match, winner)
+        updating += time.perf_counter() - started
+    matches = table.rounds * (players // 2)
+    return {"players": players, "rounds": table.rounds,
+            "round_ms": pairing / table.rounds * 1e3,
+            "round_brute_force_ms": brute_force / table.rounds * 1e3
+            if players <= BRUTE_FORCE_LIMIT else None,
+            "update_us": updating / matches * 1e6,
+            "rematches": table.rematches}
+
+
+def bench_round_robin(players: int, rounds: int = 10) -> dict:
+    """Первые rounds туров круговой системы."""
+    table = RoundRobinTable(list(range(players)), SettingsModel(), False)
+    started = time.perf_counter()
+    for round_number in range(1, rounds + 1):
+        table.round_matches(round_number)
+    return {"players": players,
+            "round_ms": (time.perf_counter() - started) / rounds * 1e3}
+
+
+def run(player_counts=PLAYER_COUNTS) -> list:
+    """Замеры всех размеров."""
+    return [(bench_swiss(players), bench_round_robin(players))
+            for players in player_counts]
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or PLAYER_COUNTS
+    for swiss, round_robin in run(counts):
+        brute_force = f"{swiss['round_brute_force_ms']:.1f} ms" \
+            if swiss["round_brute_force_ms"] is not None else "-"
+        print(f"{swiss['players']:>6} players: swiss {swiss['rounds']} "
+              f"rounds, {swiss['round_ms']:.2f} ms/round "
+              f"(brute force {brute_force}), "
+              f"standings {swiss['update_us']:.2f} us/match, "
+              f"{swiss['rematches']} rematches; round robin "
+              f"{round_robin['round_ms']:.2f} ms/round")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Сравнение RecordModel (JSON) и SqliteRecordModel на большой истории:
+загрузка, сохранение, лучший результат и последние записи.
+
+Запуск: python -m benchmarks.bench_records [размер ...]
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.Models.RecordJournal import HistorySummary
+from src.Models.RecordModel import RecordModel
+from src.Models.SettingsModel import Language, Difficulty, Level
+from src.Models.SqliteRecordModel import SqliteRecordModel
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+
+def make_records(count: int, seed: int = 0):
+    """Генерирует записи истории в формате RecordModel по порядку времени."""
+    rnd = random.Random(seed)
+    for i in range(count):
+        language = rnd.choice(list(Language))
+        difficulty = rnd.choice(list(Difficulty))
+        level = rnd.choice(list(Level))
+        chars_typed = rnd.randint(10, 400)
+        yield {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S",
+                                       time.gmtime(1_600_000_000 + i)),
+            "language": language.name,
+            "difficulty": difficulty.name,
+            "level": f"Level {level.value}",
+            "chars_typed": chars_typed,
+            "total_chars": 400,
+            "correct_keystrokes": chars_typed - rnd.randint(0, 10),
+            "accuracy": round(rnd.uniform(50, 100), 2),
+            "wpm": round(rnd.uniform(10, 150), 2),
+            "time_elapsed": 5.0,
+            "completed": chars_typed >= 400,
+        }
+
+
+def write_history(records_file: str, count: int) -> None:
+    """Пишет историю в формате снимка RecordJournal со сводкой."""
+    summary = HistorySummary()
+    for record in make_records(count):
+        summary.add(record)
+
+    base = os.path.splitext(records_file)[0]
+    with open(base + ".snapshot.jsonl", "w", encoding="utf-8") as f:
+        f.write(summary.to_header(0))
+        for record in make_records(count):
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def _average(func, repeat: int) -> float:
+    """Среднее время вызова в миллисекундах."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def measure(model_class, count: int) -> dict:
+    """
+    Замеряет операции модели истории на count записях.
+
+    Args:
+        model_class: RecordModel или SqliteRecordModel
+        count: размер истории
+
+    Returns:
+        dict: время операций в миллисекундах
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        records_file = os.path.join(tmp_dir, "records.json")
+        write_history(records_file, count)
+
+        start = time.perf_counter()
+        if model_class is SqliteRecordModel:
+            model = SqliteRecordModel(os.path.join(tmp_dir, "records.db"),
+                                      records_file)
+        else:
+            model = RecordModel(records_file)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        result = {
+            "model": model_class.__name__,
+            "records": count,
+            "load_ms": load_ms,
+            "save_record_ms": _average(lambda: model.save_record(
+                Language.English, Difficulty.simple, Level.l1,
+                120, 400, 118, 5.0), 20),
+            "get_best_record_ms": _average(lambda: model.get_best_record(
+                Language.Russian, Difficulty.middle, Level.l3), 50),
+            "get_last_records_ms": _average(
+                lambda: model.get_last_records(30), 20),
+        }
+        model.close()
+    return result
+
+
+def run(sizes=SIZES) -> list:
+    """Замеряет обе модели на всех размерах истории."""
+    return [measure(model_class, count)
+            for count in sizes
+            for model_class in (RecordModel, SqliteRecordModel)]
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    for result in run(sizes):
+        print(f"{result['model']:>18} {result['records']:>9}: "
+              f"load {result['load_ms']:9.1f} ms, "
+              f"save {result['save_record_ms']:7.3f} ms, "
+              f"best {result['get_best_record_ms']:8.3f} ms, "
+              f"last30 {result['get_last_records_ms']:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
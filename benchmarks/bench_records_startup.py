@@ -0,0 +1,80 @@
+"""
+Замер запуска RecordModel на истории в несколько мегабайт:
+время и пиковая память процесса до первого меню (лучший результат
+и последние 30 записей) при ленивой загрузке и при разборе
+всей истории.
+
+Запуск: python -m benchmarks.bench_records_startup [число записей]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.bench_records import write_history
+
+RECORDS = 50_000
+
+CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+from src.Models.RecordModel import RecordModel
+from src.Models.SettingsModel import Language, Difficulty, Level
+model = RecordModel(sys.argv[1])
+if sys.argv[2] == "full":
+    model.records
+model.get_best_record(Language.English, Difficulty.simple, Level.l1)
+model.get_last_records(30)
+print(json.dumps({
+    "startup_ms": (time.perf_counter() - start) * 1000,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+"""
+
+
+def measure(records_file: str, mode: str) -> dict:
+    """
+    Запускает отдельный процесс, который открывает историю.
+
+    Args:
+        records_file: путь к истории
+        mode: "lazy" - как при обычном запуске, "full" - с разбором
+            всей истории
+
+    Returns:
+        dict: время запуска и пиковая память процесса
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, records_file, mode],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    result = json.loads(output.stdout)
+    result["mode"] = mode
+    return result
+
+
+def run(records: int = RECORDS) -> list:
+    """Замеряет ленивый и полный запуск на одной истории."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        records_file = os.path.join(tmp_dir, "records.json")
+        write_history(records_file, records)
+        size_mb = os.path.getsize(
+            os.path.join(tmp_dir, "records.snapshot.jsonl")) / 2 ** 20
+        results = [measure(records_file, "lazy"),
+                   measure(records_file, "full")]
+    for result in results:
+        result["history_mb"] = size_mb
+    return results
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else RECORDS
+    for result in run(records):
+        print(f"{result['mode']:>4} ({result['history_mb']:.1f} MB history): "
+              f"startup {result['startup_ms']:8.1f} ms, "
+              f"max RSS {result['max_rss_mb']:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Замер стоимости ExerciseView.update_display на одно нажатие
+в зависимости от длины текста упражнения.
+
+Запуск: python -m benchmarks.bench_render
+"""
+import time
+from unittest.mock import patch
+
+from benchmarks.fake_window import FakeWindow
+from src.Views.ExerciseView import ExerciseView
+
+TEXT_LENGTHS = (1_000, 10_000, 100_000)
+KEYSTROKES = 2_000
+SAMPLE = ("The sun shines brightly, warming the green grass underfoot.\n"
+          "Children run across the playground, their laughter filling "
+          "the air. ")
+
+
+def make_text(length: int) -> str:
+    """Собирает текст упражнения заданной длины."""
+    return (SAMPLE * (length // len(SAMPLE) + 1))[:length]
+
+
+def measure(length: int, keystrokes: int = KEYSTROKES) -> dict:
+    """
+    Замеряет среднее время и число записей на экран на одно нажатие.
+
+    Args:
+        length: длина текста упражнения
+        keystrokes: сколько нажатий имитировать
+
+    Returns:
+        dict: результаты замера
+    """
+    window = FakeWindow()
+    with patch("curses.start_color"), patch("curses.init_pair"), \
+            patch("curses.color_pair", return_value=0):
+        view = ExerciseView(make_text(length))
+        view.show_exercise(window)
+        # Первая отрисовка полная, в замер не входит
+        view.update_display(window, True, 1, 1)
+        window.reset_counters()
+
+        start = time.perf_counter()
+        for position in range(2, keystrokes + 2):
+            view.update_display(window, position % 7 != 0,
+                                position, position)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "text_length": length,
+        "us_per_keystroke": elapsed / keystrokes * 1e6,
+        "writes_per_keystroke": window.writes / keystrokes,
+        "refreshes_per_keystroke": window.refreshes / keystrokes,
+    }
+
+
+def run() -> list:
+    """Прогоняет замер для всех длин текста."""
+    return [measure(length) for length in TEXT_LENGTHS]
+
+
+def main():
+    for result in run():
+        print(f"{result['text_length']:>8} chars: "
+              f"{result['us_per_keystroke']:8.2f} us/key, "
+              f"{result['writes_per_keystroke']:.2f} writes/key, "
+              f"{result['refreshes_per_keystroke']:.2f} refreshes/key")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Скорость воспроизведения без терминала на виртуальных часах:
+сколько нажатий в секунду проходит через настоящий GamePresenter
+в одной сессии и через TournamentPresenter в целом турнире.
+
+Запуск: python -m benchmarks.bench_replay
+"""
+import random
+
+from src.Presenters.Replay import TypistProfile, replay_session
+
+TEXT = "the quick brown fox jumps over the lazy dog " * 500
+SESSION_SECONDS = 120
+PLAYERS = 8
+TOURNAMENT_SECONDS = 30
+
+
+def measure_session() -> dict:
+    """Двухминутная сессия синтетического наборщика на 90 WPM."""
+    replay = replay_session(text=TEXT, exercise_seconds=SESSION_SECONDS,
+                            profile=TypistProfile(wpm=90))
+    return {"mode": "session", "keystrokes": replay["keystrokes"],
+            "virtual_seconds": replay["virtual_seconds"],
+            "wall_seconds": replay["wall_seconds"],
+            "keys_per_second": replay["keys_per_second"]}
+
+
+def measure_tournament() -> dict:
+    """Турнир из PLAYERS игроков со случайной скоростью."""
+    # Представления турнира требуют Python 3.12
+    from src.Presenters.TournamentReplay import replay_tournament
+
+    rng = random.Random(0)
+    profiles = {f"p{number}".encode():
+                TypistProfile(wpm=rng.uniform(30, 100))
+                for number in range(PLAYERS)}
+    replay = replay_tournament(profiles,
+                               exercise_seconds=TOURNAMENT_SECONDS)
+    return {"mode": "tournament", "keystrokes": replay["keystrokes"],
+            "virtual_seconds": replay["virtual_seconds"],
+            "wall_seconds": replay["wall_seconds"],
+            "keys_per_second": replay["keys_per_second"]}
+
+
+def run() -> list:
+    """Замеряет воспроизведение сессии и турнира."""
+    return [measure_session(), measure_tournament()]
+
+
+def main():
+    for result in run():
+        print(f"{result['mode']:>10}: {result['keystrokes']} keys, "
+              f"{result['virtual_seconds']:.0f} s of play in "
+              f"{result['wall_seconds'] * 1000:.0f} ms, "
+              f"{result['keys_per_second']:.0f} keys/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Размер и скорость двоичной записи сессии против JSON: десять минут
+набора большого текста и длинная запись для потокового чтения.
+
+Запуск: python -m benchmarks.bench_session_recording
+"""
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from src.Models.KeystrokeLog import KeystrokeLog, KeystrokeLogView
+from src.Models.SessionRecording import (SessionHeader, iter_events,
+                                         text_hash, write_session)
+from src.Models.SettingsModel import Difficulty, Language, Level
+
+SAMPLE = ("The sun shines brightly, warming the green grass underfoot. "
+          "Children run across the playground. ")
+SESSION_MINUTES = 10
+WPM = 80
+LONG_SESSION_KEYS = 1_000_000
+
+
+def make_log(keys: int, seed: int = 0) -> KeystrokeLogView:
+    """Журнал с интервалами наборщика на WPM слов в минуту."""
+    rnd = random.Random(seed)
+    mean_ns = 60 / (WPM * 5) * 1e9
+    log, now = KeystrokeLog(), 0
+    for position in range(keys):
+        now += int(rnd.gauss(mean_ns, mean_ns / 3)) or 1
+        char = SAMPLE[position % len(SAMPLE)]
+        is_correct = rnd.random() < 0.95
+        log.append(now, position, is_correct,
+                   ord(char if is_correct else "#"))
+    return KeystrokeLogView(log)
+
+
+def measure(keys: int, tmp_dir: str) -> dict:
+    """
+    Записывает и читает сессию из keys нажатий.
+    Returns:
+        dict: размеры в байтах и время в миллисекундах
+    """
+    log = make_log(keys)
+    digest, length = text_hash(SAMPLE)
+    result = {"keys": keys}
+
+    as_json = json.dumps([{"timestamp_ns": t, "position": p, "correct": c}
+                          for t, p, c in log])
+    result["json_bytes"] = len(as_json.encode())
+
+    for compressed in (False, True):
+        path = os.path.join(tmp_dir, f"session-{compressed}.trec")
+        header = SessionHeader(Language.English, Difficulty.simple,
+                               Level.big_text, digest, length,
+                               SESSION_MINUTES * 60, keys,
+                               compressed=compressed)
+        start = time.perf_counter()
+        size = write_session(path, header, log)
+        write_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        events = sum(1 for _ in iter_events(path))
+        read_ms = (time.perf_counter() - start) * 1000
+        assert events == keys
+
+        # Память чтения - отдельным проходом, tracemalloc его замедляет
+        tracemalloc.start()
+        for _ in iter_events(path):
+            pass
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        name = "zlib" if compressed else "raw"
+        result[f"{name}_bytes"] = size
+        result[f"{name}_write_ms"] = write_ms
+        result[f"{name}_read_ms"] = read_ms
+        result[f"{name}_read_peak_kib"] = peak / 1024
+    return result
+
+
+def run() -> list:
+    """Десятиминутная сессия и длинная запись."""
+    session_keys = SESSION_MINUTES * WPM * 5
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        return [measure(session_keys, tmp_dir),
+                measure(LONG_SESSION_KEYS, tmp_dir)]
+
+
+def main():
+    for result in run():
+        print(f"{result['keys']:>8} keys: JSON {result['json_bytes']} B, "
+              f"raw {result['raw_bytes']} B, "
+              f"zlib {result['zlib_bytes']} B; "
+              f"zlib write {result['zlib_write_ms']:.1f} ms, "
+              f"read {result['zlib_read_ms']:.1f} ms "
+              f"(peak {result['zlib_read_peak_kib']:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Потоковый режим большого текста: время до первого нажатия и пиковая
+память при наборе в зависимости от размера файла-источника.
+
+Запуск: python -m benchmarks.bench_stream
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from benchmarks.fake_window import FakeWindow
+from src.Models.GameModel import GameModel
+from src.Views.ExerciseView import ExerciseView
+
+FILE_SIZES_MB = (1, 16, 64)
+KEYSTROKES = 20_000
+CHUNK_SIZE = 4096
+SAMPLE = ("The sun shines brightly, warming the green grass underfoot.\n"
+          "Children run across the playground, their laughter filling "
+          "the air. ")
+
+
+def iter_file(path: str, chunk_size: int = CHUNK_SIZE):
+    """Читает файл частями, как ExerciseModel.iter_exercise_text."""
+    with open(path, "r", encoding="utf-8") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def measure(size_mb: int, keystrokes: int = KEYSTROKES) -> dict:
+    """
+    Запускает потоковое упражнение на файле заданного размера.
+
+    Args:
+        size_mb: размер файла в мегабайтах
+        keystrokes: сколько символов набрать
+
+    Returns:
+        dict: результаты замера
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "book.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            for _ in range(size_mb * 2 ** 20 // len(SAMPLE)):
+                f.write(SAMPLE)
+
+        window = FakeWindow()
+        model = GameModel()
+        tracemalloc.start()
+        with patch("curses.start_color"), patch("curses.init_pair"), \
+                patch("curses.color_pair", return_value=0):
+            start = time.perf_counter()
+            model.set_exercise_stream(iter_file(path))
+            view = ExerciseView(model.text, complete=model.is_text_loaded)
+            view.show_exercise(window)
+            model.process_keystroke(model.text[0])
+            first_key_ms = (time.perf_counter() - start) * 1000
+
+            for _ in range(keystrokes):
+                position = model.current_position
+                model.process_keystroke(
+                    model.text[position - model.text_offset])
+                view_end = view.text_end
+                if view_end < model.text_end:
+                    view.extend_text(
+                        model.text[view_end - model.text_offset:],
+                        model.is_text_loaded)
+                view.update_display(window, True, model.current_position,
+                                    model.correct_keystrokes)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {"size_mb": size_mb, "first_key_ms": first_key_ms,
+            "peak_kb": peak / 1024, "keystrokes": keystrokes + 1}
+
+
+def run(sizes=FILE_SIZES_MB) -> list:
+    return [measure(size) for size in sizes]
+
+
+def main():
+    for result in run():
+        print(f"{result['size_mb']:>3} MB source: first key after "
+              f"{result['first_key_ms']:.2f} ms, peak memory "
+              f"{result['peak_kb']:.0f} KB over "
+              f"{result['keystrokes']} keystrokes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Пропускная способность симулятора турниров: матчей в секунду всего
+и на одно ядро без пула и с пулом процессов по числу ядер.
+
+Запуск: python -m benchmarks.bench_tournament_sim [игроков ...]
+"""
+import os
+import sys
+
+from src.Models.tournament.TournamentSimulator import make_profiles, \
+    simulate_tournament
+
+PLAYER_COUNTS = (1_000, 10_000)
+EXERCISE_SECONDS = 30
+
+
+def run(player_counts=PLAYER_COUNTS) -> list:
+    """Турниры всех размеров в одном процессе и в пуле."""
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, cores})
+    results = []
+    for players in player_counts:
+        profiles = make_profiles(players)
+        for workers in worker_counts:
+            report = simulate_tournament(profiles,
+                                         exercise_seconds=EXERCISE_SECONDS,
+                                         workers=workers)
+            report["players"] = players
+            results.append(report)
+    return results
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or PLAYER_COUNTS
+    for report in run(counts):
+        print(f"{report['players']:>7} players, {report['workers']} "
+              f"worker(s): {report['matches']} matches, "
+              f"{report['byes']} byes, {report['rounds']} rounds in "
+              f"{report['wall_seconds']:.2f} s, "
+              f"{report['matches_per_second']:.0f} matches/s, "
+              f"{report['matches_per_second_per_core']:.0f} per core")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+class FakeWindow:
+    """
+    Окно-заглушка с интерфейсом curses.window для замеров без терминала.
+    Считает количество записей на экран и обновлений экрана.
+    """
+
+    def __init__(self, height: int = 40, width: int = 120):
+        self.height = height
+        self.width = width
+        self.writes = 0
+        self.refreshes = 0
+
+    def reset_counters(self) -> None:
+        """Обнуляет счетчики записей и обновлений."""
+        self.writes = 0
+        self.refreshes = 0
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    def addch(self, *args):
+        self.writes += 1
+
+    def addstr(self, *args):
+        self.writes += 1
+
+    def refresh(self):
+        self.refreshes += 1
+
+    def noutrefresh(self):
+        self.refreshes += 1
+
+    def move(self, y, x):
+        pass
+
+    def clrtoeol(self):
+        pass
+
+    def erase(self):
+        pass
+
+    def clear(self):
+        pass
+
+    def nodelay(self, flag):
+        pass
+
+    def timeout(self, delay):
+        pass
+
+    def keypad(self, flag):
+        pass
+
+    def getch(self):
+        return -1
@@ -0,0 +1,280 @@
+"""
+Набор микробенчмарков горячих путей тренажера с выводом в JSON:
+обработка нажатия, отрисовка упражнения, перенос большого текста,
+история результатов и построение турнирной таблицы.
+
+Запуск: python -m benchmarks [--quick] [--output FILE] [--compare FILE]
+    --quick    меньшие размеры истории и турнира для быстрой проверки
+    --output   записать результаты в файл вместо стандартного вывода
+    --compare  сравнить медианы с сохраненным ранее прогоном
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+from benchmarks.bench_records import write_history
+from benchmarks.bench_render import make_text
+from benchmarks.fake_window import FakeWindow
+from src.Models.GameModel import GameModel
+from src.Models.RecordModel import RecordModel
+from src.Models.SettingsModel import Difficulty, Language, Level, \
+    SettingsModel
+from src.Models.tournament.TournamentTable import TournamentTable
+from src.Views.ExerciseView import ExerciseView
+from src.Views.TextOutput import draw_text_with_wrap
+
+FORMAT_VERSION = 1
+ROUNDS = 5
+TEXT_LENGTHS = (1_000, 100_000)
+RECORD_SIZES = (1_000, 100_000, 1_000_000)
+PLAYER_COUNTS = (1_024, 65_536, 1_048_576)
+QUICK_RECORD_SIZES = (1_000, 10_000)
+QUICK_PLAYER_COUNTS = (1_024, 16_384)
+BIG_TEXT = "exercises/English_simple_big_text.txt"
+# Большой текст, повторенный до размера книги
+BOOK_LENGTH = 1_000_000
+# Медиана медленнее базовой на столько - регрессия
+REGRESSION_RATIO = 1.2
+
+
+def timed(name: str, params: dict, func, number: int,
+          rounds: int = ROUNDS, setup=None) -> dict:
+    """
+    Замеряет операцию несколькими раундами.
+
+    Args:
+        name: Имя замера
+        params: Параметры замера (размер текста, истории и т.п.)
+        func: Выполняет number операций, получает результат setup
+        number: Число операций за раунд
+        rounds: Число раундов
+        setup: Подготовка раунда, в замер не входит
+
+    Returns:
+        dict: время одной операции в микросекундах по раундам
+    """
+    per_op = []
+    for _ in range(rounds):
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        func(state)
+        per_op.append((time.perf_counter() - start) / number * 1e6)
+    return {
+        "name": name,
+        "params": params,
+        "ops_per_round": number,
+        "rounds": rounds,
+        "min_us": min(per_op),
+        "median_us": statistics.median(per_op),
+        "mean_us": statistics.fmean(per_op),
+        "stdev_us": statistics.stdev(per_op) if rounds > 1 else 0.0,
+    }
+
+
+def bench_process_keystroke(length: int = 100_000) -> dict:
+    """GameModel.process_keystroke с ошибкой на каждом седьмом символе."""
+    text = make_text(length)
+    keys = [char if i % 7 else "#" for i, char in enumerate(text)]
+    timestamps = range(0, length * 100_000_000, 100_000_000)
+
+    def setup():
+        game_model = GameModel()
+        game_model.set_exercise_text(text)
+        return game_model
+
+    def func(game_model):
+        process = game_model.process_keystroke
+        for key, timestamp_ns in zip(keys, timestamps):
+            process(key, timestamp_ns)
+
+    return timed("game_model.process_keystroke", {"text_length": length},
+                 func, length, setup=setup)
+
+
+def bench_update_display(length: int, keystrokes: int = 2_000) -> dict:
+    """ExerciseView.update_display на окне-заглушке."""
+    text = make_text(length)
+    window = FakeWindow()
+
+    def setup():
+        view = ExerciseView(text)
+        view.show_exercise(window)
+        view.update_display(window, True, 1, 1)
+        return view
+
+    def func(view):
+        for position in range(2, keystrokes + 2):
+            view.update_display(window, position % 7 != 0,
+                                position, position)
+
+    return timed("exercise_view.update_display", {"text_length": length},
+                 func, keystrokes, setup=setup)
+
+
+def bench_draw_text_with_wrap(length: int = None,
+                              max_lines: int = None) -> dict:
+    """
+    draw_text_with_wrap на большом тексте упражнения.
+    Args:
+        length: Повторить текст до этой длины (None - как в файле)
+        max_lines: Ограничение числа строк вывода
+    """
+    with open(BIG_TEXT, encoding="utf-8") as f:
+        text = f.read()
+    if length is not None:
+        text = (text * (length // len(text) + 1))[:length]
+    window = FakeWindow()
+
+    def func(_):
+        draw_text_with_wrap(window, text, max_lines=max_lines)
+
+    return timed("text_output.draw_text_with_wrap",
+                 {"text_length": len(text), "max_lines": max_lines},
+                 func, 1, rounds=3 if length else ROUNDS)
+
+
+def bench_records(count: int) -> list:
+    """Загрузка и операции RecordModel на истории из count записей."""
+    params = {"records": count}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        records_file = os.path.join(tmp_dir, "records.json")
+        write_history(records_file, count)
+        model = RecordModel(records_file)
+
+        results = [
+            timed("record_model.save_record", params,
+                  lambda _: model.save_record(
+                      Language.English, Difficulty.simple, Level.l1,
+                      120, 400, 118, 5.0), 1, rounds=20),
+            timed("record_model.get_best_record", params,
+                  lambda _: model.get_best_record(
+                      Language.Russian, Difficulty.middle, Level.l3),
+                  1, rounds=50),
+            timed("record_model.get_last_records", params,
+                  lambda _: model.get_last_records(5), 1, rounds=50),
+        ]
+        model.close()
+    return results
+
+
+def bench_tournament_table(players: int) -> dict:
+    """Построение TournamentTable для players игроков."""
+    gamers = [f"player{number}".encode() for number in range(players)]
+    settings_model = SettingsModel()
+
+    def func(_):
+        TournamentTable(gamers, settings_model, False)
+
+    return timed("tournament_table.construct", {"players": players},
+                 func, 1, rounds=3)
+
+
+def _git_commit():
+    """Текущий коммит, если набор запущен из репозитория git."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"],
+                              capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(quick: bool = False) -> dict:
+    """
+    Прогоняет все замеры набора.
+    Args:
+        quick: Уменьшенные размеры истории и турнира
+    Returns:
+        dict: описание окружения и список замеров
+    """
+    record_sizes = QUICK_RECORD_SIZES if quick else RECORD_SIZES
+    player_counts = QUICK_PLAYER_COUNTS if quick else PLAYER_COUNTS
+
+    results = [bench_process_keystroke()]
+    with patch("curses.start_color"), patch("curses.init_pair"), \
+            patch("curses.color_pair", return_value=0):
+        results += [bench_update_display(length) for length in TEXT_LENGTHS]
+        screen_lines = FakeWindow().height
+        results += [bench_draw_text_with_wrap(),
+                    bench_draw_text_with_wrap(BOOK_LENGTH, screen_lines),
+                    bench_draw_text_with_wrap(BOOK_LENGTH)]
+    for count in record_sizes:
+        results += bench_records(count)
+    results += [bench_tournament_table(players) for players in player_counts]
+
+    return {
+        "format": FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "benchmarks": results,
+    }
+
+
+def _key(result: dict) -> tuple:
+    return result["name"], json.dumps(result["params"], sort_keys=True)
+
+
+def compare(baseline: dict, current: dict) -> list:
+    """
+    Сопоставляет медианы двух прогонов.
+    Args:
+        baseline: Сохраненный ранее прогон
+        current: Новый прогон
+    Returns:
+        list: (имя, параметры, старая медиана, новая медиана,
+            отношение) для замеров, которые есть в обоих прогонах
+    """
+    old = {_key(result): result for result in baseline["benchmarks"]}
+    rows = []
+    for result in current["benchmarks"]:
+        before = old.get(_key(result))
+        if before is None:
+            continue
+        rows.append((result["name"], result["params"], before["median_us"],
+                     result["median_us"],
+                     result["median_us"] / before["median_us"]))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--output")
+    parser.add_argument("--compare")
+    args = parser.parse_args(argv)
+
+    report = run(args.quick)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = 0
+        for name, params, before, after, ratio in compare(baseline, report):
+            mark = ""
+            if ratio > REGRESSION_RATIO:
+                mark = "  REGRESSION"
+                regressions += 1
+            print(f"{name} {params}: {before:.3f} -> {after:.3f} us "
+                  f"(x{ratio:.2f}){mark}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,133 @@
+import argparse
+import asyncio
 import curses
+import os
+from src.Models.SettingsModel import Difficulty, Language, SettingsModel
+from src.Models.tournament.Protocol import DEFAULT_PORT
+from src.Models.tournament.TournamentBot import play_bot
+from src.Models.tournament.TournamentFormats import TournamentFormat
+from src.Models.tournament.TournamentServer import TournamentServer
+from src.Models.tournament.TournamentStatsModel import TournamentStatsModel
+from src.Presenters.Profiler import MODES, SessionProfiler
 from src.Presenters.RootPresenter import RootPresenter
+from src.Presenters.TournamentClient import TournamentClient
+from src.Views.TerminalWindow import TerminalWindow
 import locale
 
 
-def main(stdscr: curses.window):
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Typing trainer")
+    parser.add_argument("--profile", choices=MODES,
+                        help="profile the whole session or only exercises "
+                             "(also TYPING_PROFILE)")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="track allocations with tracemalloc "
+                             "(also TYPING_PROFILE_MEMORY=1)")
+    parser.add_argument("--profile-dir", default="profiles",
+                        help="directory for profiling reports "
+                             "(also TYPING_PROFILE_DIR)")
+
+    parser.add_argument("--terminal", action="append", default=[],
+                        metavar="TTY",
+                        help="extra terminal (e.g. /dev/pts/3) for "
+                             "simultaneous tournament matches; repeat "
+                             "for more players per heat")
+
+    network = parser.add_argument_group("network tournament")
+    network.add_argument("--serve", type=int, metavar="PLAYERS",
+                         help="host a tournament for PLAYERS players")
+    network.add_argument("--connect", metavar="HOST[:PORT]",
+                         help="join a tournament as a player")
+    network.add_argument("--name", help="player name for --connect")
+    network.add_argument("--host", default="127.0.0.1",
+                         help="address to listen on for --serve")
+    network.add_argument("--port", type=int, default=DEFAULT_PORT)
+    network.add_argument("--format", choices=[f.name
+                                              for f in TournamentFormat],
+                         default=TournamentFormat.knockout.name)
+    network.add_argument("--language", choices=[lang.name
+                                                for lang in Language],
+                         default=Language.English.name)
+    network.add_argument("--difficulty", choices=[d.name
+                                                  for d in Difficulty],
+                         default=Difficulty.simple.name)
+    network.add_argument("--big-text", action="store_true")
+    network.add_argument("--seconds", type=int, default=60,
+                         help="exercise length")
+    network.add_argument("--bots", type=int, default=0,
+                         help="fill that many places with synthetic "
+                              "typists")
+    args = parser.parse_args()
+    if args.connect and not args.name:
+        parser.error("--connect needs --name")
+    if args.serve is not None and not 0 <= args.bots <= args.serve:
+        parser.error("--bots must be between 0 and --serve")
+    return args
+
+
+def make_profiler(args: argparse.Namespace):
+    """Профилировщик по ключам запуска или переменным окружения."""
+    if args.profile:
+        return SessionProfiler(args.profile, args.profile_memory,
+                               args.profile_dir)
+    return SessionProfiler.from_environment(os.environ)
+
+
+def main(stdscr: curses.window, profiler: SessionProfiler = None,
+         terminal_paths: list = ()):
+    stdscr.encoding = 'utf-8'
+    locale.setlocale(locale.LC_ALL, 'zh_CN.UTF-8')
+    terminals = [TerminalWindow(path) for path in terminal_paths]
+    try:
+        if profiler is None:
+            RootPresenter(stdscr, terminals=terminals).run()
+        elif profiler.mode == "exercise":
+            RootPresenter(stdscr, exercise_profiler=profiler,
+                          terminals=terminals).run()
+        else:
+            with profiler:
+                RootPresenter(stdscr, terminals=terminals).run()
+    finally:
+        for terminal in terminals:
+            terminal.close()
+
+
+async def serve(args: argparse.Namespace) -> dict:
+    """Сервер сетевого турнира и, по желанию, боты на свободных местах."""
+    settings_model = SettingsModel()
+    settings_model.current_language = Language[args.language]
+    settings_model.current_difficulty = Difficulty[args.difficulty]
+    server = TournamentServer(args.serve, settings_model, args.big_text,
+                              TournamentFormat[args.format], args.seconds,
+                              args.host, args.port, TournamentStatsModel())
+    port = await server.start()
+    bots = [asyncio.create_task(play_bot(f"bot{number}", port=port,
+                                         seed=number))
+            for number in range(1, args.bots + 1)]
+    report = await server.run()
+    await asyncio.gather(*bots)
+    return report
+
+
+def join(stdscr: curses.window, args: argparse.Namespace,
+         profiler: SessionProfiler = None):
     stdscr.encoding = 'utf-8'
     locale.setlocale(locale.LC_ALL, 'zh_CN.UTF-8')
-    root_presenter = RootPresenter(stdscr)
-    root_presenter.run()
+    host, _, port = args.connect.partition(":")
+    TournamentClient(stdscr, args.name, host, int(port or args.port),
+                     profiler=profiler).run()
 
 
-curses.wrapper(main)
+args = parse_args()
+if args.serve is not None:
+    asyncio.run(serve(args))
+else:
+    profiler = make_profiler(args)
+    try:
+        if args.connect:
+            curses.wrapper(join, args, profiler)
+        else:
+            curses.wrapper(main, profiler, args.terminal)
+    finally:
+        if profiler is not None:
+            print(f"Profile saved to {profiler.save()}")
@@ -0,0 +1,55 @@
+import time
+
+
+class SystemClock:
+    """
+    Часы на системном времени. Функции модуля time берутся при каждом
+    вызове, так что подмена time.monotonic в тестах продолжает работать.
+    """
+
+    def monotonic(self) -> float:
+        """Монотонное время в секундах."""
+        return time.monotonic()
+
+    def perf_counter_ns(self) -> int:
+        """Время для отметок нажатий в наносекундах."""
+        return time.perf_counter_ns()
+
+    def sleep(self, seconds: float) -> None:
+        """Пауза на seconds секунд."""
+        time.sleep(seconds)
+
+
+class VirtualClock:
+    """
+    Виртуальные часы для воспроизведения без терминала: время идет
+    только тогда, когда его двигают (ожидание ввода, пауза), поэтому
+    сессия проигрывается с максимальной скоростью.
+    """
+
+    def __init__(self, start: float = 0.0):
+        """
+        Args:
+            start: Начальное время в секундах
+        """
+        self.now = start
+
+    def monotonic(self) -> float:
+        """Текущее виртуальное время в секундах."""
+        return self.now
+
+    def perf_counter_ns(self) -> int:
+        """Текущее виртуальное время в наносекундах."""
+        return round(self.now * 1e9)
+
+    def sleep(self, seconds: float) -> None:
+        """Сдвигает время на seconds секунд без реального ожидания."""
+        self.advance(seconds)
+
+    def advance(self, seconds: float) -> None:
+        """Сдвигает время вперед на seconds секунд."""
+        self.now += max(seconds, 0)
+
+    def advance_to(self, moment: float) -> None:
+        """Сдвигает время до moment, если оно ещё не наступило."""
+        self.now = max(self.now, moment)
@@ -0,0 +1,182 @@
+import codecs
+import mmap
+import os
+import struct
+import sys
+
+from src.Models.SettingsModel import Difficulty, Level, Language
+
+BUNDLE_NAME = "exercises.bundle"
+MAGIC = b"KTBUNDL1"
+# Заголовок: сигнатура и число текстов
+HEADER = struct.Struct("<8sI4x")
+# Запись таблицы: язык, сложность, уровень, смещение и длина текста
+ENTRY = struct.Struct("<HHH2xQQ")
+
+
+def build_bundle(exercises_path: str = "exercises/",
+                 bundle_path: str = None) -> str:
+    """
+    Упаковывает тексты упражнений из отдельных .txt файлов в один
+    файл с таблицей смещений.
+    Args:
+        exercises_path: Каталог с упражнениями
+        bundle_path: Куда записать пакет (по умолчанию в exercises_path)
+    Returns:
+        str: Путь к пакету
+    """
+    texts = {}
+    for language in Language:
+        for difficulty in Difficulty:
+            for level in Level:
+                path = (f"{exercises_path}{language.name}_"
+                        f"{difficulty.name}_{level.name}.txt")
+                if os.path.exists(path):
+                    with open(path, "r", encoding="utf-8") as f:
+                        texts[(language.value, difficulty.value,
+                               level.value)] = f.read()
+
+    bundle_path = bundle_path or exercises_path + BUNDLE_NAME
+    write_bundle(bundle_path, texts)
+    return bundle_path
+
+
+def write_bundle(bundle_path: str, texts: dict) -> None:
+    """
+    Записывает пакет текстов.
+    Args:
+        bundle_path: Путь к пакету
+        texts: Тексты по ключу (язык, сложность, уровень) из чисел
+    """
+    keys = sorted(texts)
+    data = [texts[key].encode("utf-8") for key in keys]
+    offset = HEADER.size + ENTRY.size * len(keys)
+
+    tmp_path = bundle_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(keys)))
+        for key, encoded in zip(keys, data):
+            f.write(ENTRY.pack(*key, offset, len(encoded)))
+            offset += len(encoded)
+        for encoded in data:
+            f.write(encoded)
+    os.replace(tmp_path, bundle_path)
+
+
+class ExerciseBundle:
+    """
+    Пакет текстов упражнений, отображенный в память через mmap.
+    При открытии читается только таблица смещений, тексты
+    вырезаются из отображения по запросу.
+    """
+
+    def __init__(self, bundle_path: str):
+        self.bundle_path = bundle_path
+        with open(bundle_path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, count = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{bundle_path} is not an exercise bundle")
+
+            self._table = {}
+            for i in range(count):
+                *key, offset, length = ENTRY.unpack_from(
+                    self._map, HEADER.size + i * ENTRY.size)
+                if offset + length > len(self._map):
+                    raise ValueError(f"{bundle_path} is truncated")
+                self._table[tuple(key)] = (offset, length)
+        except (ValueError, struct.error):
+            self._map.close()
+            raise
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def get(self, language: int, difficulty: int, level: int):
+        """
+        Возвращает текст упражнения или None, если его нет в пакете.
+        Args:
+            language: Номер языка
+            difficulty: Номер сложности
+            level: Номер уровня
+        """
+        entry = self._table.get((language, difficulty, level))
+        if entry is None:
+            return None
+        offset, length = entry
+        return self._map[offset:offset + length].decode("utf-8")
+
+    def iter_text(self, language: int, difficulty: int, level: int,
+                  chunk_size: int = 4096):
+        """
+        Отдает текст упражнения частями, не декодируя его целиком.
+        Args:
+            language: Номер языка
+            difficulty: Номер сложности
+            level: Номер уровня
+            chunk_size: Размер части в байтах
+        Returns:
+            Итератор частей текста или None, если текста нет в пакете
+        """
+        entry = self._table.get((language, difficulty, level))
+        if entry is None:
+            return None
+        offset, length = entry
+        return self._iter_range(offset, offset + length, chunk_size)
+
+    def _iter_range(self, start: int, end: int, chunk_size: int):
+        """Декодирует диапазон отображения по частям."""
+        # Инкрементальный декодер склеивает символы на границах частей
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for position in range(start, end, chunk_size):
+            chunk = self._map[position:min(position + chunk_size, end)]
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    def close(self) -> None:
+        """Закрывает отображение файла."""
+        self._map.close()
+
+
+_open_bundles = {}
+
+
+def open_bundle(bundle_path: str):
+    """
+    Возвращает открытый пакет, переоткрывая его, если файл изменился.
+    Args:
+        bundle_path: Путь к пакету
+    Returns:
+        ExerciseBundle или None, если пакета нет или он поврежден -
+        тогда тексты читаются из отдельных .txt файлов
+    """
+    try:
+        stat = os.stat(bundle_path)
+    except FileNotFoundError:
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    opened = _open_bundles.get(bundle_path)
+    if opened is None or opened[0] != signature:
+        if opened is not None:
+            del _open_bundles[bundle_path]
+            opened[1].close()
+        try:
+            bundle = ExerciseBundle(bundle_path)
+        except (OSError, ValueError, struct.error):
+            # Пустой (mmap не отображает файл нулевой длины), чужой
+            # или обрезанный пакет
+            return None
+        _open_bundles[bundle_path] = (signature, bundle)
+    return _open_bundles[bundle_path][1]
+
+
+if __name__ == "__main__":
+    path = build_bundle(*sys.argv[1:2])
+    print(f"Packed {len(ExerciseBundle(path))} exercises into {path}")
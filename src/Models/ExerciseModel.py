@@ -1,6 +1,80 @@
+import os
+import threading
+from collections import OrderedDict
+
+from src.Models.ExerciseBundle import BUNDLE_NAME, open_bundle
 from src.Models.SettingsModel import Difficulty, Level, Language
 
 
+class ExerciseTextCache:
+    """
+    Общий для процесса ограниченный LRU-кэш текстов упражнений.
+    Запись сбрасывается, если у файла изменились время изменения
+    или размер, поэтому повторные игры не читают файл заново.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, path: str, read=None) -> str:
+        """
+        Возвращает текст файла из кэша или читает его с диска.
+        Args:
+            key: ключ (язык, сложность, уровень); запись хранится
+                под ключом вместе с полным путем файла, так что модели
+                с разными каталогами упражнений не делят записи
+            path: путь к файлу упражнения
+            read: функция чтения текста, по умолчанию файл
+                читается целиком
+        Raises:
+            FileNotFoundError: если файла нет
+        """
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = (os.path.abspath(path), *key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        if read is not None:
+            text = read()
+        else:
+            with open(path, "r", encoding="utf-8") as exercise_file:
+                text = exercise_file.read()
+
+        with self._lock:
+            self._entries[key] = (signature, text)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return text
+
+    def clear(self) -> None:
+        """Очищает кэш и счетчики."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> dict:
+        """Возвращает счетчики попаданий и промахов и размер кэша."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "size": len(self._entries), "maxsize": self.maxsize}
+
+
+exercise_cache = ExerciseTextCache()
+
+
 class ExerciseModel:
     """Класс для работы с упражнениями для тренировки"""
 
@@ -13,16 +87,66 @@ class ExerciseModel:
         self.exercises_path = "exercises/"
 
     def get_exercise_text(self) -> str:
-        """Возвращает текст упражнения для тренажёра"""
+        """
+        Возвращает текст упражнения для тренажёра.
+        Сначала ищет текст в пакете упражнений, затем в отдельном файле.
+        """
+        text = self._get_bundled_text()
+        if text is not None:
+            return text
+
         try:
             exercise_path = self._get_file_path()
-            with open(exercise_path, "r", encoding="utf-8") as exercise_file:
-                return exercise_file.read()
+            return exercise_cache.get(
+                (self.language, self.difficulty, self.level), exercise_path)
         except FileNotFoundError:
             return (f"Exercise not found for {self.language.name}" +
                     f", difficulty {self.difficulty.name}," +
                     f" level {self.level.name}")
 
+    def iter_exercise_text(self, chunk_size: int = 4096):
+        """
+        Отдает текст упражнения частями, не читая файл целиком
+        (для больших текстов, например целой книги). Части не
+        кэшируются, так что память не зависит от размера текста.
+        Args:
+            chunk_size: Размер части
+        """
+        bundle = open_bundle(self.exercises_path + BUNDLE_NAME)
+        if bundle is not None:
+            chunks = bundle.iter_text(self.language.value,
+                                      self.difficulty.value,
+                                      self.level.value, chunk_size)
+            if chunks is not None:
+                yield from chunks
+                return
+
+        try:
+            exercise_file = open(self._get_file_path(), "r",
+                                 encoding="utf-8")
+        except FileNotFoundError:
+            yield self.get_exercise_text()
+            return
+
+        with exercise_file:
+            while True:
+                chunk = exercise_file.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def _get_bundled_text(self):
+        """Возвращает текст из пакета упражнений или None."""
+        bundle_path = self.exercises_path + BUNDLE_NAME
+        bundle = open_bundle(bundle_path)
+        if bundle is None:
+            return None
+        return exercise_cache.get(
+            ("bundle", self.language, self.difficulty, self.level),
+            bundle_path,
+            lambda: bundle.get(self.language.value,
+                               self.difficulty.value, self.level.value))
+
     def _get_file_path(self) -> str:
         """Возвращает путь к файлу с заданием,
          основываясь на заданных сложности, уровне и языке"""
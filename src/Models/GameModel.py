@@ -1,3 +1,10 @@
+import time
+from typing import Iterable
+
+from src.Models.KeystrokeLog import KeystrokeLog, KeystrokeLogView
+from src.Models.Metrics import LiveMetrics
+
+
 class GameModel:
     """
     Модель клавиатурного тренажера,
@@ -9,38 +16,130 @@ class GameModel:
         Инициализирует игровую модель.
         """
         self._text = ""
+        # Потоковый режим: в памяти держится только окно текста
+        # вокруг курсора, _text_offset - абсолютная позиция _text[0]
+        self._source = None
+        self._window_size = 0
+        self._text_offset = 0
+        self._is_text_loaded = True
         self._correct_keystrokes = 0
         self._exercise_time_seconds = 5
         self._current_position = 0
         self._is_completed = False
+        self._keystroke_log = KeystrokeLog()
+        self._keystroke_log_view = KeystrokeLogView(self._keystroke_log)
+        self._live_metrics = LiveMetrics()
 
-    def process_keystroke(self, key_char: str) -> bool:
+    def process_keystroke(self, key_char: str,
+                          timestamp_ns: int = None) -> bool:
         """
         Обрабатывает нажатие клавиши и проверяет корректность.
         Args:
             key_char: введенный символ
+            timestamp_ns: время нажатия (perf_counter_ns),
+                по умолчанию текущее
         """
-        if self._current_position >= len(self._text):
+        self._fill_window()
+        index = self._current_position - self._text_offset
+        if index >= len(self._text):
             self._is_completed = True
             return False
 
-        is_correct = key_char == self._text[self._current_position]
+        is_correct = key_char == self._text[index]
 
         if is_correct:
             self._correct_keystrokes += 1
 
+        if timestamp_ns is None:
+            timestamp_ns = time.perf_counter_ns()
+        self._keystroke_log.append(timestamp_ns, self._current_position,
+                                   is_correct, ord(key_char))
+        self._live_metrics.add(timestamp_ns, is_correct)
+
         self._current_position += 1
+        self._fill_window()
 
-        if self._current_position >= len(self._text):
+        if self._current_position - self._text_offset >= len(self._text):
             self._is_completed = True
 
         return is_correct
 
+    def process_keystrokes(self, keys: Iterable[tuple[str, int]]) -> bool:
+        """
+        Обрабатывает пачку нажатий, пришедших за одно пробуждение.
+        Время каждого нажатия сохраняется в журнале. Нажатия после
+        конца текста не обрабатываются, как и по одному.
+        Args:
+            keys: пары (символ, время нажатия perf_counter_ns)
+        Returns:
+            bool: корректность последнего обработанного нажатия
+        """
+        is_correct = False
+        for key_char, timestamp_ns in keys:
+            if self._is_completed:
+                break
+            is_correct = self.process_keystroke(key_char, timestamp_ns)
+        return is_correct
+
     def set_exercise_text(self, text: str) -> None:
         """Устанавливает текст для упражнения."""
         self._text = text
+        self._source = None
+        self._text_offset = 0
+        self._is_text_loaded = True
         self._reset()
 
+    def set_exercise_stream(self, chunks: Iterable[str],
+                            window_size: int = 4096) -> None:
+        """
+        Устанавливает текст упражнения, читаемый по частям.
+        В памяти держится окно около курсора: вперед подчитывается
+        не меньше window_size символов, пройденный текст отбрасывается.
+        Args:
+            chunks: Итератор частей текста
+            window_size: Размер окна текста в символах
+        """
+        self._text = ""
+        self._source = iter(chunks)
+        self._window_size = max(window_size, 1)
+        self._text_offset = 0
+        self._is_text_loaded = False
+        self._reset()
+        self._fill_window()
+
+    def _fill_window(self) -> None:
+        """
+        Сдвигает окно потокового текста за курсором: отбрасывает
+        пройденный текст и подчитывает следующие части из источника.
+        """
+        if self._source is None:
+            return
+
+        index = self._current_position - self._text_offset
+        # Отбрасываем сразу половину окна, чтобы копирование строки
+        # происходило не чаще раза на window_size / 2 нажатий
+        if index > self._window_size:
+            drop = index - self._window_size // 2
+            self._text = self._text[drop:]
+            self._text_offset += drop
+            index -= drop
+
+        if self._is_text_loaded or \
+                len(self._text) - index >= self._window_size:
+            return
+
+        parts = [self._text]
+        ahead = len(self._text) - index
+        while ahead < self._window_size:
+            chunk = next(self._source, None)
+            if chunk is None:
+                self._is_text_loaded = True
+                self._source = None
+                break
+            parts.append(chunk)
+            ahead += len(chunk)
+        self._text = "".join(parts)
+
     def set_level(self, text: str) -> None:
         """
         Устанавливает текст упражнения
@@ -63,12 +162,40 @@ class GameModel:
         self._correct_keystrokes = 0
         self._current_position = 0
         self._is_completed = False
+        self._keystroke_log.clear()
+        self._live_metrics.reset()
 
     @property
     def text(self) -> str:
-        """Получить текст упражнения."""
+        """
+        Получить текст упражнения. В потоковом режиме - текущее окно,
+        которое начинается с позиции text_offset.
+        """
         return self._text
 
+    @property
+    def text_offset(self) -> int:
+        """Получить абсолютную позицию начала окна текста"""
+        return self._text_offset
+
+    @property
+    def text_end(self) -> int:
+        """Получить абсолютную позицию конца прочитанного текста"""
+        return self._text_offset + len(self._text)
+
+    @property
+    def total_chars(self) -> int:
+        """
+        Получить длину текста упражнения. В потоковом режиме,
+        пока текст не дочитан, - число уже прочитанных символов.
+        """
+        return self.text_end
+
+    @property
+    def is_text_loaded(self) -> bool:
+        """Проверить, прочитан ли текст упражнения до конца"""
+        return self._is_text_loaded
+
     @property
     def current_position(self) -> int:
         """Получить позицию в упражнении"""
@@ -79,6 +206,16 @@ class GameModel:
         """Получить количество корректных нажатий"""
         return self._correct_keystrokes
 
+    @property
+    def keystroke_log(self) -> KeystrokeLogView:
+        """Получить журнал нажатий упражнения (только для чтения)"""
+        return self._keystroke_log_view
+
+    @property
+    def live_metrics(self) -> LiveMetrics:
+        """Получить метрики, обновляемые во время набора"""
+        return self._live_metrics
+
     @property
     def exercise_time_seconds(self) -> int:
         """Получить продолжительность упражнения в секундах"""
@@ -0,0 +1,90 @@
+from array import array
+
+
+class KeystrokeLog:
+    """
+    Компактный журнал нажатий упражнения.
+    Время (perf_counter_ns), позиция, код клавиши и корректность
+    каждого нажатия хранятся в типизированных массивах: 17 байт
+    на нажатие, добавление за амортизированное O(1).
+    """
+
+    def __init__(self):
+        self._timestamps = array("q")
+        self._positions = array("I")
+        self._keys = array("I")
+        self._correct = bytearray()
+
+    def append(self, timestamp_ns: int, position: int,
+               is_correct: bool, key: int = 0) -> None:
+        """
+        Добавляет нажатие в журнал.
+        Args:
+            timestamp_ns: время нажатия в наносекундах
+            position: позиция в тексте, на которой было нажатие
+            is_correct: было ли нажатие корректным
+            key: код введенного символа (0 - неизвестен)
+        """
+        self._timestamps.append(timestamp_ns)
+        self._positions.append(position)
+        self._keys.append(key)
+        self._correct.append(is_correct)
+
+    def clear(self) -> None:
+        """Очищает журнал."""
+        del self._timestamps[:]
+        del self._positions[:]
+        del self._keys[:]
+        del self._correct[:]
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+
+class KeystrokeLogView:
+    """
+    Представление журнала нажатий только для чтения.
+    Массивы отдаются как read-only memoryview. Пока такой memoryview
+    не освобожден, журнал нельзя дополнять, поэтому их стоит
+    использовать в блоке with.
+    """
+
+    def __init__(self, log: KeystrokeLog):
+        self._log = log
+
+    def __len__(self) -> int:
+        return len(self._log)
+
+    def __getitem__(self, index: int) -> tuple[int, int, bool]:
+        """Возвращает нажатие как (время в нс, позиция, корректность)."""
+        return (self._log._timestamps[index],
+                self._log._positions[index],
+                bool(self._log._correct[index]))
+
+    def __iter__(self):
+        log = self._log
+        for i in range(len(log)):
+            yield (log._timestamps[i], log._positions[i],
+                   bool(log._correct[i]))
+
+    def timestamps(self) -> memoryview:
+        """Время нажатий в наносекундах (perf_counter_ns)."""
+        return memoryview(self._log._timestamps).toreadonly()
+
+    def positions(self) -> memoryview:
+        """Позиции нажатий в тексте."""
+        return memoryview(self._log._positions).toreadonly()
+
+    def keys(self) -> memoryview:
+        """Коды введенных символов (0 - неизвестен)."""
+        return memoryview(self._log._keys).toreadonly()
+
+    def correct(self) -> memoryview:
+        """Корректность нажатий: 1 - верно, 0 - ошибка."""
+        return memoryview(self._log._correct).toreadonly()
+
+    def intervals_ns(self) -> array:
+        """Возвращает интервалы между соседними нажатиями в наносекундах."""
+        timestamps = self._log._timestamps
+        return array("q", (timestamps[i] - timestamps[i - 1]
+                           for i in range(1, len(timestamps))))
@@ -0,0 +1,192 @@
+import json
+import os
+import time
+from array import array
+
+from src.Models.SettingsModel import Difficulty, Language, Level
+
+# Точные корзины для малых значений и число корзин на каждую
+# степень двойки: ошибка перцентиля не больше 1/16 значения
+SUB_BUCKETS = 16
+SUB_BITS = 4
+# Значения от 2**MAX_BITS микросекунд (около 19 часов) попадают
+# в последнюю корзину
+MAX_BITS = 36
+BUCKETS = (MAX_BITS - SUB_BITS + 1) * SUB_BUCKETS
+# Перцентили задержки, которые попадают в метрики сессии
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек фиксированного размера в микросекундах:
+    логарифмические корзины с линейным делением внутри степени
+    двойки. Память не зависит от длины сессии, максимум хранится
+    точно.
+    """
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * BUCKETS))
+        self.count = 0
+        self.max = 0
+        self.total = 0
+
+    @staticmethod
+    def bucket_of(value: int) -> int:
+        """Номер корзины для значения в микросекундах."""
+        if value < SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - SUB_BITS - 1
+        index = (shift + 1) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS
+        return min(index, BUCKETS - 1)
+
+    @staticmethod
+    def bucket_limit(index: int) -> int:
+        """Наибольшее значение, попадающее в корзину index."""
+        if index < SUB_BUCKETS:
+            return index
+        shift = index // SUB_BUCKETS - 1
+        mantissa = index % SUB_BUCKETS + SUB_BUCKETS
+        return ((mantissa + 1) << shift) - 1
+
+    def add(self, value_ns: int) -> None:
+        """
+        Учитывает задержку.
+        Args:
+            value_ns: Задержка в наносекундах
+        """
+        value = max(value_ns, 0) // 1000
+        self.counts[self.bucket_of(value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> int:
+        """
+        Перцентиль задержки в микросекундах (верхняя граница корзины,
+        но не больше точного максимума).
+        Args:
+            percent: Перцентиль от 0 до 100
+        """
+        if self.count == 0:
+            return 0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self.bucket_limit(index), self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        """Сводка гистограммы: число, перцентили, среднее и максимум."""
+        summary = {"count": self.count}
+        for percent in LATENCY_PERCENTILES:
+            summary[f"p{percent}_us"] = self.percentile(percent)
+        summary["max_us"] = self.max
+        summary["mean_us"] = \
+            round(self.total / self.count) if self.count else 0
+        return summary
+
+
+class LatencyRecorder:
+    """
+    Задержки нажатий одной сессии по этапам:
+        process - от чтения нажатия до обработки моделью;
+        paint - от обработки до конца обновления экрана;
+        total - от чтения до конца обновления экрана.
+    Нажатия, ждущие кадра, хранятся до ближайшей отрисовки.
+    """
+
+    def __init__(self):
+        self.process = LatencyHistogram()
+        self.paint = LatencyHistogram()
+        self.total = LatencyHistogram()
+        # Пары (время чтения, время обработки) еще не нарисованных нажатий
+        self._pending = array("q")
+
+    def processed(self, batch, processed_ns: int) -> None:
+        """
+        Отмечает обработку пачки нажатий.
+        Args:
+            batch: Пары (символ, время чтения perf_counter_ns)
+            processed_ns: Время окончания обработки
+        """
+        for _, read_ns in batch:
+            self.process.add(processed_ns - read_ns)
+            self._pending.append(read_ns)
+            self._pending.append(processed_ns)
+
+    def painted(self, painted_ns: int) -> None:
+        """
+        Отмечает конец обновления экрана для всех ждавших нажатий.
+        Args:
+            painted_ns: Время окончания обновления экрана
+        """
+        pending = self._pending
+        for i in range(0, len(pending), 2):
+            self.total.add(painted_ns - pending[i])
+            self.paint.add(painted_ns - pending[i + 1])
+        del pending[:]
+
+    @property
+    def unpainted(self) -> int:
+        """Нажатия, обработанные после последнего кадра."""
+        return len(self._pending) // 2
+
+    def to_dict(self) -> dict:
+        """Сводка задержек сессии по этапам."""
+        return {"process": self.process.to_dict(),
+                "paint": self.paint.to_dict(),
+                "total": self.total.to_dict(),
+                "unpainted": self.unpainted}
+
+
+class LatencyModel:
+    """
+    Файл метрик задержки ввода в формате JSON Lines:
+    по строке со сводкой задержек на каждую сессию.
+    """
+
+    def __init__(self, metrics_file: str = "latency.jsonl"):
+        self.metrics_file = metrics_file
+
+    def save_session(self, language: Language, difficulty: Difficulty,
+                     level: Level, recorder: LatencyRecorder,
+                     frame_rate: int) -> dict:
+        """
+        Дописывает метрики сессии в файл.
+
+        Args:
+            language: Язык упражнения
+            difficulty: Сложность упражнения
+            level: Уровень упражнения
+            recorder: Задержки сессии
+            frame_rate: Ограничение частоты кадров сессии
+
+        Returns:
+            dict: Сохраненная запись
+        """
+        entry = {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "language": language.name,
+            "difficulty": difficulty.name,
+            "level": f"Level {level.value}",
+            "frame_rate": frame_rate,
+            **recorder.to_dict(),
+        }
+        with open(self.metrics_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return entry
+
+    def get_last_sessions(self, count: int = 5) -> list:
+        """
+        Последние count записей метрик, от новых к старым.
+        :param count: Количество записей.
+        """
+        if not os.path.exists(self.metrics_file):
+            return []
+        with open(self.metrics_file, "r", encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        return entries[::-1][:count]
@@ -0,0 +1,209 @@
+import math
+import operator
+from array import array
+from collections import deque
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен, без него считаем на array
+    np = None
+
+# Перцентили интервалов между нажатиями, которые попадают в результат
+PERCENTILES = (50, 90, 99)
+# Сколько нажатий подряд берется для скорости рывка
+BURST_KEYSTROKES = 10
+# По скольким последним нажатиям считается текущая скорость
+LIVE_WINDOW = 20
+
+
+def typing_speed(chars_typed: int, elapsed_time: float) -> float:
+    """
+    Скорость набора в словах в минуту (слово - 5 символов).
+    Args:
+        chars_typed: Количество набранных символов
+        elapsed_time: Время набора в секундах
+    """
+    return (chars_typed / 5) / (elapsed_time / 60) if elapsed_time > 0 else 0
+
+
+def typing_accuracy(correct_keystrokes: int, chars_typed: int) -> float:
+    """
+    Точность набора в процентах.
+    Args:
+        correct_keystrokes: Количество правильных нажатий
+        chars_typed: Количество набранных символов
+    """
+    return (correct_keystrokes / chars_typed) * 100 if chars_typed > 0 else 0
+
+
+def compute_metrics(timestamps_ns, chars_typed: int,
+                    correct_keystrokes: int, elapsed_time: float,
+                    use_numpy: bool = None) -> dict:
+    """
+    Считает все метрики упражнения по массиву времен нажатий.
+    Интервалы обрабатываются пакетно: NumPy, если он установлен,
+    иначе через array и встроенные функции.
+
+    Args:
+        timestamps_ns: Времена нажатий в наносекундах (array, memoryview
+            или любая последовательность целых)
+        chars_typed: Количество набранных символов
+        correct_keystrokes: Количество правильных нажатий
+        elapsed_time: Время упражнения в секундах
+        use_numpy: Принудительно выбрать реализацию
+            (по умолчанию NumPy, если он доступен)
+
+    Returns:
+        dict: wpm, accuracy, correct_keystrokes, elapsed_time,
+            uniformity_score, avg_deviation, burst_wpm и перцентили
+            интервалов interval_p50/p90/p99 в секундах
+    """
+    ideal_interval = elapsed_time / chars_typed if chars_typed > 0 else 0
+
+    intervals = {}
+    if len(timestamps_ns) >= 2:
+        if use_numpy is None:
+            use_numpy = np is not None
+        compute = _interval_stats_numpy if use_numpy else _interval_stats
+        intervals = compute(timestamps_ns, ideal_interval * 1e9)
+
+    avg_deviation = intervals.get("avg_deviation_ns", 0) / 1e9
+    deviation_score = min(100, int(avg_deviation / ideal_interval * 100)) \
+        if intervals and ideal_interval > 0 else 0
+    min_burst_ns = intervals.get("min_burst_ns", 0)
+
+    metrics = {
+        "wpm": typing_speed(chars_typed, elapsed_time),
+        "accuracy": typing_accuracy(correct_keystrokes, chars_typed),
+        "correct_keystrokes": correct_keystrokes,
+        "elapsed_time": elapsed_time,
+        "uniformity_score": 100 - deviation_score,
+        "avg_deviation": avg_deviation,
+        "burst_wpm": typing_speed(intervals.get("burst_keystrokes", 0),
+                                  min_burst_ns / 1e9),
+    }
+    for percentile in PERCENTILES:
+        metrics[f"interval_p{percentile}"] = \
+            intervals.get(f"p{percentile}_ns", 0) / 1e9
+    return metrics
+
+
+class LiveMetrics:
+    """
+    Метрики, которые обновляются во время набора за O(1) на нажатие:
+    среднее и дисперсия интервалов (алгоритм Уэлфорда), скорость
+    по последним нажатиям и текущая точность. Итоговые метрики
+    по-прежнему считает compute_metrics по журналу нажатий.
+    """
+
+    def __init__(self, window: int = LIVE_WINDOW):
+        """
+        Args:
+            window: По скольким последним нажатиям считать скорость
+        """
+        self.window = window
+        self._recent = deque(maxlen=window + 1)
+        self.reset()
+
+    def reset(self) -> None:
+        """Сбрасывает накопленные значения."""
+        self.keystrokes = 0
+        self.correct_keystrokes = 0
+        self.intervals = 0
+        self._mean_ns = 0.0
+        self._m2 = 0.0
+        self._recent.clear()
+
+    def add(self, timestamp_ns: int, is_correct: bool) -> None:
+        """
+        Учитывает нажатие.
+        Args:
+            timestamp_ns: Время нажатия в наносекундах
+            is_correct: Было ли нажатие правильным
+        """
+        self.keystrokes += 1
+        if is_correct:
+            self.correct_keystrokes += 1
+
+        if self._recent:
+            interval = timestamp_ns - self._recent[-1]
+            self.intervals += 1
+            delta = interval - self._mean_ns
+            self._mean_ns += delta / self.intervals
+            self._m2 += delta * (interval - self._mean_ns)
+        self._recent.append(timestamp_ns)
+
+    @property
+    def accuracy(self) -> float:
+        """Текущая точность в процентах."""
+        return typing_accuracy(self.correct_keystrokes, self.keystrokes)
+
+    @property
+    def wpm(self) -> float:
+        """Скорость по последним window нажатиям."""
+        if len(self._recent) < 2:
+            return 0
+        span = (self._recent[-1] - self._recent[0]) / 1e9
+        return typing_speed(len(self._recent) - 1, span)
+
+    @property
+    def mean_interval(self) -> float:
+        """Средний интервал между нажатиями в секундах."""
+        return self._mean_ns / 1e9
+
+    @property
+    def interval_variance(self) -> float:
+        """Дисперсия интервалов между нажатиями в секундах^2."""
+        return self._m2 / self.intervals / 1e18 if self.intervals else 0
+
+    @property
+    def interval_stddev(self) -> float:
+        """Стандартное отклонение интервалов в секундах."""
+        return math.sqrt(self.interval_variance)
+
+
+def _interval_stats(timestamps_ns, ideal_interval_ns: float) -> dict:
+    """Статистика интервалов без NumPy: циклы идут внутри map и sorted."""
+    intervals = array("q", map(operator.sub, timestamps_ns[1:],
+                               timestamps_ns[:-1]))
+
+    deviation = sum(map(abs, map(operator.sub, intervals,
+                                 repeat(ideal_interval_ns))))
+
+    burst = min(BURST_KEYSTROKES, len(intervals))
+    min_burst_ns = min(map(operator.sub, timestamps_ns[burst:],
+                           timestamps_ns[:-burst]))
+
+    ordered = sorted(intervals)
+    stats = {"avg_deviation_ns": deviation / len(intervals),
+             "burst_keystrokes": burst, "min_burst_ns": min_burst_ns}
+    for percentile in PERCENTILES:
+        stats[f"p{percentile}_ns"] = _percentile(ordered, percentile)
+    return stats
+
+
+def _interval_stats_numpy(timestamps_ns, ideal_interval_ns: float) -> dict:
+    """Статистика интервалов на NumPy без копирования журнала."""
+    timestamps = np.asarray(timestamps_ns, dtype=np.int64)
+    intervals = np.diff(timestamps)
+
+    burst = min(BURST_KEYSTROKES, len(intervals))
+    bursts = timestamps[burst:] - timestamps[:-burst]
+
+    stats = {"avg_deviation_ns":
+             float(np.abs(intervals - ideal_interval_ns).mean()),
+             "burst_keystrokes": burst,
+             "min_burst_ns": int(bursts.min())}
+    for percentile, value in zip(PERCENTILES,
+                                 np.percentile(intervals, PERCENTILES)):
+        stats[f"p{percentile}_ns"] = float(value)
+    return stats
+
+
+def _percentile(ordered: list, percentile: float) -> float:
+    """Перцентиль отсортированного списка с линейной интерполяцией."""
+    rank = (len(ordered) - 1) * percentile / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
@@ -0,0 +1,444 @@
+import json
+import os
+import threading
+
+
+def update_best_records(best_records: dict, index: int,
+                        record: dict) -> None:
+    """
+    Обновляет индекс лучших результатов новой записью.
+    Индекс хранит по ключу (язык, сложность, уровень) лучшую
+    по WPM запись вместе с её номером в истории.
+
+    Args:
+        best_records: Индекс лучших результатов
+        index: Номер записи в истории
+        record: Запись истории
+    """
+    key = (record["language"], record["difficulty"], record["level"])
+    best = best_records.get(key)
+    if best is None or record["wpm"] > best[1]["wpm"]:
+        best_records[key] = (index, record)
+
+
+class HistorySummary:
+    """
+    Сводка по истории результатов, которую можно поддерживать
+    по одной записи: число записей, индекс лучших результатов
+    и то, идут ли записи по возрастанию времени.
+    Хранится в заголовке снимка.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.best_records = {}
+        self.ordered = True
+        self.last_timestamp = None
+
+    @classmethod
+    def from_header(cls, header: dict) -> "HistorySummary":
+        """Восстанавливает сводку из заголовка снимка."""
+        summary = cls()
+        for index, record in header["best"]:
+            update_best_records(summary.best_records, index, record)
+        summary.count = header["count"]
+        summary.ordered = header.get("ordered", False)
+        summary.last_timestamp = header.get("last_timestamp")
+        return summary
+
+    def add(self, record: dict) -> None:
+        """Учитывает новую запись в конце истории."""
+        update_best_records(self.best_records, self.count, record)
+        self.count += 1
+        if (self.last_timestamp is not None and
+                record["timestamp"] < self.last_timestamp):
+            self.ordered = False
+        self.last_timestamp = record["timestamp"]
+
+    def to_header(self, generation: int) -> str:
+        """Собирает строку заголовка снимка."""
+        return json.dumps({
+            "generation": generation,
+            "count": self.count,
+            "ordered": self.ordered,
+            "last_timestamp": self.last_timestamp,
+            "best": [[index, record]
+                     for index, record in self.best_records.values()]
+        }, ensure_ascii=False) + "\n"
+
+
+class RecordJournal:
+    """
+    Хранилище истории результатов в формате JSON Lines.
+    Состоит из снимка (все записи на момент последнего сжатия)
+    и журнала, в который новые записи дописываются по одной строке.
+    Первая строка каждого файла - заголовок с номером поколения,
+    по нему при загрузке видно, какие журналы уже вошли в снимок.
+    В заголовке снимка также хранится сводка по истории
+    (HistorySummary), чтобы не разбирать снимок целиком при запуске.
+    """
+
+    def __init__(self, records_file: str = "records.json",
+                 compact_after: int = 500):
+        """
+        Args:
+            records_file: Файл истории в прежнем формате,
+                рядом с ним создаются снимок и журнал
+            compact_after: Сколько записей журнала копить до сжатия
+        """
+        base = os.path.splitext(records_file)[0]
+        self.legacy_file = records_file
+        self.snapshot_file = base + ".snapshot.jsonl"
+        self.journal_file = base + ".journal.jsonl"
+        self.folding_file = self.journal_file + ".old"
+        self.compact_after = compact_after
+
+        self._lock = threading.Lock()
+        # Защищает чтение от подмены снимка фоновым сжатием
+        self._files_lock = threading.Lock()
+        self._compaction = None
+        self._journal = None
+        self._journal_records = 0
+        self._generation = 0
+
+    def exists(self) -> bool:
+        """Проверяет, сохранена ли уже какая-нибудь история."""
+        return any(os.path.exists(path) for path in
+                   (self.legacy_file, self.snapshot_file, self.journal_file))
+
+    def open(self) -> None:
+        """
+        Подготавливает хранилище к работе, не разбирая записи.
+        При первом запуске переносит историю из файла прежнего формата,
+        доводит до конца сжатие, прерванное падением, и открывает
+        журнал для дозаписи.
+        """
+        if self._journal is not None:
+            return
+
+        if self._legacy_only():
+            self._migrate_legacy()
+
+        if os.path.exists(self.folding_file):
+            if self._read_generation(self.folding_file) >= \
+                    self._read_generation(self.snapshot_file):
+                self._fold()
+            else:
+                os.remove(self.folding_file)
+
+        self._generation = self._read_generation(self.snapshot_file)
+
+        if os.path.exists(self.journal_file):
+            self._repair_tail(self.journal_file)
+        if os.path.exists(self.journal_file) and \
+                os.path.getsize(self.journal_file) > 0:
+            self._journal_records = sum(
+                1 for _ in self._read_lines(self.journal_file))
+            self._journal = open(self.journal_file, "a", encoding="utf-8")
+        else:
+            self._open_journal(self._generation)
+
+    def _legacy_only(self) -> bool:
+        """
+        История есть только в файле прежнего формата: хранилище
+        еще ни разу не открывалось для записи.
+        """
+        return (not os.path.exists(self.snapshot_file) and
+                not os.path.exists(self.journal_file) and
+                os.path.exists(self.legacy_file))
+
+    def load(self) -> list:
+        """
+        Открывает хранилище и загружает все записи.
+
+        Returns:
+            list: Список записей истории
+        """
+        self.open()
+        return self.read_all()
+
+    def read_all(self) -> list:
+        """
+        Разбирает всю историю: снимок и журналы, а до первой
+        записи - файл прежнего формата. Файлы не создаются.
+
+        Returns:
+            list: Список записей истории
+        """
+        with self._files_lock:
+            if self._legacy_only():
+                return self._read_legacy()
+            records = []
+            for path in (self.snapshot_file, self.folding_file,
+                         self.journal_file):
+                records.extend(self._read_records(path))
+            return records
+
+    def read_recent(self) -> tuple[dict, list]:
+        """
+        Возвращает заголовок снимка и записи, ещё не вошедшие в снимок.
+        Снимок при этом целиком не разбирается.
+
+        Returns:
+            tuple: (заголовок снимка, записи журналов)
+        """
+        with self._files_lock:
+            if self._legacy_only():
+                return {}, self._read_legacy()
+            header = self._read_header(self.snapshot_file)
+            records = []
+            for path in (self.folding_file, self.journal_file):
+                records.extend(self._read_records(path))
+            return header, records
+
+    def read_tail(self, count: int) -> list:
+        """
+        Возвращает последние count записей истории, читая файлы
+        с конца блоками. Остальная история не разбирается.
+
+        Args:
+            count: Количество записей
+
+        Returns:
+            list: Записи в порядке добавления
+        """
+        with self._files_lock:
+            if self._legacy_only():
+                return self._read_legacy()[-count:] if count > 0 else []
+            lines = []
+            for path in (self.journal_file, self.folding_file,
+                         self.snapshot_file):
+                if len(lines) >= count:
+                    break
+                lines.extend(self._read_lines_reversed(path,
+                                                       count - len(lines)))
+
+        records = []
+        for line in reversed(lines):
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return records
+
+    def append(self, record: dict) -> None:
+        """
+        Дописывает запись в журнал и сбрасывает её на диск.
+        Когда журнал разрастается, запускает сжатие в фоне.
+
+        Args:
+            record: Запись истории
+        """
+        self.open()
+        with self._lock:
+            self._journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._journal_records += 1
+            should_compact = self._journal_records >= self.compact_after
+
+        if should_compact:
+            self.compact()
+
+    def compact(self, background: bool = True) -> None:
+        """
+        Сворачивает журнал в снимок. Текущий журнал откладывается,
+        новые записи идут в свежий журнал, а снимок переписывается
+        атомарно (через временный файл и os.replace).
+
+        Args:
+            background: Выполнять ли сворачивание в фоновом потоке
+        """
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+
+        with self._lock:
+            if self._journal_records == 0:
+                return
+            self._journal.close()
+            with self._files_lock:
+                os.replace(self.journal_file, self.folding_file)
+                self._open_journal(self._generation + 1)
+            self._journal_records = 0
+            self._generation += 1
+
+        if background:
+            self._compaction = threading.Thread(target=self._fold,
+                                                daemon=True)
+            self._compaction.start()
+        else:
+            self._fold()
+
+    def close(self) -> None:
+        """Дожидается фонового сжатия и закрывает журнал."""
+        if self._compaction is not None:
+            self._compaction.join()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _fold(self) -> None:
+        """
+        Записывает новый снимок из старого снимка и отложенного журнала.
+        Записи снимка копируются строками без разбора, разбираются
+        только записи журнала, чтобы обновить заголовок.
+        """
+        header = self._read_header(self.snapshot_file)
+        if "best" in header:
+            summary = HistorySummary.from_header(header)
+            records = []
+        else:
+            # Снимок без сводки разбираем целиком
+            summary = HistorySummary()
+            records = self._read_records(self.snapshot_file)
+
+        journal_lines = list(self._read_lines(self.folding_file))
+        for record in records:
+            summary.add(record)
+        for line in journal_lines:
+            try:
+                summary.add(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+
+        generation = self._read_generation(self.folding_file) + 1
+        lines = [summary.to_header(generation)]
+        lines.extend(self._read_lines(self.snapshot_file))
+        lines.extend(journal_lines)
+
+        tmp_path = self._write_tmp(self.snapshot_file, lines)
+        with self._files_lock:
+            os.replace(tmp_path, self.snapshot_file)
+            os.remove(self.folding_file)
+
+    def _migrate_legacy(self) -> None:
+        """Переносит историю из records.json прежнего формата в снимок."""
+        records = self._read_legacy()
+        summary = HistorySummary()
+        for record in records:
+            summary.add(record)
+
+        lines = [summary.to_header(0)]
+        lines.extend(json.dumps(record, ensure_ascii=False) + "\n"
+                     for record in records)
+        os.replace(self._write_tmp(self.snapshot_file, lines),
+                   self.snapshot_file)
+
+    def _read_legacy(self) -> list:
+        """Записи из records.json прежнего формата."""
+        try:
+            with open(self.legacy_file, "r", encoding="utf-8") as f:
+                records = json.load(f).get("records", [])
+        except (OSError, json.JSONDecodeError):
+            records = []
+        return records
+
+    def _open_journal(self, generation: int) -> None:
+        """Создает новый журнал с заголовком поколения."""
+        self._journal = open(self.journal_file, "w", encoding="utf-8")
+        self._journal.write(json.dumps({"generation": generation}) + "\n")
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    @staticmethod
+    def _read_header(path: str) -> dict:
+        """Возвращает заголовок файла (пустой, если файла нет)."""
+        if not os.path.exists(path):
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                header = json.loads(f.readline())
+            except json.JSONDecodeError:
+                return {}
+        return header if isinstance(header, dict) else {}
+
+    def _read_generation(self, path: str) -> int:
+        """Возвращает номер поколения из заголовка файла."""
+        return self._read_header(path).get("generation", 0)
+
+    @staticmethod
+    def _read_lines(path: str):
+        """Отдает целые строки записей файла без заголовка."""
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            f.readline()
+            for line in f:
+                if line.endswith("\n"):
+                    yield line
+
+    @staticmethod
+    def _read_lines_reversed(path: str, count: int,
+                             block_size: int = 65536) -> list:
+        """
+        Читает файл с конца и возвращает до count последних строк
+        записей (без заголовка) в обратном порядке.
+        """
+        if count <= 0 or not os.path.exists(path):
+            return []
+
+        lines = []
+        with open(path, "rb") as f:
+            position = f.seek(0, os.SEEK_END)
+            # Начало строки, конец которой уже прочитан в прошлых блоках
+            head = b""
+            seen_newline = False
+            while position > 0 and len(lines) < count:
+                step = min(block_size, position)
+                position -= step
+                f.seek(position)
+                parts = (f.read(step) + head).split(b"\n")
+                head = parts[0]
+                complete = parts[1:]
+                if not seen_newline:
+                    # Хвост после последнего перевода строки - недописанная
+                    # при падении строка, это не запись
+                    if len(parts) == 1:
+                        head = b""
+                        continue
+                    complete = complete[:-1]
+                    seen_newline = True
+                lines.extend(part for part in reversed(complete) if part)
+        # Когда файл дочитан до начала, в head остается заголовок
+
+        return [line.decode("utf-8") for line in lines[:count]]
+
+    def _read_records(self, path: str):
+        """Отдает записи файла, пропуская поврежденные строки."""
+        for line in self._read_lines(path):
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+    @staticmethod
+    def _repair_tail(path: str) -> None:
+        """Обрезает недописанную при падении последнюю строку журнала."""
+        with open(path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            data_start = max(0, size - 65536)
+            while True:
+                f.seek(data_start)
+                chunk = f.read(size - data_start)
+                newline = chunk.rfind(b"\n")
+                if newline != -1 or data_start == 0:
+                    break
+                data_start = max(0, data_start - 65536)
+            f.truncate(data_start + newline + 1)
+
+    @staticmethod
+    def _write_tmp(path: str, lines) -> str:
+        """Записывает строки во временный файл рядом с path и сбрасывает
+        его на диск. Возвращает путь временного файла."""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        return tmp_path
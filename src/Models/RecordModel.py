@@ -1,6 +1,6 @@
-import json
-import os
 from datetime import datetime
+from src.Models.Metrics import typing_accuracy, typing_speed
+from src.Models.RecordJournal import RecordJournal, HistorySummary
 from src.Models.SettingsModel import Language, Difficulty, Level
 
 
@@ -9,23 +9,71 @@ class RecordModel:
     Модель для хранения и управления историей результатов упражнений.
     """
 
-    def __init__(self):
-        self.records_file = "records.json"
-        self.records = self._load_records()
+    def __init__(self, records_file: str = "records.json"):
+        self.records_file = records_file
+        # Хранилище открывается при первой записи: до неё история
+        # читается из файлов как есть, а конструктор их не создает
+        self.storage = RecordJournal(records_file)
+        # История разбирается лениво: целиком - только по запросу
+        # всей истории, лучшие результаты - из сводки в заголовке
+        # снимка, последние записи - чтением хвоста файлов
+        self._records = None
+        self._summary = None
+        self._tail = None
+        self._tail_is_full = False
+
+    @property
+    def records(self) -> dict:
+        """
+        Вся история результатов. При первом обращении разбирает
+        снимок и журнал целиком.
+        Returns:
+            dict: Словарь с историей результатов
+        """
+        if self._records is None:
+            self._records = self._load_records()
+        return self._records
 
     def _load_records(self):
         """
-        Загружает историю результатов из файла.
+        Загружает историю результатов из снимка и журнала
+        и за один проход строит сводку с лучшими результатами.
         Returns:
             dict: Словарь с историей результатов
         """
-        if os.path.exists(self.records_file):
-            try:
-                with open(self.records_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return {"records": []}
-        return {"records": []}
+        records = self.storage.read_all()
+        if self._summary is None:
+            self._summary = HistorySummary()
+            for record in records:
+                self._summary.add(record)
+        return {"records": records}
+
+    @property
+    def summary(self) -> HistorySummary:
+        """
+        Сводка по истории с индексом лучших результатов.
+        Строится из заголовка снимка и записей журнала,
+        снимок целиком не разбирается.
+        """
+        if self._summary is None:
+            header, recent = self.storage.read_recent()
+            if "best" not in header:
+                # Снимок без сводки: строим её по всей истории
+                _ = self.records
+                return self._summary
+
+            self._summary = HistorySummary.from_header(header)
+            for record in recent:
+                self._summary.add(record)
+        return self._summary
+
+    @property
+    def best_records(self) -> dict:
+        """
+        Индекс лучших результатов: по ключу (язык, сложность, уровень)
+        лучшая запись вместе с её номером в истории.
+        """
+        return self.summary.best_records
 
     def save_record(self, language: Language, difficulty: Difficulty,
                     level: Level,
@@ -42,10 +90,30 @@ class RecordModel:
             correct_keystrokes: Количество корректных нажатий
             time_elapsed: Время выполнения упражнения в секундах
         """
-        accuracy = (correct_keystrokes /
-                    chars_typed) * 100 if chars_typed > 0 else 0
-        wpm = ((chars_typed / 5) /
-               (time_elapsed / 60)) if time_elapsed > 0 else 0
+        record = self.make_record(language, difficulty, level,
+                                  chars_typed, total_chars,
+                                  correct_keystrokes, time_elapsed)
+
+        if self._records is not None:
+            self._records["records"].append(record)
+        if self._summary is not None:
+            self._summary.add(record)
+        if self._tail is not None:
+            self._tail.append(record)
+        self.storage.append(record)
+
+    @staticmethod
+    def make_record(language: Language, difficulty: Difficulty,
+                    level: Level,
+                    chars_typed: int, total_chars: int,
+                    correct_keystrokes: int, time_elapsed: float) -> dict:
+        """
+        Собирает запись истории с рассчитанными точностью и WPM.
+        Returns:
+            dict: Запись истории
+        """
+        accuracy = typing_accuracy(correct_keystrokes, chars_typed)
+        wpm = typing_speed(chars_typed, time_elapsed)
 
         record = {
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -60,16 +128,13 @@ class RecordModel:
             "time_elapsed": round(time_elapsed, 2),
             "completed": chars_typed >= total_chars
         }
+        return record
 
-        self.records["records"].append(record)
-        self._save_to_file()
-
-    def _save_to_file(self):
+    def close(self):
         """
-        Сохраняет историю результатов в файл.
+        Дожидается фонового сжатия истории и закрывает журнал.
         """
-        with open(self.records_file, "w", encoding="utf-8") as f:
-            json.dump(self.records, f, indent=4, ensure_ascii=False)
+        self.storage.close()
 
     def get_last_records(self, count=5):
         """
@@ -79,9 +144,20 @@ class RecordModel:
         Returns:
             list: Список последних записей
         """
+        if self._records is not None or not self.summary.ordered:
+            records = self.records["records"]
+        else:
+            # Записи идут по возрастанию времени, поэтому последние
+            # берутся из хвоста файлов без разбора всей истории
+            if self._tail is None or (len(self._tail) < count and
+                                      not self._tail_is_full):
+                self._tail = self.storage.read_tail(count)
+                self._tail_is_full = len(self._tail) < count
+            records = self._tail
+
         # Сортируем записи по дате (самые новые в конце)
         sorted_records = sorted(
-            self.records["records"],
+            records,
             key=lambda r: r["timestamp"]
         )
 
@@ -98,16 +174,19 @@ class RecordModel:
         Returns:
             dict: Лучший результат
         """
-        rec = self.records["records"]
+        if language and difficulty and level:
+            best = self.best_records.get(
+                (language.name, difficulty.name, f"Level {level.value}"))
+            return best[1] if best is not None else None
 
-        if language:
-            rec = [r for r in rec if r["language"] == language.name]
-        if difficulty:
-            rec = [r for r in rec if r["difficulty"] == difficulty.name]
-        if level:
-            rec = [r for r in rec if r["level"] == f"Level {level.value}"]
+        # Без части фильтров выбираем среди лучших результатов
+        # каждой группы; при равенстве WPM побеждает более ранняя запись
+        rec = [best for (lang, diff, lvl), best in self.best_records.items()
+               if (not language or lang == language.name) and
+               (not difficulty or diff == difficulty.name) and
+               (not level or lvl == f"Level {level.value}")]
 
         if not rec:
             return None
 
-        return max(rec, key=lambda x: x["wpm"])
+        return max(rec, key=lambda x: (x[1]["wpm"], -x[0]))[1]
@@ -0,0 +1,278 @@
+import hashlib
+import os
+import time
+import zlib
+
+from src.Models.KeystrokeLog import KeystrokeLogView
+from src.Models.SettingsModel import Difficulty, Language, Level
+
+# Формат файла записи сессии:
+#   MAGIC, версия (1 байт), флаги (1 байт, FLAG_ZLIB - тело сжато);
+#   varint: язык, сложность, уровень, длина текста в символах,
+#       длительность упражнения в секундах, время начала (unix, с),
+#       число нажатий, позиция первого нажатия;
+#   HASH_SIZE байт: BLAKE2b текста упражнения в UTF-8;
+#   тело: на каждое нажатие два varint - разница времени с предыдущим
+#       нажатием в микросекундах (zigzag) и код клавиши << 1 | верно.
+# Позиции не хранятся: курсор сдвигается на одну позицию за нажатие.
+MAGIC = b"TREC"
+VERSION = 1
+FLAG_ZLIB = 1
+HASH_SIZE = 16
+# Размер блока при чтении тела записи
+READ_CHUNK = 64 * 1024
+
+
+class SessionHeader:
+    """
+    Заголовок записи сессии: какое упражнение набиралось и сколько
+    в записи нажатий.
+    """
+
+    def __init__(self, language: Language, difficulty: Difficulty,
+                 level: Level, text_hash: bytes, text_length: int,
+                 exercise_seconds: int, events: int,
+                 started_at: int = None, first_position: int = 0,
+                 compressed: bool = True):
+        self.language = language
+        self.difficulty = difficulty
+        self.level = level
+        self.text_hash = text_hash
+        self.text_length = text_length
+        self.exercise_seconds = exercise_seconds
+        self.events = events
+        self.started_at = int(time.time()) \
+            if started_at is None else started_at
+        self.first_position = first_position
+        self.compressed = compressed
+
+    def to_bytes(self) -> bytes:
+        """Кодирует заголовок."""
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        out.append(FLAG_ZLIB if self.compressed else 0)
+        for value in (self.language.value, self.difficulty.value,
+                      self.level.value, self.text_length,
+                      self.exercise_seconds, self.started_at, self.events,
+                      self.first_position):
+            _write_varint(out, value)
+        out += self.text_hash
+        return bytes(out)
+
+    @classmethod
+    def read(cls, f) -> "SessionHeader":
+        """
+        Читает заголовок из начала открытого файла записи.
+        Raises:
+            ValueError: если файл не запись сессии или версия неизвестна
+        """
+        prefix = f.read(len(MAGIC) + 2)
+        if prefix[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a session recording")
+        if prefix[len(MAGIC)] != VERSION:
+            raise ValueError(
+                f"Unsupported session recording version {prefix[4]}")
+        values = [_read_varint(f) for _ in range(8)]
+        text_hash = f.read(HASH_SIZE)
+        return cls(Language(values[0]), Difficulty(values[1]),
+                   Level(values[2]), text_hash, values[3], values[4],
+                   values[6], values[5], values[7],
+                   bool(prefix[len(MAGIC) + 1] & FLAG_ZLIB))
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Дописывает неотрицательное число в формате varint (LEB128)."""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(f) -> int:
+    """Читает varint из файла побайтно (для заголовка)."""
+    value = shift = 0
+    while True:
+        byte = f.read(1)
+        if not byte:
+            raise ValueError("Truncated session recording header")
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+def text_hash(chunks) -> tuple[bytes, int]:
+    """
+    Хэш текста упражнения, который можно считать по частям.
+    Args:
+        chunks: Текст или итератор его частей
+    Returns:
+        tuple: (хэш BLAKE2b в HASH_SIZE байт, длина текста в символах)
+    """
+    if isinstance(chunks, str):
+        chunks = (chunks,)
+    digest = hashlib.blake2b(digest_size=HASH_SIZE)
+    length = 0
+    for chunk in chunks:
+        digest.update(chunk.encode("utf-8"))
+        length += len(chunk)
+    return digest.digest(), length
+
+
+def encode_events(log: KeystrokeLogView) -> bytearray:
+    """
+    Кодирует нажатия журнала в тело записи (без сжатия).
+    Время округляется до микросекунд от первого нажатия, так что
+    ошибка округления не накапливается.
+    """
+    out = bytearray()
+    with log.timestamps() as timestamps, log.keys() as keys, \
+            log.correct() as correct:
+        if not len(timestamps):
+            return out
+        start = timestamps[0]
+        previous = 0
+        for timestamp_ns, key, is_correct in zip(timestamps, keys, correct):
+            moment = (timestamp_ns - start + 500) // 1000
+            delta = moment - previous
+            previous = moment
+            _write_varint(out, delta << 1 if delta >= 0 else
+                          (-delta << 1) - 1)
+            _write_varint(out, key << 1 | is_correct)
+    return out
+
+
+def write_session(path: str, header: SessionHeader,
+                  log: KeystrokeLogView) -> int:
+    """
+    Записывает сессию в файл.
+    Args:
+        path: Путь к файлу записи
+        header: Заголовок (events и first_position берутся из журнала)
+        log: Журнал нажатий сессии
+    Returns:
+        int: Размер файла в байтах
+    """
+    header.events = len(log)
+    if len(log):
+        header.first_position = log[0][1]
+    body = encode_events(log)
+    if header.compressed:
+        body = zlib.compress(body, 9)
+    data = header.to_bytes() + body
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def read_header(path: str) -> SessionHeader:
+    """Читает только заголовок записи сессии."""
+    with open(path, "rb") as f:
+        return SessionHeader.read(f)
+
+
+def _read_body(f, compressed: bool, chunk_size: int):
+    """Отдает тело записи блоками, распаковывая их на ходу."""
+    decompressor = zlib.decompressobj() if compressed else None
+    while chunk := f.read(chunk_size):
+        yield decompressor.decompress(chunk) \
+            if decompressor is not None else chunk
+    if decompressor is not None:
+        yield decompressor.flush()
+
+
+def iter_events(path: str, chunk_size: int = READ_CHUNK):
+    """
+    Отдает нажатия записи по одному, читая файл блоками, так что
+    память не зависит от длины записи.
+    Args:
+        path: Путь к файлу записи
+        chunk_size: Размер блока чтения
+    Returns:
+        Итератор кортежей (время от первого нажатия в нс, позиция,
+            символ, корректность)
+    """
+    with open(path, "rb") as f:
+        header = SessionHeader.read(f)
+        position = header.first_position
+        moment = 0
+        is_time = True
+        value = shift = 0
+        for chunk in _read_body(f, header.compressed, chunk_size):
+            for byte in chunk:
+                value |= (byte & 0x7F) << shift
+                if byte & 0x80:
+                    shift += 7
+                    continue
+                if is_time:
+                    moment += value >> 1 if not value & 1 \
+                        else -((value + 1) >> 1)
+                else:
+                    yield (moment * 1000, position, chr(value >> 1),
+                           bool(value & 1))
+                    position += 1
+                is_time = not is_time
+                value = shift = 0
+
+
+class SessionStore:
+    """
+    Каталог записей сессий: по файлу на каждое упражнение.
+    """
+
+    EXTENSION = ".trec"
+
+    def __init__(self, directory: str = "sessions",
+                 compress: bool = True):
+        """
+        Args:
+            directory: Каталог записей
+            compress: Сжимать тело записей zlib
+        """
+        self.directory = directory
+        self.compress = compress
+
+    def save(self, language: Language, difficulty: Difficulty,
+             level: Level, text_chunks, log: KeystrokeLogView,
+             exercise_seconds: int) -> str:
+        """
+        Сохраняет запись сессии.
+
+        Args:
+            language: Язык упражнения
+            difficulty: Сложность упражнения
+            level: Уровень упражнения
+            text_chunks: Текст упражнения или итератор его частей
+                (для хэша и длины)
+            log: Журнал нажатий сессии
+            exercise_seconds: Длительность упражнения
+
+        Returns:
+            str: Путь к файлу записи
+        """
+        digest, length = text_hash(text_chunks)
+        header = SessionHeader(language, difficulty, level, digest, length,
+                               int(exercise_seconds), len(log),
+                               compressed=self.compress)
+        os.makedirs(self.directory, exist_ok=True)
+        stem = os.path.join(
+            self.directory,
+            time.strftime("%Y%m%d-%H%M%S", time.localtime(header.started_at))
+            + f"-{language.name}-{difficulty.name}-{level.name}")
+        path = stem + self.EXTENSION
+        # Несколько упражнений за одну секунду не затирают друг друга.
+        # Номер с нулями, чтобы записи сортировались по имени по порядку
+        number = 1
+        while os.path.exists(path):
+            path = f"{stem}~{number:03d}{self.EXTENSION}"
+            number += 1
+        write_session(path, header, log)
+        return path
+
+    def list_sessions(self) -> list:
+        """Пути записей от старых к новым."""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(os.path.join(self.directory, name)
+                      for name in os.listdir(self.directory)
+                      if name.endswith(self.EXTENSION))
@@ -23,6 +23,9 @@ class Level(enum.Enum):
     big_text = 5
 
 
+# Уровни, из которых турнир выбирает текст очередного матча
+RANDOM_LEVELS = (Level.l1, Level.l5)
+
 WELCOME_HEADER = "Добро пожаловать в клавиатурный тренажер"
 LANGUAGE_HEADER = "Выберете язык, на котором вы хотите писать"
 DIFFICULTY_HEADER = "Выберете сложность"
@@ -40,7 +43,7 @@ class SettingsModel:
 
     def set_random_level(self):
         """Устанавливает случайный уровень."""
-        level = random.choice([Level.l1, Level.l5])
+        level = random.choice(RANDOM_LEVELS)
         self.current_level = level
 
     def set_big_text_level(self):
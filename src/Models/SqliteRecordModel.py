@@ -0,0 +1,158 @@
+import sqlite3
+
+from src.Models.RecordJournal import RecordJournal
+from src.Models.RecordModel import RecordModel
+from src.Models.SettingsModel import Language, Difficulty, Level
+
+COLUMNS = ("timestamp", "language", "difficulty", "level", "chars_typed",
+           "total_chars", "correct_keystrokes", "accuracy", "wpm",
+           "time_elapsed", "completed")
+
+
+class SqliteRecordModel:
+    """
+    Модель истории результатов упражнений в базе SQLite.
+    Повторяет интерфейс RecordModel, но лучший результат и последние
+    записи достаются по индексам, без просмотра всей истории.
+    """
+
+    def __init__(self, db_file: str = "records.sqlite3",
+                 records_file: str = "records.json"):
+        """
+        Args:
+            db_file: Файл базы данных
+            records_file: История в формате JSON, которая переносится
+                в пустую базу при первом запуске
+        """
+        self.db_file = db_file
+        self.connection = sqlite3.connect(db_file)
+        self.connection.row_factory = sqlite3.Row
+        self._create_schema()
+
+        # История читается как есть, без открытия журнала: переносить
+        # records.json в снимок ради разового импорта незачем
+        journal = RecordJournal(records_file)
+        if self._is_empty() and journal.exists():
+            self.import_records(journal.read_all())
+
+    def _create_schema(self):
+        """
+        Создает таблицу истории и индексы.
+        """
+        with self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                "id INTEGER PRIMARY KEY, "
+                "timestamp TEXT NOT NULL, language TEXT NOT NULL, "
+                "difficulty TEXT NOT NULL, level TEXT NOT NULL, "
+                "chars_typed INTEGER, total_chars INTEGER, "
+                "correct_keystrokes INTEGER, accuracy REAL, wpm REAL, "
+                "time_elapsed REAL, completed INTEGER)")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS records_best ON records "
+                "(language, difficulty, level, wpm)")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS records_timestamp ON records "
+                "(timestamp)")
+
+    def _is_empty(self) -> bool:
+        """Проверяет, есть ли в базе записи."""
+        return self.connection.execute(
+            "SELECT 1 FROM records LIMIT 1").fetchone() is None
+
+    def import_records(self, records: list):
+        """
+        Добавляет в базу записи истории одной транзакцией.
+        Args:
+            records: Список записей в формате RecordModel
+        """
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO records ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(COLUMNS))})",
+                (tuple(record[column] for column in COLUMNS)
+                 for record in records))
+
+    @property
+    def records(self) -> dict:
+        """
+        Вся история результатов в формате RecordModel.
+        """
+        rows = self.connection.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM records ORDER BY id")
+        return {"records": [self._to_record(row) for row in rows]}
+
+    def save_record(self, language: Language, difficulty: Difficulty,
+                    level: Level,
+                    chars_typed: int, total_chars: int,
+                    correct_keystrokes: int, time_elapsed: float):
+        """
+        Сохраняет результат упражнения в историю.
+        Args:
+            language: Язык упражнения
+            difficulty: Сложность упражнения
+            level: Уровень упражнения
+            chars_typed: Количество введенных символов
+            total_chars: Общее количество символов в упражнении
+            correct_keystrokes: Количество корректных нажатий
+            time_elapsed: Время выполнения упражнения в секундах
+        """
+        record = RecordModel.make_record(language, difficulty, level,
+                                         chars_typed, total_chars,
+                                         correct_keystrokes, time_elapsed)
+        self.import_records([record])
+
+    def close(self):
+        """
+        Закрывает соединение с базой.
+        """
+        self.connection.close()
+
+    def get_last_records(self, count=5):
+        """
+        Возвращает последние records из истории.
+        Args:
+            count: Количество записей для возврата
+        Returns:
+            list: Список последних записей
+        """
+        rows = self.connection.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM records "
+            "ORDER BY timestamp DESC, id DESC LIMIT ?", (count,))
+        return [self._to_record(row) for row in reversed(rows.fetchall())]
+
+    def get_best_record(self, language=None, difficulty=None, level=None):
+        """
+        Возвращает лучший результат по WPM для указанных параметров.
+        Args:
+            language: Фильтр по языку
+            difficulty: Фильтр по сложности
+            level: Фильтр по уровню
+        Returns:
+            dict: Лучший результат
+        """
+        conditions = []
+        params = []
+        if language:
+            conditions.append("language = ?")
+            params.append(language.name)
+        if difficulty:
+            conditions.append("difficulty = ?")
+            params.append(difficulty.name)
+        if level:
+            conditions.append("level = ?")
+            params.append(f"Level {level.value}")
+
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        row = self.connection.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM records {where}"
+            "ORDER BY wpm DESC, id ASC LIMIT 1", params).fetchone()
+        return self._to_record(row) if row is not None else None
+
+    @staticmethod
+    def _to_record(row: sqlite3.Row) -> dict:
+        """Переводит строку таблицы в запись формата RecordModel."""
+        record = dict(zip(COLUMNS, row))
+        record["completed"] = bool(record["completed"])
+        return record
@@ -0,0 +1,70 @@
+import random
+
+
+class TypistProfile:
+    """
+    Синтетический наборщик: средняя скорость, доля правильных
+    нажатий и разброс интервалов между нажатиями.
+    """
+
+    def __init__(self, wpm: float = 60.0, accuracy: float = 0.95,
+                 jitter: float = 0.3):
+        """
+        Args:
+            wpm: Средняя скорость в словах в минуту
+            accuracy: Доля правильных нажатий от 0 до 1
+            jitter: Разброс интервала относительно среднего
+        """
+        self.wpm = wpm
+        self.accuracy = accuracy
+        self.jitter = jitter
+
+    def keys(self, text, seconds: float, rng: random.Random):
+        """
+        Порождает нажатия для текста, укладывающиеся в seconds секунд.
+        Args:
+            text: Текст упражнения (строка или итератор символов)
+            seconds: Длительность упражнения
+            rng: Генератор случайных чисел
+        Returns:
+            Итератор событий сценария (задержка, код клавиши)
+        """
+        mean = 60 / (self.wpm * 5)
+        elapsed = 0.0
+        for char in text:
+            delay = mean * rng.uniform(1 - self.jitter, 1 + self.jitter)
+            elapsed += delay
+            # Нажатие позже конца упражнения досталось бы следующему экрану
+            if elapsed >= seconds - 0.001:
+                return
+            if rng.random() >= self.accuracy:
+                char = "#" if char != "#" else "$"
+            yield delay, ord(char)
+
+
+class ProfileDistribution:
+    """
+    Распределение синтетических наборщиков: скорость, точность
+    и разброс интервалов берутся из нормальных распределений,
+    заданных парами (среднее, стандартное отклонение).
+    """
+
+    def __init__(self, wpm: tuple = (60.0, 20.0),
+                 accuracy: tuple = (0.93, 0.04),
+                 jitter: tuple = (0.3, 0.1)):
+        """
+        Args:
+            wpm: Скорость в словах в минуту
+            accuracy: Доля правильных нажатий
+            jitter: Разброс интервала относительно среднего
+        """
+        self.wpm = wpm
+        self.accuracy = accuracy
+        self.jitter = jitter
+
+    def sample(self, rng: random.Random) -> TypistProfile:
+        """Новый наборщик из распределения (значения в допустимых границах)."""
+        return TypistProfile(
+            wpm=max(5.0, rng.gauss(*self.wpm)),
+            accuracy=min(1.0, max(0.0, rng.gauss(*self.accuracy))),
+            jitter=min(0.9, max(0.0, rng.gauss(*self.jitter))))
@@ -0,0 +1,31 @@
+def match_winner(gamer1, result1: dict, gamer2, result2: dict):
+    """
+    Победитель матча: больше правильных нажатий, при равенстве -
+    выше равномерность, при полном равенстве - второй игрок.
+    :param gamer1: первый игрок
+    :param result1: результат упражнения первого игрока
+    :param gamer2: второй игрок
+    :param result2: результат упражнения второго игрока
+    :return: победивший игрок
+    """
+    if result1['correct_keystrokes'] > result2['correct_keystrokes']:
+        return gamer1
+    if result1['correct_keystrokes'] < result2['correct_keystrokes']:
+        return gamer2
+    if result1['uniformity_score'] > result2['uniformity_score']:
+        return gamer1
+    return gamer2
+
+
+def update_best_result(best_results: dict, gamer, result: dict) -> None:
+    """
+    Запоминает результат игрока, если он лучший за турнир
+    по числу правильных нажатий.
+    :param best_results: лучшие результаты по игрокам
+    :param gamer: игрок
+    :param result: результат упражнения
+    """
+    best = best_results.get(gamer)
+    if not best or (result['correct_keystrokes'] >
+                    best['correct_keystrokes']):
+        best_results[gamer] = result
@@ -0,0 +1,87 @@
+import json
+
+from src.Models.ExerciseModel import ExerciseModel
+from src.Models.SessionRecording import text_hash
+from src.Models.SettingsModel import Difficulty, Language, Level
+
+# Протокол сетевого турнира: по TCP в обе стороны ходят сообщения
+# JSON, по одному в строке, у каждого есть поле "type".
+#
+# Клиент -> сервер:
+#   join {name} - подключиться к турниру под именем;
+#   result {round, result} - результат упражнения (метрики compute_metrics);
+#   error {message} - клиент не может сыграть матч (например, другой
+#       текст упражнения), матч засчитывается как поражение.
+# Сервер -> клиент:
+#   joined {name, players, expected} - игрок принят, сколько уже есть;
+#   match {round, opponent, language, difficulty, level, seconds,
+#       text_hash} - сыграть упражнение тура, текст у всех матчей тура
+#       один, клиент загружает его сам и сверяет хэш;
+#   match_result {round, winner, result, opponent_result};
+#   wait {round} - в этом туре игрок отдыхает или выбыл;
+#   standings {round, rows} - таблица очков (швейцарка и круговой);
+#   finished {winner} - турнир окончен;
+#   error {message} - игрок не принят, соединение закрывается.
+DEFAULT_PORT = 7878
+# Ограничение длины строки сообщения, защищает сервер от мусора
+MAX_LINE = 64 * 1024
+# Результат неявившегося игрока
+FORFEIT = {"correct_keystrokes": 0, "uniformity_score": 0}
+
+
+def encode(message: dict) -> bytes:
+    """Сообщение в виде строки JSON с переводом строки."""
+    return json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+async def read_message(reader):
+    """
+    Читает одно сообщение.
+    Args:
+        reader: asyncio.StreamReader соединения
+    Returns:
+        dict: Сообщение или None, если соединение закрыто или
+            прислана строка, которая не является объектом JSON
+    """
+    try:
+        line = await reader.readline()
+    except (ConnectionError, ValueError):
+        return None
+    if not line:
+        return None
+    try:
+        message = json.loads(line)
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    return message if isinstance(message, dict) else None
+
+
+async def send_message(writer, message: dict) -> bool:
+    """
+    Отправляет сообщение и ждет, пока буфер не разгрузится.
+    Returns:
+        bool: False, если соединение уже разорвано
+    """
+    try:
+        writer.write(encode(message))
+        await writer.drain()
+        return True
+    except ConnectionError:
+        return False
+
+
+def exercise_hash(language: Language, difficulty: Difficulty,
+                  level: Level) -> str:
+    """Хэш текста упражнения для сверки сервера и клиента."""
+    model = ExerciseModel(difficulty, level, language)
+    digest, _ = text_hash(model.iter_exercise_text())
+    return digest.hex()
+
+
+def match_result_valid(result) -> bool:
+    """Результат от клиента содержит числа, по которым судится матч."""
+    return isinstance(result, dict) and all(
+        isinstance(result.get(field), (int, float))
+        and not isinstance(result.get(field), bool)
+        and result[field] >= 0
+        for field in FORFEIT)
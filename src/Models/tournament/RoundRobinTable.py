@@ -0,0 +1,99 @@
+from src.Models.SettingsModel import SettingsModel
+from src.Models.tournament.Standings import Standings
+
+# Место для пропуска при нечетном числе игроков
+BYE = -1
+
+
+class RoundRobinTable:
+    """
+    Круговой турнир: каждый играет с каждым по одному разу.
+    Расписание строится методом круга: первый игрок стоит на месте,
+    остальные сдвигаются на одно место каждый тур, место i играет
+    с местом m - 1 - i. Тур вычисляется за O(n) без хранения всего
+    расписания, при нечетном числе игроков один в туре отдыхает.
+    Победитель - лидер таблицы очков после всех туров.
+    Интерфейс совпадает с TournamentTable: rounds, round_matches,
+    set_winner, winner.
+    """
+
+    def __init__(self, gamers: list, settings: SettingsModel,
+                 big_text: bool):
+        """
+        :param gamers: игроки
+        :param settings: настройки турнира
+        :param big_text: играть большой текст
+        """
+        self.gamers = list(gamers)
+        self.standings = Standings(self.gamers)
+        self._index = {gamer: index
+                       for index, gamer in enumerate(self.gamers)}
+        # Мест в круге всегда четное число
+        self.places = len(self.gamers) + len(self.gamers) % 2
+        self.rounds = self.places - 1 if len(self.gamers) > 1 else 0
+        self.byes = self.rounds if len(self.gamers) % 2 else 0
+        self._played = set()
+        if big_text:
+            settings.set_big_text_level()
+        else:
+            settings.set_random_level()
+
+    def _at(self, round_number: int, place: int) -> int:
+        """Номер игрока на месте place в туре round_number или BYE."""
+        if place:
+            place = (place - 1 + round_number - 1) % (self.places - 1) + 1
+        return place if place < len(self.gamers) else BYE
+
+    def _pair(self, match: int) -> tuple:
+        """Пара номеров игроков матча (номера матчей идут по турам)."""
+        round_number, position = divmod(match, self.places // 2)
+        return (self._at(round_number + 1, position),
+                self._at(round_number + 1, self.places - 1 - position))
+
+    def round_matches(self, round_number: int) -> list:
+        """
+        Несыгранные матчи тура (отдыхающий игрок в них не попадает).
+        :param round_number: номер тура, с 1
+        :return: список (номер матча, игрок 1, игрок 2)
+        """
+        if not 1 <= round_number <= self.rounds:
+            return []
+        half = self.places // 2
+        matches = []
+        for match in range((round_number - 1) * half, round_number * half):
+            first, second = self._pair(match)
+            if BYE not in (first, second) and match not in self._played:
+                matches.append((match, self.gamers[first],
+                                self.gamers[second]))
+        return matches
+
+    def set_winner(self, match: int, gamer) -> None:
+        """
+        Записывает победителя матча и сразу обновляет таблицу очков.
+        :param match: номер матча
+        :param gamer: победитель
+        """
+        index = self._index.get(gamer)
+        if not 0 <= match < self.rounds * (self.places // 2) \
+                or match in self._played:
+            raise ValueError(f"{gamer} does not play match {match}")
+        first, second = self._pair(match)
+        if index is None or index not in (first, second) \
+                or BYE in (first, second):
+            raise ValueError(f"{gamer} does not play match {match}")
+        self._played.add(match)
+        self.standings.record_match(index,
+                                    second if index == first else first)
+
+    @property
+    def finished(self) -> bool:
+        """Сыграны все матчи."""
+        return len(self._played) == \
+            len(self.gamers) * (len(self.gamers) - 1) // 2
+
+    @property
+    def winner(self):
+        """Победитель турнира или None, пока не сыграны все матчи."""
+        if not self.finished or not self.gamers:
+            return None
+        return self.gamers[self.standings.ranking()[0]]
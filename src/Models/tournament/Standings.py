@@ -0,0 +1,99 @@
+from array import array
+
+
+class Standings:
+    """
+    Турнирная таблица очков для швейцарской и круговой систем.
+    Обновляется после каждого матча за O(1): у игрока растут очки,
+    и он переходит в группу со следующим счетом. Игроки хранятся
+    по номерам в списке gamers, группы - множества номеров по очкам.
+    Противники каждого игрока - индекс для запрета повторных встреч
+    и для дополнительного показателя Бухгольца.
+    """
+
+    def __init__(self, gamers: list):
+        self.gamers = list(gamers)
+        count = len(self.gamers)
+        self.points = array("i", [0]) * count
+        self.wins = array("i", [0]) * count
+        self.losses = array("i", [0]) * count
+        self.byes = array("i", [0]) * count
+        self.opponents = [set() for _ in range(count)]
+        self.groups = {0: set(range(count))} if count else {}
+        self.top_score = 0
+
+    def _add_point(self, index: int) -> None:
+        """Переводит игрока в группу со счетом на очко больше."""
+        score = self.points[index]
+        group = self.groups[score]
+        group.discard(index)
+        if not group:
+            del self.groups[score]
+        self.points[index] = score + 1
+        self.groups.setdefault(score + 1, set()).add(index)
+        if score + 1 > self.top_score:
+            self.top_score = score + 1
+
+    def record_match(self, winner: int, loser: int) -> None:
+        """
+        Записывает результат матча.
+        :param winner: номер победителя
+        :param loser: номер проигравшего
+        """
+        self.wins[winner] += 1
+        self.losses[loser] += 1
+        self.opponents[winner].add(loser)
+        self.opponents[loser].add(winner)
+        self._add_point(winner)
+
+    def record_bye(self, index: int, points: int = 1) -> None:
+        """
+        Записывает пропуск тура.
+        :param index: номер игрока без пары
+        :param points: очки за пропуск
+        """
+        self.byes[index] += 1
+        for _ in range(points):
+            self._add_point(index)
+
+    def have_played(self, first: int, second: int) -> bool:
+        """Встречались ли игроки."""
+        return second in self.opponents[first]
+
+    def buchholz(self, index: int) -> int:
+        """Сумма очков соперников игрока."""
+        return sum(self.points[opponent]
+                   for opponent in self.opponents[index])
+
+    def leaders(self) -> list:
+        """Игроки с наибольшим счетом, в порядке регистрации."""
+        if not self.groups:
+            return []
+        return [self.gamers[index]
+                for index in sorted(self.groups[self.top_score])]
+
+    def ranking(self) -> list:
+        """
+        Номера игроков по местам: больше очков, при равенстве выше
+        Бухгольц, затем раньше регистрация. Группы уже упорядочены
+        по очкам, поэтому сортируются только игроки внутри группы.
+        """
+        ranking = []
+        for score in sorted(self.groups, reverse=True):
+            ranking.extend(sorted(self.groups[score],
+                                  key=lambda index: (-self.buchholz(index),
+                                                     index)))
+        return ranking
+
+    def table(self, limit: int = None) -> list:
+        """
+        Строки таблицы для показа.
+        :param limit: сколько первых мест вернуть (None - все)
+        :return: список (место, игрок, очки, победы, поражения, Бухгольц)
+        """
+        rows = []
+        for place, index in enumerate(self.ranking()[:limit], 1):
+            rows.append((place, self.gamers[index], self.points[index],
+                         self.wins[index], self.losses[index],
+                         self.buchholz(index)))
+        return rows
@@ -0,0 +1,185 @@
+import heapq
+
+from src.Models.SettingsModel import SettingsModel
+from src.Models.tournament.Standings import Standings
+
+# Сколько последних пар можно пересобрать, чтобы не сводить
+# игроков повторно, когда свободные соперники остались только знакомые
+SWAP_DEPTH = 8
+
+
+class SwissTable:
+    """
+    Турнир по швейцарской системе: все играют все туры, в каждом туре
+    пары составляются из игроков с близким счетом, повторные встречи
+    не допускаются. Победитель - лидер таблицы после последнего тура.
+
+    Пары тура строятся жадно по куче игроков, упорядоченной по очкам:
+    лучший свободный игрок получает лучшего свободного соперника,
+    с которым еще не играл (проверка по индексу соперников за O(1)).
+    Тур стоит O(n log n) вместо перебора всех пар.
+    Интерфейс совпадает с TournamentTable: rounds, round_matches,
+    set_winner, winner.
+    """
+
+    def __init__(self, gamers: list, settings: SettingsModel,
+                 big_text: bool, rounds: int = None):
+        """
+        :param gamers: игроки
+        :param settings: настройки турнира
+        :param big_text: играть большой текст
+        :param rounds: число туров (по умолчанию как у сетки на
+            выбывание - столько, чтобы выявить единственного лидера)
+        """
+        self.gamers = list(gamers)
+        self.standings = Standings(self.gamers)
+        self._index = {gamer: index
+                       for index, gamer in enumerate(self.gamers)}
+        if rounds is None:
+            rounds = (len(self.gamers) - 1).bit_length()
+        self.rounds = rounds
+        self.byes = 0
+        self.rematches = 0
+        self.paired_round = 0
+        # Несыгранные матчи текущего тура: номер матча -> пара номеров
+        self._pending = {}
+        self._next_match = 0
+        if big_text:
+            settings.set_big_text_level()
+        else:
+            settings.set_random_level()
+
+    def round_matches(self, round_number: int) -> list:
+        """
+        Матчи тура, которые можно играть. Пары следующего тура
+        составляются при первом запросе, когда сыграны все матчи
+        предыдущего.
+        :param round_number: номер тура, с 1
+        :return: список (номер матча, игрок 1, игрок 2)
+        """
+        if round_number == self.paired_round + 1 and not self._pending \
+                and round_number <= self.rounds:
+            self._pair_round()
+        elif round_number != self.paired_round:
+            raise ValueError(f"Round {round_number} cannot be paired "
+                             f"before round {self.paired_round} is over")
+        return [(match, self.gamers[first], self.gamers[second])
+                for match, (first, second) in self._pending.items()]
+
+    def _pair_round(self) -> None:
+        """Составляет пары следующего тура."""
+        self.paired_round += 1
+        standings = self.standings
+        count = len(self.gamers)
+        paired = bytearray(count)
+
+        if count % 2:
+            bye = self._bye_candidate()
+            paired[bye] = 1
+            standings.record_bye(bye)
+            self.byes += 1
+
+        # Ключ кучи - одно число: меньше у большего счета, при равенстве
+        # у раньше зарегистрированного. Номер игрока - остаток от деления
+        top = standings.top_score
+        heap = [(top - standings.points[index]) * count + index
+                for index in range(count) if not paired[index]]
+        heapq.heapify(heap)
+        pairs = []
+        while heap:
+            first = heapq.heappop(heap) % count
+            if paired[first]:
+                continue
+            skipped = []
+            second = None
+            while heap:
+                key = heapq.heappop(heap)
+                candidate = key % count
+                if paired[candidate]:
+                    continue
+                if standings.have_played(first, candidate):
+                    skipped.append(key)
+                    continue
+                second = candidate
+                break
+            if second is None:
+                if not skipped:
+                    break
+                pair = self._swap_pair(pairs, first,
+                                       [key % count for key in skipped])
+                second = pair[1]
+            else:
+                pair = (first, second)
+            for key in skipped:
+                if key % count != second:
+                    heapq.heappush(heap, key)
+            paired[first] = paired[second] = 1
+            pairs.append(pair)
+
+        for pair in pairs:
+            self._pending[self._next_match] = pair
+            self._next_match += 1
+
+    def _bye_candidate(self) -> int:
+        """
+        Игрок без пары: с наименьшим счетом среди тех, кто еще не
+        пропускал тур, при равенстве - зарегистрированный позже.
+        Если пропускали все, пропускает последний в таблице.
+        """
+        heap = [(self.standings.points[index], -index)
+                for index in range(len(self.gamers))]
+        heapq.heapify(heap)
+        last = -heap[0][1]
+        while heap:
+            _, index = heapq.heappop(heap)
+            if not self.standings.byes[-index]:
+                return -index
+        return last
+
+    def _swap_pair(self, pairs: list, first: int, known: list) -> tuple:
+        """
+        У игрока first остались только знакомые свободные соперники
+        known. Ищет среди последних пар (a, b) такую, что first может
+        сыграть с a, а знакомый соперник - с b: тогда first встает
+        в пару вместо b. Если такой пары нет, first играет повторно
+        с лучшим из known.
+        :return: новая пара, второй в ней - соперник из known
+        """
+        standings = self.standings
+        for position in range(len(pairs) - 1,
+                              max(-1, len(pairs) - 1 - SWAP_DEPTH), -1):
+            for a, b in (pairs[position], pairs[position][::-1]):
+                if standings.have_played(first, a):
+                    continue
+                for other in known:
+                    if not standings.have_played(b, other):
+                        pairs[position] = (a, first)
+                        return b, other
+        self.rematches += 1
+        return first, known[0]
+
+    def set_winner(self, match: int, gamer) -> None:
+        """
+        Записывает победителя матча и сразу обновляет таблицу очков.
+        :param match: номер матча
+        :param gamer: победитель
+        """
+        pair = self._pending.get(match)
+        index = self._index.get(gamer)
+        if pair is None or index not in pair:
+            raise ValueError(f"{gamer} does not play match {match}")
+        del self._pending[match]
+        loser = pair[1] if pair[0] == index else pair[0]
+        self.standings.record_match(index, loser)
+
+    @property
+    def finished(self) -> bool:
+        """Сыграны все туры."""
+        return self.paired_round == self.rounds and not self._pending
+
+    @property
+    def winner(self):
+        """Победитель турнира или None, пока не сыграны все туры."""
+        if not self.finished or not self.gamers:
+            return None
+        return self.gamers[self.standings.ranking()[0]]
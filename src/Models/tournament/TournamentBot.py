@@ -0,0 +1,57 @@
+import asyncio
+import random
+
+from src.Models.ExerciseModel import ExerciseModel
+from src.Models.GameModel import GameModel
+from src.Models.SettingsModel import Difficulty, Language, Level
+from src.Models.TypistProfile import TypistProfile
+from src.Models.tournament.Protocol import DEFAULT_PORT, MAX_LINE, \
+    read_message, send_message
+from src.Models.tournament.TournamentSimulator import simulate_exercise
+
+
+async def play_bot(name: str, profile: TypistProfile = None,
+                   host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                   seed: int = 0, time_scale: float = 1.0):
+    """
+    Синтетический игрок сетевого турнира: подключается к серверу
+    как обычный клиент и играет матчи по профилю наборщика.
+    Args:
+        name: Имя игрока
+        profile: Профиль наборщика
+        host: Адрес сервера
+        port: Порт сервера
+        seed: Зерно генератора нажатий
+        time_scale: Какую долю длительности упражнения ждать перед
+            отправкой результата (1 - как живой игрок, 0 - сразу)
+    Returns:
+        Победитель турнира или None, если бота не приняли или
+            сервер закрыл соединение раньше
+    """
+    profile = profile or TypistProfile()
+    rng = random.Random(f"{seed}:{name}")
+    game_model = GameModel()
+    reader, writer = await asyncio.open_connection(host, port,
+                                                   limit=MAX_LINE)
+    try:
+        await send_message(writer, {"type": "join", "name": name})
+        while (message := await read_message(reader)) is not None:
+            if message.get("type") == "match":
+                text = ExerciseModel(
+                    Difficulty(message["difficulty"]),
+                    Level(message["level"]),
+                    Language(message["language"])).get_exercise_text()
+                result, _ = simulate_exercise(text, profile,
+                                              message["seconds"], rng,
+                                              game_model)
+                await asyncio.sleep(result["elapsed_time"] * time_scale)
+                await send_message(writer, {"type": "result",
+                                            "round": message["round"],
+                                            "result": result})
+            elif message.get("type") == "finished":
+                return message.get("winner")
+            elif message.get("type") == "error":
+                return None
+    finally:
+        writer.close()
+    return None
@@ -0,0 +1,33 @@
+import enum
+
+from src.Models.SettingsModel import SettingsModel
+from src.Models.tournament.RoundRobinTable import RoundRobinTable
+from src.Models.tournament.SwissTable import SwissTable
+from src.Models.tournament.TournamentTable import TournamentTable
+
+
+class TournamentFormat(enum.Enum):
+    knockout = 0
+    swiss = 1
+    round_robin = 2
+
+
+TABLES = {
+    TournamentFormat.knockout: TournamentTable,
+    TournamentFormat.swiss: SwissTable,
+    TournamentFormat.round_robin: RoundRobinTable,
+}
+
+
+def create_table(tournament_format: TournamentFormat, gamers: list,
+                 settings: SettingsModel, big_text: bool):
+    """
+    Таблица турнира выбранного формата. У всех таблиц общий интерфейс:
+    rounds, byes, round_matches(тур), set_winner(матч, игрок), winner.
+    :param tournament_format: формат турнира
+    :param gamers: игроки
+    :param settings: настройки турнира
+    :param big_text: играть большой текст
+    :return: таблица турнира
+    """
+    return TABLES[tournament_format](gamers, settings, big_text)
@@ -0,0 +1,268 @@
+import asyncio
+import time
+
+from src.Models.SettingsModel import SettingsModel
+from src.Models.tournament.MatchRules import match_winner, \
+    update_best_result
+from src.Models.tournament.Protocol import DEFAULT_PORT, FORFEIT, \
+    MAX_LINE, exercise_hash, match_result_valid, read_message, \
+    send_message
+from src.Models.tournament.TournamentFormats import TournamentFormat, \
+    create_table
+from src.Models.tournament.TournamentStatsModel import TournamentStatsModel
+
+# Сколько ждать результат сверх длительности упражнения: игрок
+# читает стартовый экран и нажимает клавишу, когда готов
+START_GRACE = 60
+# Сколько строк таблицы очков отправлять игрокам
+STANDINGS_ROWS = 10
+
+
+class _Player:
+    """Подключенный игрок: соединение и его входящие сообщения."""
+
+    def __init__(self, name: str, reader, writer):
+        self.name = name
+        self.reader = reader
+        self.writer = writer
+        self.messages = asyncio.Queue()
+        self.connected = True
+
+
+class TournamentServer:
+    """
+    Сервер сетевого турнира. Игроки подключаются со своих терминалов,
+    все матчи тура играются одновременно: каждый участник получает
+    текст тура и набирает его у себя, результат приходит на сервер,
+    и сервер сразу записывает победителя матча в таблицу. Тур длится
+    одно упражнение, а не два на каждый матч подряд.
+    Таблица - любого формата из TournamentFormats, правила матча -
+    те же, что у TournamentPresenter.
+    """
+
+    def __init__(self, players: int, settings_model: SettingsModel = None,
+                 big_text: bool = False,
+                 tournament_format: TournamentFormat =
+                 TournamentFormat.knockout,
+                 exercise_seconds: int = 60, host: str = "127.0.0.1",
+                 port: int = DEFAULT_PORT,
+                 stat_model: TournamentStatsModel = None,
+                 start_grace: float = START_GRACE, log=print):
+        """
+        :param players: сколько игроков ждать перед стартом
+        :param settings_model: язык и сложность турнира
+        :param big_text: играть большой текст
+        :param tournament_format: формат турнира
+        :param exercise_seconds: длительность упражнения
+        :param host: адрес сервера
+        :param port: порт (0 - любой свободный)
+        :param stat_model: куда сохранить победителя (None - не сохранять)
+        :param start_grace: запас времени на стартовый экран
+        :param log: функция для строк журнала сервера
+        """
+        self.expected = players
+        self.settings_model = settings_model or SettingsModel()
+        self.big_text = big_text
+        self.tournament_format = tournament_format
+        self.exercise_seconds = exercise_seconds
+        self.host = host
+        self.port = port
+        self.stat_model = stat_model
+        self.start_grace = start_grace
+        self.log = log
+        self.players = {}
+        self.table = None
+        self.best_results = {}
+        self.round_seconds = []
+        self._server = None
+        self._full = asyncio.Event()
+
+    async def start(self) -> int:
+        """
+        Открывает порт для игроков.
+        :return: номер порта
+        """
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port, limit=MAX_LINE)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.log(f"Tournament server on {self.host}:{self.port}, "
+                 f"waiting for {self.expected} players")
+        return self.port
+
+    async def _handle_client(self, reader, writer) -> None:
+        """Принимает игрока и складывает его сообщения в очередь."""
+        message = await read_message(reader)
+        name = message.get("name") if message and \
+            message.get("type") == "join" else None
+        error = None
+        if not isinstance(name, str) or not name.strip():
+            error = "Expected join with a name"
+        elif name in self.players:
+            error = f"Name {name} is taken"
+        elif len(self.players) >= self.expected:
+            error = "Tournament is full"
+        if error is not None:
+            await send_message(writer, {"type": "error", "message": error})
+            writer.close()
+            return
+
+        # Игрок занимает место до первого await: пока идет рассылка,
+        # другие подключения уже видят его в списке
+        player = _Player(name, reader, writer)
+        self.players[name] = player
+        joined = len(self.players)
+        if joined == self.expected:
+            self._full.set()
+        self.log(f"{name} joined ({joined}/{self.expected})")
+        for other in list(self.players.values()):
+            await send_message(other.writer, {
+                "type": "joined", "name": name,
+                "players": joined, "expected": self.expected})
+
+        while (message := await read_message(reader)) is not None:
+            await player.messages.put(message)
+        player.connected = False
+        # Пустое сообщение будит ожидание результата: игрок ушел
+        await player.messages.put(None)
+
+    async def run(self) -> dict:
+        """
+        Ждет игроков и проводит турнир.
+        :return: победитель, его лучший результат, число раундов
+            и матчей, время каждого раунда в секундах
+        """
+        if self._server is None:
+            await self.start()
+        await self._full.wait()
+        gamers = list(self.players)
+        self.table = create_table(self.tournament_format, gamers,
+                                  self.settings_model, self.big_text)
+        matches = 0
+        try:
+            for round_number in range(1, self.table.rounds + 1):
+                started = time.perf_counter()
+                matches += await self._play_round(round_number)
+                self.round_seconds.append(time.perf_counter() - started)
+                if self.tournament_format is not TournamentFormat.knockout:
+                    await self._broadcast({
+                        "type": "standings", "round": round_number,
+                        "rows": [[place, name, points, wins, losses,
+                                  buchholz]
+                                 for place, name, points, wins, losses,
+                                 buchholz in self.table.standings.table(
+                                     STANDINGS_ROWS)]})
+                if not self.big_text:
+                    self.settings_model.set_random_level()
+
+            winner = self.table.winner
+            self.log(f"Winner: {winner}")
+            await self._broadcast({"type": "finished", "winner": winner})
+            best_result = self.best_results.get(winner, {})
+            if self.stat_model is not None and best_result:
+                self.stat_model.save_stat(
+                    self.settings_model.current_language,
+                    self.settings_model.current_difficulty, winner,
+                    best_result["correct_keystrokes"],
+                    best_result["uniformity_score"])
+        finally:
+            await self.close()
+        return {"winner": winner, "best_result": best_result,
+                "rounds": self.table.rounds, "matches": matches,
+                "round_seconds": self.round_seconds}
+
+    async def _play_round(self, round_number: int) -> int:
+        """
+        Раздает матчи тура и ждет все результаты. Матч записывается,
+        как только доиграли оба его игрока.
+        :return: число сыгранных матчей
+        """
+        settings = self.settings_model
+        pairs = self.table.round_matches(round_number)
+        exercise = {
+            "type": "match", "round": round_number,
+            "language": settings.current_language.value,
+            "difficulty": settings.current_difficulty.value,
+            "level": settings.current_level.value,
+            "seconds": self.exercise_seconds,
+            "text_hash": exercise_hash(settings.current_language,
+                                       settings.current_difficulty,
+                                       settings.current_level)}
+        self.log(f"Round {round_number}: {len(pairs)} matches, "
+                 f"level {settings.current_level.name}")
+
+        playing = set()
+        for _, gamer1, gamer2 in pairs:
+            playing.update((gamer1, gamer2))
+            for gamer, opponent in ((gamer1, gamer2), (gamer2, gamer1)):
+                await send_message(self.players[gamer].writer,
+                                   {**exercise, "opponent": opponent})
+        for name, player in self.players.items():
+            if name not in playing:
+                await send_message(player.writer,
+                                   {"type": "wait", "round": round_number})
+
+        await asyncio.gather(*(self._play_match(round_number, *pair)
+                               for pair in pairs))
+        return len(pairs)
+
+    async def _play_match(self, round_number: int, match, gamer1: str,
+                          gamer2: str) -> None:
+        """Ждет результаты обоих игроков матча и записывает победителя."""
+        result1, result2 = await asyncio.gather(
+            self._result(round_number, gamer1),
+            self._result(round_number, gamer2))
+        update_best_result(self.best_results, gamer1, result1)
+        update_best_result(self.best_results, gamer2, result2)
+        winner = match_winner(gamer1, result1, gamer2, result2)
+        self.table.set_winner(match, winner)
+        self.log(f"Round {round_number}: {gamer1} "
+                 f"{result1['correct_keystrokes']} - "
+                 f"{result2['correct_keystrokes']} {gamer2}, "
+                 f"winner {winner}")
+        for gamer, result, opponent_result in (
+                (gamer1, result1, result2), (gamer2, result2, result1)):
+            await send_message(self.players[gamer].writer, {
+                "type": "match_result", "round": round_number,
+                "winner": winner, "result": result,
+                "opponent_result": opponent_result})
+
+    async def _result(self, round_number: int, gamer: str) -> dict:
+        """
+        Результат игрока в туре. Отключение, ошибка клиента или
+        таймаут - поражение с нулевым результатом.
+        """
+        player = self.players[gamer]
+        deadline = asyncio.get_running_loop().time() + \
+            self.exercise_seconds + self.start_grace
+        while player.connected or not player.messages.empty():
+            timeout = deadline - asyncio.get_running_loop().time()
+            try:
+                message = await asyncio.wait_for(player.messages.get(),
+                                                 max(timeout, 0))
+            except asyncio.TimeoutError:
+                self.log(f"{gamer}: no result in round {round_number}")
+                break
+            if message is None:
+                break
+            if message.get("type") == "error":
+                self.log(f"{gamer}: {message.get('message')}")
+                break
+            if message.get("type") == "result" \
+                    and message.get("round") == round_number \
+                    and match_result_valid(message.get("result")):
+                return message["result"]
+        return dict(FORFEIT)
+
+    async def _broadcast(self, message: dict) -> None:
+        """Отправляет сообщение всем подключенным игрокам."""
+        for player in self.players.values():
+            if player.connected:
+                await send_message(player.writer, message)
+
+    async def close(self) -> None:
+        """Закрывает соединения и порт."""
+        for player in self.players.values():
+            player.writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
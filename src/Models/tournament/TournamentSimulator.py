@@ -0,0 +1,176 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.Models.ExerciseModel import ExerciseModel
+from src.Models.GameModel import GameModel
+from src.Models.Metrics import compute_metrics
+from src.Models.SettingsModel import RANDOM_LEVELS, Difficulty, Language, \
+    Level, SettingsModel
+from src.Models.TypistProfile import ProfileDistribution, TypistProfile
+from src.Models.tournament.MatchRules import match_winner, \
+    update_best_result
+from src.Models.tournament.TournamentFormats import TournamentFormat, \
+    create_table
+
+# На сколько частей делится раунд на каждый процесс: мелкие части
+# выравнивают нагрузку, крупные уменьшают накладные расходы
+CHUNKS_PER_WORKER = 4
+
+
+def make_profiles(count: int, distribution: ProfileDistribution = None,
+                  seed: int = 0) -> dict:
+    """
+    Синтетические участники турнира.
+    :param count: число участников
+    :param distribution: распределение наборщиков
+    :param seed: зерно генератора
+    :return: профили TypistProfile по именам игроков (bytes)
+    """
+    distribution = distribution or ProfileDistribution()
+    rng = random.Random(seed)
+    width = len(str(count))
+    return {f"player{number:0{width}}".encode(): distribution.sample(rng)
+            for number in range(1, count + 1)}
+
+
+def simulate_exercise(text: str, profile: TypistProfile, seconds: float,
+                      rng: random.Random, game_model: GameModel = None):
+    """
+    Упражнение синтетического наборщика через GameModel без
+    представления и без ожидания: нажатия с отметками времени
+    обрабатываются одной пачкой, результат считается как в игре.
+    :param text: текст упражнения
+    :param profile: наборщик
+    :param seconds: длительность упражнения
+    :param rng: генератор нажатий
+    :param game_model: модель для повторного использования
+    :return: (результат упражнения, число нажатий)
+    """
+    game_model = game_model or GameModel()
+    game_model.set_exercise_text(text)
+    batch = []
+    elapsed = 0.0
+    for delay, key in profile.keys(text, seconds, rng):
+        elapsed += delay
+        batch.append((chr(key), round(elapsed * 1e9)))
+    game_model.process_keystrokes(batch)
+
+    # Упражнение заканчивается по таймеру или с последним символом
+    elapsed_time = elapsed if game_model.is_completed else seconds
+    with game_model.keystroke_log.timestamps() as timestamps:
+        result = compute_metrics(timestamps, game_model.current_position,
+                                 game_model.correct_keystrokes,
+                                 elapsed_time)
+    return result, len(batch)
+
+
+def _play_matches(task: tuple) -> list:
+    """
+    Играет часть матчей раунда (выполняется в процессе пула).
+    :param task: (язык, сложность, большой текст, длительность, зерно,
+        раунд, матчи (номер, профиль 1, профиль 2))
+    :return: (номер, 0 или 1 - победил первый или второй,
+        результат 1, результат 2, нажатий) по матчам
+    """
+    language, difficulty, big_text, seconds, seed, round_number, \
+        matches = task
+    game_model = GameModel()
+    played = []
+    for index, profile1, profile2 in matches:
+        # Генератор по номеру матча - исход не зависит от числа процессов
+        rng = random.Random(f"{seed}:{round_number}:{index}")
+        level = Level.big_text if big_text else rng.choice(RANDOM_LEVELS)
+        text = ExerciseModel(Difficulty(difficulty), level,
+                             Language(language)).get_exercise_text()
+        result1, keys1 = simulate_exercise(
+            text, TypistProfile(*profile1), seconds, rng, game_model)
+        result2, keys2 = simulate_exercise(
+            text, TypistProfile(*profile2), seconds, rng, game_model)
+        winner = match_winner(0, result1, 1, result2)
+        played.append((index, winner, result1, result2, keys1 + keys2))
+    return played
+
+
+def _chunks(items: list, count: int) -> list:
+    """Делит список на count частей почти равного размера."""
+    size = max(1, -(-len(items) // count))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def simulate_tournament(profiles: dict, language: Language = Language.English,
+                        difficulty: Difficulty = Difficulty.simple,
+                        big_text: bool = False, exercise_seconds: float = 30,
+                        seed: int = 0, workers: int = None,
+                        tournament_format: TournamentFormat =
+                        TournamentFormat.knockout) -> dict:
+    """
+    Турнир между синтетическими наборщиками по правилам
+    TournamentPresenter, без терминала и пауз между экранами.
+    Пары и пропуски - из таблицы выбранного формата, независимые
+    матчи раунда играются в пуле процессов.
+
+    :param profiles: профили TypistProfile по именам игроков
+    :param language: язык турнира
+    :param difficulty: сложность турнира
+    :param big_text: играть большой текст вместо случайного уровня
+    :param exercise_seconds: длительность упражнения
+    :param seed: зерно генератора нажатий
+    :param workers: число процессов (1 - без пула, None - по ядрам)
+    :param tournament_format: формат турнира
+    :return: победитель, его лучший результат, число раундов, матчей,
+        пропусков и нажатий, время и матчи в секунду (всего и на ядро)
+    """
+    workers = workers or os.cpu_count() or 1
+    table = create_table(tournament_format, list(profiles), SettingsModel(),
+                         big_text)
+    best_results = {}
+    counters = {"rounds": table.rounds, "matches": 0, "keystrokes": 0}
+    executor = ProcessPoolExecutor(workers) if workers > 1 else None
+    started = time.perf_counter()
+
+    try:
+        for round_number in range(1, table.rounds + 1):
+            pairs = table.round_matches(round_number)
+            matches = [(index, _profile_args(profiles[gamer1]),
+                        _profile_args(profiles[gamer2]))
+                       for index, (_, gamer1, gamer2) in enumerate(pairs)]
+            tasks = [(language.value, difficulty.value, big_text,
+                      exercise_seconds, seed, round_number, chunk)
+                     for chunk in _chunks(matches,
+                                          workers * CHUNKS_PER_WORKER)]
+            if executor is None:
+                played = map(_play_matches, tasks)
+            else:
+                played = executor.map(_play_matches, tasks)
+
+            for chunk in played:
+                for index, winner, result1, result2, keys in chunk:
+                    match, gamer1, gamer2 = pairs[index]
+                    update_best_result(best_results, gamer1, result1)
+                    update_best_result(best_results, gamer2, result2)
+                    table.set_winner(match, pairs[index][1 + winner])
+                    counters["keystrokes"] += keys
+            counters["matches"] += len(pairs)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    wall_seconds = time.perf_counter() - started
+    winner = table.winner
+    matches_per_second = counters["matches"] / wall_seconds \
+        if wall_seconds > 0 else 0.0
+    return {"winner": winner,
+            "best_result": best_results.get(winner, {}),
+            **counters,
+            "byes": table.byes,
+            "workers": workers,
+            "wall_seconds": wall_seconds,
+            "matches_per_second": matches_per_second,
+            "matches_per_second_per_core": matches_per_second / workers}
+
+
+def _profile_args(profile: TypistProfile) -> tuple:
+    """Параметры профиля для передачи в процесс пула."""
+    return profile.wpm, profile.accuracy, profile.jitter
@@ -8,8 +8,8 @@ class TournamentStatsModel:
     Модель для хранения и управления историей результатов упражнений.
     """
 
-    def __init__(self):
-        self.tournament_file = "tournament.json"
+    def __init__(self, tournament_file: str = "tournament.json"):
+        self.tournament_file = tournament_file
         self.stats = self._load_stats()
 
     def _load_stats(self):
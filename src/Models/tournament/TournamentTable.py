@@ -1,6 +1,10 @@
-import math
+from array import array
+
 from src.Models.SettingsModel import SettingsModel
 
+# Пустой слот сетки: игрок еще не известен или места нет (пропуск)
+EMPTY = -1
+
 
 class TableNode:
     """
@@ -15,33 +19,181 @@ class TableNode:
         self.tour = tour
 
 
+def _bit_reversed(count: int, size: int) -> list:
+    """
+    Первые count чисел из 0..size-1 (size - степень двойки) в порядке
+    обратных битов: соседние номера попадают в разные половины сетки.
+    """
+    bits = size.bit_length() - 1
+    if bits == 0:
+        return [0] * min(count, 1)
+    return [int(format(i, f"0{bits}b")[::-1], 2) for i in range(count)]
+
+
 class TournamentTable:
     """
-    Модель турнирной таблицы.
+    Модель турнирной таблицы: полная сетка на выбывание в виде неявного
+    двоичного дерева в массиве. Узел 1 - финал, у узла k дети 2k и 2k+1,
+    листья size..2*size-1 - места игроков первого тура. В узле хранится
+    номер игрока, который его занял (в листе - участник, в узле матча -
+    победитель), или EMPTY.
+    Если игроков не степень двойки, лишние места - пропуски: их
+    соперники проходят во второй тур сразу при построении сетки.
     """
 
     def __init__(self, gamers: list, settings: SettingsModel,
                  big_text: bool):
-        self.table = self.set_first_tour(gamers, settings, big_text)
+        self.gamers = list(gamers)
+        self.size = 1
+        while self.size < len(self.gamers):
+            self.size *= 2
+        # Число туров: для 6 игроков 3, а не int(log2(6)) = 2
+        self.rounds = self.size.bit_length() - 1
+        self.slots = array("i", [EMPTY]) * (2 * self.size)
+        self._leaf_of = array("i", [EMPTY]) * len(self.gamers)
+        self._index = {gamer: index
+                       for index, gamer in enumerate(self.gamers)}
+        self._place_gamers()
+        self._set_level(settings, big_text)
+        self._table = None
+
+    def _place_gamers(self) -> None:
+        """
+        Расставляет игроков по листьям. Пропуски достаются матчам
+        первого тура в порядке обратных битов, то есть равномерно
+        по всей сетке, и у каждого матча остается хотя бы один игрок.
+        """
+        if self.size == 1:
+            # Один игрок - сразу победитель, матчей нет
+            if self.gamers:
+                self.slots[1] = 0
+                self._leaf_of[0] = 1
+            return
+
+        matches = self.size // 2
+        with_bye = bytearray(matches)
+        for match in _bit_reversed(self.size - len(self.gamers), matches):
+            with_bye[match] = 1
+
+        gamer = 0
+        for match in range(matches):
+            for leaf in (self.size + 2 * match, self.size + 2 * match + 1):
+                if leaf % 2 and with_bye[match]:
+                    continue
+                self.slots[leaf] = gamer
+                self._leaf_of[gamer] = leaf
+                gamer += 1
+            if with_bye[match]:
+                # Единственный игрок матча проходит дальше без игры
+                self.slots[self.size // 2 + match] = \
+                    self.slots[self.size + 2 * match]
 
-    def set_first_tour(self, gamers: list,
-                       settings_model: SettingsModel, is_big_text: bool):
+    @staticmethod
+    def _set_level(settings_model: SettingsModel, is_big_text: bool):
+        if is_big_text:
+            settings_model.set_big_text_level()
+        else:
+            settings_model.set_random_level()
+
+    @property
+    def table(self) -> dict:
+        """
+        Первый тур как словарь узлов TableNode по игрокам. Строится
+        при первом обращении: сама сетка хранится в массивах.
+        """
+        if self._table is None:
+            self._table = self._first_tour_nodes()
+        return self._table
+
+    def _first_tour_nodes(self) -> dict:
         """
         Создание 1 слоя турнирной таблицы
-        :param gamers: список имён игроков
-        :param settings_model: язык и сложность турнира
-        :param is_big_text: флаг уровня большого текста
         :return: первый уровень турнирной таблицы
         """
         table = {}
-        for i in range(0, len(gamers), 2):
-            gamer1 = gamers[i]
-            gamer2 = gamers[i + 1] if i + 1 < len(gamers) else None
-            if is_big_text:
-                settings_model.set_big_text_level()
-            else:
-                settings_model.set_random_level()
-            table[gamer1] = TableNode(gamer2, int(math.log2(len(gamers))))
-            if gamer2:
-                table[gamer2] = TableNode(gamer1, int(math.log2(len(gamers))))
+        for index, gamer in enumerate(self.gamers):
+            leaf = self._leaf_of[index]
+            opponent = self.slots[leaf ^ 1] if leaf > 1 else EMPTY
+            table[gamer] = TableNode(
+                self.gamers[opponent] if opponent != EMPTY else None,
+                self.rounds)
         return table
+
+    @staticmethod
+    def round_of(node: int, size: int) -> int:
+        """Тур матча в узле node сетки из size мест (1 - первый)."""
+        return size.bit_length() - node.bit_length()
+
+    def round_matches(self, round_number: int) -> list:
+        """
+        Матчи тура, которые можно играть: оба игрока известны,
+        победителя еще нет.
+        :param round_number: номер тура, с 1
+        :return: список (узел матча, игрок 1, игрок 2)
+        """
+        first = self.size >> round_number
+        matches = []
+        for node in range(first, 2 * first):
+            left = self.slots[2 * node]
+            right = self.slots[2 * node + 1]
+            if self.slots[node] == EMPTY and left != EMPTY \
+                    and right != EMPTY:
+                matches.append((node, self.gamers[left],
+                                self.gamers[right]))
+        return matches
+
+    def set_winner(self, node: int, gamer) -> None:
+        """
+        Записывает победителя матча, он сразу становится участником
+        следующего матча (родительского узла) за O(1).
+        :param node: узел матча
+        :param gamer: победитель
+        """
+        left = self.slots[2 * node]
+        right = self.slots[2 * node + 1]
+        if left != EMPTY and self.gamers[left] == gamer:
+            self.slots[node] = left
+        elif right != EMPTY and self.gamers[right] == gamer:
+            self.slots[node] = right
+        else:
+            raise ValueError(f"{gamer} does not play match {node}")
+
+    @property
+    def winner(self):
+        """Победитель турнира или None, пока финал не сыгран."""
+        index = self.slots[1]
+        return self.gamers[index] if index != EMPTY else None
+
+    @property
+    def byes(self) -> int:
+        """Число пропусков в первом туре."""
+        return self.size - len(self.gamers) if len(self.gamers) > 1 else 0
+
+    def path(self, gamer) -> list:
+        """
+        Путь игрока по сетке за O(log n): его матчи от первого тура.
+        Матч с пропуском в первом туре не попадает в путь.
+        :param gamer: игрок
+        :return: список (тур, соперник или None, если еще не известен,
+            True/False - выиграл/проиграл, None - не сыгран)
+        """
+        index = self._index[gamer]
+        node = self._leaf_of[index]
+        path = []
+        while node > 1:
+            opponent = self.slots[node ^ 1]
+            parent = node // 2
+            if opponent == EMPTY and node >= self.size:
+                # Пропуск: соперника в первом туре нет
+                node = parent
+                continue
+            won = None
+            if self.slots[parent] != EMPTY:
+                won = self.slots[parent] == index
+            path.append((self.round_of(parent, self.size),
+                         self.gamers[opponent] if opponent != EMPTY
+                         else None, won))
+            if not won:
+                break
+            node = parent
+        return path
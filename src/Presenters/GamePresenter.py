@@ -1,9 +1,12 @@
 import curses
-import time
-from src.Models.SettingsModel import SettingsModel
+from src.Models.Clock import SystemClock
+from src.Models.LatencyModel import LatencyModel, LatencyRecorder
+from src.Models.Metrics import compute_metrics
+from src.Models.SettingsModel import SettingsModel, Level
 from src.Models.ExerciseModel import ExerciseModel
 from src.Models.GameModel import GameModel
 from src.Models.RecordModel import RecordModel
+from src.Presenters.RenderScheduler import RenderScheduler
 from src.Views.ExerciseView import ExerciseView
 
 
@@ -14,12 +17,21 @@ class GamePresenter:
 
     def __init__(self, stdscr: curses.window, game_model: GameModel,
                  settings_model: SettingsModel,
-                 record_model: RecordModel = None):
+                 record_model: RecordModel = None,
+                 frame_rate: int = 60, clock=None,
+                 latency_model: LatencyModel = None, profiler=None):
         """
         Инициализация презентера игры.
 
         Args:
             stdscr: Окно curses для отображения интерфейса
+            frame_rate: Максимальная частота кадров во время упражнения
+            clock: Часы (по умолчанию системные; для воспроизведения
+                без терминала - виртуальные)
+            latency_model: Файл метрик задержки ввода; если задан,
+                задержки нажатий замеряются и сохраняются по сессиям
+            profiler: Профилировщик (SessionProfiler), включаемый
+                только на время цикла упражнения
         """
 
         self.settings_model = settings_model
@@ -28,6 +40,18 @@ class GamePresenter:
         self.record_model = record_model
         self.exercise_view = None
         self.current_result = {}
+        # Большой текст читается по частям, а не целиком
+        self.is_streaming = False
+        self.frame_rate = frame_rate
+        self.clock = clock if clock is not None else SystemClock()
+        self.scheduler = None
+        self.latency_model = latency_model
+        # Задержки текущей сессии, только при включенных замерах
+        self.latency = None
+        self.profiler = profiler
+        # Начало и конец текущего упражнения по self.clock
+        self.start_time = 0.0
+        self.deadline = 0.0
 
         self.stdscr = stdscr
 
@@ -50,8 +74,16 @@ class GamePresenter:
             language=self.settings_model.current_language
         )
 
-        exercise_text = self.exercise_model.get_exercise_text()
-        self.game_model.set_level(exercise_text)
+        self.is_streaming = \
+            self.settings_model.current_level == Level.big_text
+        if self.is_streaming:
+            self.game_model.set_exercise_stream(
+                self.exercise_model.iter_exercise_text())
+            exercise_text = self.game_model.text
+        else:
+            exercise_text = self.exercise_model.get_exercise_text()
+            self.game_model.set_level(exercise_text)
+        complete = self.game_model.is_text_loaded
 
         # Получаем лучший результат для текущего упражнения
         if self.record_model is not None:
@@ -61,8 +93,9 @@ class GamePresenter:
                 level=self.settings_model.current_level
             )
 
-            self.exercise_view = ExerciseView(exercise_text, best_record)
-        self.exercise_view = ExerciseView(exercise_text)
+            self.exercise_view = ExerciseView(exercise_text, best_record,
+                                              complete)
+        self.exercise_view = ExerciseView(exercise_text, complete=complete)
 
     def _run_exercise(self):
         """
@@ -70,89 +103,190 @@ class GamePresenter:
         Управляет циклом упражнения, обрабатывает ввод пользователя
         и обновляет отображение.
         """
-        # Добавляем переменные для отслеживания времени нажатий
-        last_keystroke_time = None
-        keystroke_intervals = []
-        avg_deviation = 0
-
         self.exercise_view.draw(self.stdscr)
         self.stdscr.getch()
 
         self.stdscr.clear()
         self.exercise_view.show_exercise(self.stdscr)
-        self.stdscr.nodelay(True)
 
-        start_time = time.time()
+        if self.profiler is not None:
+            with self.profiler:
+                return self._play_exercise()
+        return self._play_exercise()
+
+    def _play_exercise(self):
+        """
+        Цикл упражнения: ожидание и обработка нажатий, кадры
+        и подсчет результата.
+        """
+        self.begin_exercise()
+        while True:
+            now = self.clock.monotonic()
+            if not self.render_due_frame(now):
+                break
 
-        while time.time() - start_time < self.game_model.exercise_time_seconds:
+            # Ждем нажатия до следующего кадра или конца упражнения
+            self.stdscr.timeout(self.scheduler.wait_ms(now, self.deadline))
             key = self.stdscr.getch()
 
             if key == -1:
                 continue
 
-            if key == 27:
-                break
-
             if self.game_model.is_completed:
                 # self._show_exercise_completion()
                 break
 
-            current_time = time.time()
+            # Забираем все накопившиеся нажатия и рисуем один кадр
+            if self.handle_keys(self._read_pending_keys(key)):
+                break
 
-            # Записываем интервал между нажатиями
-            if last_keystroke_time is not None:
-                actual_interval = current_time - last_keystroke_time
-                keystroke_intervals.append(actual_interval)
+        self.stdscr.timeout(-1)
+        return self.finish_exercise()
 
-            last_keystroke_time = current_time
+    def begin_exercise(self, start_time: float = None) -> None:
+        """
+        Начинает отсчет упражнения. Шаги цикла (begin_exercise,
+        render_due_frame, handle_keys, finish_exercise) открыты,
+        чтобы несколько упражнений можно было вести в одном цикле
+        (заезды турнира на нескольких терминалах).
+        Args:
+            start_time: Время начала по self.clock (по умолчанию сейчас)
+        """
+        self.start_time = self.clock.monotonic() \
+            if start_time is None else start_time
+        self.deadline = self.start_time + \
+            self.game_model.exercise_time_seconds
+        # Нажатия только помечают экран, рисует планировщик кадров
+        self.scheduler = RenderScheduler(self.frame_rate)
+        if self.latency_model is not None:
+            self.latency = LatencyRecorder()
+
+    def render_due_frame(self, now: float) -> bool:
+        """
+        Рисует кадр, если пора.
+        Args:
+            now: Текущее время self.clock.monotonic()
+        Returns:
+            bool: False, если время упражнения вышло
+        """
+        remaining = self.deadline - now
+        if remaining <= 0:
+            return False
+
+        if self.scheduler.is_due(now):
+            self._render_frame(now - self.start_time, remaining)
+            self.scheduler.flush(now)
+            if self.latency is not None:
+                self.latency.painted(self.clock.perf_counter_ns())
+        return True
+
+    def handle_keys(self, keys: list) -> bool:
+        """
+        Передает модели нажатия, пришедшие за одно пробуждение.
+        Args:
+            keys: пары (код клавиши, время чтения perf_counter_ns)
+        Returns:
+            bool: True, если игрок нажал Escape и упражнение окончено
+        """
+        batch = []
+        is_escaped = False
+        for key, timestamp_ns in keys:
+            if key == 27:
+                is_escaped = True
+                break
+            if key == curses.KEY_RESIZE:
+                # Раскладка пересчитывается только при смене размера
+                self._process_batch(batch)
+                batch = []
+                self.exercise_view.resize(self.stdscr)
+                continue
+            batch.append((chr(key), timestamp_ns))
+        self._process_batch(batch)
+        return is_escaped
 
-            is_correct = self.game_model.process_keystroke(chr(key))
+    def finish_exercise(self) -> dict:
+        """
+        Считает результат упражнения на текущий момент и сохраняет
+        замеры задержки.
+        Returns:
+            dict: Метрики compute_metrics
+        """
+        elapsed_time = self.clock.monotonic() - self.start_time
 
-            self.exercise_view.update_display(
-                self.stdscr,
-                is_correct,
+        # Все метрики считаются пакетно по журналу нажатий модели
+        with self.game_model.keystroke_log.timestamps() as timestamps:
+            self.current_result = compute_metrics(
+                timestamps,
                 self.game_model.current_position,
-                self.game_model.correct_keystrokes
-            )
+                self.game_model.correct_keystrokes,
+                elapsed_time)
 
-        elapsed_time = time.time() - start_time
+        if self.latency is not None:
+            self.latency_model.save_session(
+                self.settings_model.current_language,
+                self.settings_model.current_difficulty,
+                self.settings_model.current_level,
+                self.latency, self.frame_rate)
 
-        chars_typed = self.game_model.current_position
-        correct_keystrokes = self.game_model.correct_keystrokes
-
-        # Расчет метрик
-        accuracy = (correct_keystrokes /
-                    chars_typed) * 100 if chars_typed > 0 else 0
-        wpm = ((chars_typed / 5)
-               / (elapsed_time / 60)) if elapsed_time > 0 else 0
+        return self.current_result
 
-        deviation_score = 0
-        if len(keystroke_intervals) > 0:
-            ideal_interval = (elapsed_time /
-                              chars_typed) if chars_typed > 0 else 0
+    def _read_pending_keys(self, first_key: int) -> list:
+        """
+        Забирает без ожидания все нажатия, уже пришедшие в терминал.
+        Args:
+            first_key: нажатие, которым закончилось ожидание
+        Returns:
+            list: пары (код клавиши, время чтения perf_counter_ns)
+        """
+        keys = [(first_key, self.clock.perf_counter_ns())]
+        self.stdscr.timeout(0)
+        while True:
+            key = self.stdscr.getch()
+            if key == -1:
+                return keys
+            keys.append((key, self.clock.perf_counter_ns()))
 
-            deviations = [abs(interval -
-                              ideal_interval)
-                          for interval in keystroke_intervals]
+    def _process_batch(self, batch: list):
+        """
+        Передает модели пачку нажатий и запоминает для представления
+        итоговое состояние, которое будет нарисовано одним кадром.
+        """
+        if not batch:
+            return
 
-            avg_deviation = (sum(deviations) /
-                             len(deviations)) \
-                if len(deviations) > 0 else 0
+        is_correct = self.game_model.process_keystrokes(batch)
+        if self.latency is not None:
+            self.latency.processed(batch, self.clock.perf_counter_ns())
+        if self.is_streaming:
+            self._sync_exercise_text()
 
-            deviation_score = min(100, int(avg_deviation /
-                                           ideal_interval * 100)) \
-                if ideal_interval > 0 else 0
+        self.exercise_view.set_state(
+            is_correct,
+            self.game_model.current_position,
+            self.game_model.correct_keystrokes
+        )
+        self.scheduler.mark_dirty()
 
-        self.current_result = {
-            'wpm': wpm,
-            'accuracy': accuracy,
-            "correct_keystrokes": correct_keystrokes,
-            'elapsed_time': elapsed_time,
-            'uniformity_score': 100 - deviation_score,
-            'avg_deviation': avg_deviation
-        }
+    def _render_frame(self, elapsed: float, remaining: float):
+        """
+        Рисует кадр упражнения: изменения после нажатий и строку
+        состояния с таймером и текущей скоростью.
+        """
+        self.exercise_view.set_hud(elapsed, remaining,
+                                   self.game_model.live_metrics.wpm)
+        self.exercise_view.render(self.stdscr)
 
-        return self.current_result
+    def _sync_exercise_text(self):
+        """
+        Передает представлению текст, который модель дочитала
+        из потока с прошлого нажатия.
+        """
+        view_end = self.exercise_view.text_end
+        if view_end < self.game_model.text_end or \
+                self.exercise_view.complete != self.game_model.is_text_loaded:
+            self.exercise_view.extend_text(
+                self.game_model.text[view_end - self.game_model.text_offset:],
+                self.game_model.is_text_loaded)
 
     def _show_exercise_completion(self):
         """
@@ -179,7 +313,7 @@ class GamePresenter:
         self.exercise_view.show_results_screen(
             self.stdscr,
             self.game_model.current_position,
-            len(self.game_model.text),
+            self.game_model.total_chars,
             self.game_model.correct_keystrokes,
             wpm=wpm,
             accuracy=accuracy,
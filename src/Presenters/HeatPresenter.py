@@ -0,0 +1,171 @@
+import curses
+import selectors
+import sys
+
+from src.Models.Clock import SystemClock
+from src.Models.GameModel import GameModel
+from src.Models.SettingsModel import SettingsModel
+from src.Presenters.GamePresenter import GamePresenter
+
+
+class HeatPresenter:
+    """
+    Заезд: несколько игроков одновременно набирают один и тот же текст,
+    каждый на своем терминале. У каждого окна свои GameModel
+    и ExerciseView (внутри своего GamePresenter), а ввод всех окон
+    ждется в одном цикле через selectors, так что заезд длится одно
+    упражнение, сколько бы в нем ни было игроков.
+    Окна - основной экран curses (ввод со stdin) и TerminalWindow
+    других терминалов (ввод с их fileno()). Игрок, чей терминал
+    закрыли, выбывает из заезда с тем, что успел набрать, остальные
+    доигрывают.
+    """
+
+    def __init__(self, windows: list, settings_model: SettingsModel,
+                 exercise_seconds: int, frame_rate: int = 60, clock=None,
+                 profiler=None):
+        """
+        Args:
+            windows: Окна игроков
+            settings_model: Настройки упражнения (общие для заезда)
+            exercise_seconds: Длительность упражнения
+            frame_rate: Максимальная частота кадров каждого окна
+            clock: Часы (по умолчанию системные)
+            profiler: Профилировщик (SessionProfiler), включаемый
+                только на время общего цикла упражнения
+        """
+        self.windows = list(windows)
+        self.clock = clock if clock is not None else SystemClock()
+        self.profiler = profiler
+        self.presenters = []
+        for window in self.windows:
+            game_model = GameModel()
+            game_model.set_exercise_time(exercise_seconds)
+            self.presenters.append(GamePresenter(
+                window, game_model, settings_model, frame_rate=frame_rate,
+                clock=self.clock))
+
+    def play(self, players: int = None) -> list:
+        """
+        Проводит заезд на первых players окнах.
+        Стартовый экран показывается всем, отсчет начинается для всех
+        сразу, когда каждый игрок нажал клавишу. Игрок выходит из
+        заезда по Escape, по таймеру или нажатием после конца текста.
+        Returns:
+            list: Результаты (метрики compute_metrics) по окнам
+        """
+        presenters = self.presenters[:players]
+        selector = selectors.DefaultSelector()
+        for index, presenter in enumerate(presenters):
+            selector.register(self._fileno(presenter.stdscr),
+                              selectors.EVENT_READ, index)
+        try:
+            self._flush_input(presenters)
+            for presenter in presenters:
+                presenter._initialize_exercise()
+                presenter.exercise_view.draw(presenter.stdscr)
+            gone = self._wait_for_everyone(selector, presenters)
+            if self.profiler is not None:
+                with self.profiler:
+                    return self._race(selector, presenters, gone)
+            return self._race(selector, presenters, gone)
+        finally:
+            selector.close()
+            for presenter in presenters:
+                presenter.stdscr.timeout(-1)
+
+    @staticmethod
+    def _fileno(window) -> int:
+        """Дескриптор ввода окна: у основного экрана curses - stdin."""
+        fileno = getattr(window, "fileno", None)
+        return fileno() if fileno is not None else sys.stdin.fileno()
+
+    @staticmethod
+    def _hung_up(window) -> bool:
+        """Терминал окна закрыт (у основного экрана curses - никогда)."""
+        return getattr(window, "hung_up", False)
+
+    @staticmethod
+    def _flush_input(presenters: list) -> None:
+        """Отбрасывает нажатия, сделанные до заезда."""
+        curses.flushinp()
+        for presenter in presenters:
+            flushinp = getattr(presenter.stdscr, "flushinp", None)
+            if flushinp is not None:
+                flushinp()
+
+    def _drain(self, window) -> list:
+        """Все нажатия, уже пришедшие в окно, с временем чтения."""
+        window.timeout(0)
+        keys = []
+        while (key := window.getch()) != -1:
+            keys.append((key, self.clock.perf_counter_ns()))
+        return keys
+
+    def _wait_for_everyone(self, selector, presenters: list) -> set:
+        """
+        Ждет, пока каждый игрок нажмет клавишу на стартовом экране.
+        Returns:
+            set: Номера окон, терминалы которых закрыли
+        """
+        waiting = set(range(len(presenters)))
+        gone = set()
+        while waiting:
+            for key, _ in selector.select():
+                window = presenters[key.data].stdscr
+                if self._drain(window):
+                    waiting.discard(key.data)
+                if self._hung_up(window):
+                    selector.unregister(key.fd)
+                    waiting.discard(key.data)
+                    gone.add(key.data)
+
+        for presenter in presenters:
+            presenter.stdscr.clear()
+            presenter.exercise_view.show_exercise(presenter.stdscr)
+        return gone
+
+    def _race(self, selector, presenters: list, gone: set) -> list:
+        """
+        Общий цикл упражнения всех игроков.
+        Args:
+            selector: Ввод окон
+            presenters: Упражнения игроков
+            gone: Номера окон, терминалы которых уже закрыли
+        """
+        results = [None] * len(presenters)
+        start_time = self.clock.monotonic()
+        for presenter in presenters:
+            presenter.begin_exercise(start_time)
+        active = set(range(len(presenters))) - gone
+        for index in gone:
+            results[index] = presenters[index].finish_exercise()
+
+        while active:
+            now = self.clock.monotonic()
+            for index in list(active):
+                if not presenters[index].render_due_frame(now):
+                    results[index] = presenters[index].finish_exercise()
+                    active.discard(index)
+            if not active:
+                break
+
+            # Ждем ввода до ближайшего кадра или конца упражнения
+            timeout = min(presenters[index].scheduler.wait_ms(
+                now, presenters[index].deadline) for index in active)
+            for key, _ in selector.select(timeout / 1000):
+                index = key.data
+                presenter = presenters[index]
+                keys = self._drain(presenter.stdscr)
+                if index in active and keys and (
+                        presenter.game_model.is_completed or
+                        presenter.handle_keys(keys)):
+                    results[index] = presenter.finish_exercise()
+                    active.discard(index)
+                if self._hung_up(presenter.stdscr):
+                    # Закрытый терминал всегда готов к чтению
+                    selector.unregister(key.fd)
+                    if index in active:
+                        results[index] = presenter.finish_exercise()
+                        active.discard(index)
+        return results
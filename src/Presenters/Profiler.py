@@ -0,0 +1,128 @@
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+
+# Что профилировать: всю сессию программы или только циклы упражнений
+MODES = ("session", "exercise")
+# Сколько строк попадает в текстовые отчеты
+REPORT_LINES = 40
+# Глубина стека аллокаций tracemalloc
+TRACE_FRAMES = 10
+
+
+class SessionProfiler:
+    """
+    Профилирование по запросу: cProfile и, по желанию, tracemalloc.
+    Замеры включаются только на время участков enable/disable и
+    накапливаются между ними, поэтому в режиме exercise ожидание
+    в меню в профиль не попадает. Без профилировщика программа
+    работает как обычно - проверки есть только на входе в участок.
+    """
+
+    def __init__(self, mode: str = "session", trace_memory: bool = False,
+                 output_root: str = "profiles"):
+        """
+        Args:
+            mode: session - вся программа, exercise - только циклы
+                упражнений
+            trace_memory: Отслеживать аллокации tracemalloc
+            output_root: Каталог, в котором создается каталог отчета
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+        self.mode = mode
+        self.trace_memory = trace_memory
+        self.output_root = output_root
+        self.profile = cProfile.Profile()
+        self.sections = 0
+        # Пиковая память каждого участка в байтах
+        self.memory_peaks = []
+        self._snapshot = None
+
+    @classmethod
+    def from_environment(cls, environ=os.environ):
+        """
+        Профилировщик по переменным окружения или None, если
+        профилирование выключено:
+            TYPING_PROFILE - режим (session или exercise);
+            TYPING_PROFILE_MEMORY - 1, чтобы отслеживать аллокации;
+            TYPING_PROFILE_DIR - каталог отчетов.
+        """
+        mode = environ.get("TYPING_PROFILE")
+        if not mode:
+            return None
+        return cls(mode, environ.get("TYPING_PROFILE_MEMORY") == "1",
+                   environ.get("TYPING_PROFILE_DIR", "profiles"))
+
+    def enable(self) -> None:
+        """Начинает участок профилирования."""
+        if self.trace_memory:
+            tracemalloc.start(TRACE_FRAMES)
+        self.profile.enable()
+
+    def disable(self) -> None:
+        """Заканчивает участок и снимает память, если она отслеживается."""
+        self.profile.disable()
+        self.sections += 1
+        if self.trace_memory and tracemalloc.is_tracing():
+            self.memory_peaks.append(tracemalloc.get_traced_memory()[1])
+            self._snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ))
+            tracemalloc.stop()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+        return False
+
+    def save(self) -> str:
+        """
+        Пишет отчеты в новый каталог с отметкой времени:
+            <mode>.prof - профиль для pstats/snakeviz;
+            <mode>.txt - функции по накопленному времени;
+            allocations.txt - пики памяти участков и крупнейшие
+                аллокации последнего участка (если память отслеживалась).
+
+        Returns:
+            str: Путь к каталогу отчета
+        """
+        directory = os.path.join(
+            self.output_root,
+            time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}")
+        os.makedirs(directory, exist_ok=True)
+
+        self.profile.dump_stats(os.path.join(directory, f"{self.mode}.prof"))
+        report = io.StringIO()
+        if self.sections:
+            stats = pstats.Stats(self.profile, stream=report)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE)
+            stats.print_stats(REPORT_LINES)
+        with open(os.path.join(directory, f"{self.mode}.txt"), "w",
+                  encoding="utf-8") as f:
+            f.write(f"mode: {self.mode}, sections: {self.sections}\n")
+            f.write(report.getvalue())
+
+        if self.trace_memory:
+            self._save_allocations(os.path.join(directory,
+                                                "allocations.txt"))
+        return directory
+
+    def _save_allocations(self, path: str) -> None:
+        """Пишет отчет об аллокациях."""
+        with open(path, "w", encoding="utf-8") as f:
+            for number, peak in enumerate(self.memory_peaks, 1):
+                f.write(f"section {number}: peak {peak / 1024:.1f} KiB\n")
+            if self._snapshot is None:
+                return
+            f.write(f"\ntop {REPORT_LINES} allocations alive at the end "
+                    f"of the last section:\n")
+            for stat in self._snapshot.statistics("lineno")[:REPORT_LINES]:
+                f.write(f"{stat}\n")
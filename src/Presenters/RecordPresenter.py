@@ -1,4 +1,6 @@
+from src.Models.ExerciseModel import ExerciseModel
 from src.Models.RecordModel import RecordModel
+from src.Models.SessionRecording import SessionStore
 import curses
 from src.Views.RecordsView import RecordsView
 from src.Models.GameModel import GameModel
@@ -11,8 +13,11 @@ class RecordPresenter:
     """
 
     def __init__(self, stdscr: curses.window, game_model: GameModel,
-                 settings_model: SettingsModel, record_model: RecordModel):
+                 settings_model: SettingsModel, record_model: RecordModel,
+                 session_store: SessionStore = None):
         self.record_model = record_model
+        # Куда сохранять нажатия упражнений (None - не сохранять)
+        self.session_store = session_store
         self.stdscr = stdscr
         self.game_model = game_model
         self.settings_model = settings_model
@@ -24,7 +29,7 @@ class RecordPresenter:
         """
 
         chars_typed = self.game_model.current_position
-        total_chars = len(self.game_model.text)
+        total_chars = self.game_model.total_chars
         correct_keystrokes = current_result['correct_keystrokes']
 
         # Расчет метрик
@@ -50,8 +55,35 @@ class RecordPresenter:
         }
         self.save_record(chars_typed, total_chars,
                          correct_keystrokes, current_result['elapsed_time'])
+        if self.session_store is not None:
+            self.save_session()
         return is_best_record
 
+    def save_session(self) -> str:
+        """
+        Сохраняет нажатия упражнения в двоичную запись сессии.
+        Returns:
+            str: Путь к файлу записи
+        """
+        if self.game_model.is_text_loaded and \
+                self.game_model.text_offset == 0:
+            text_chunks = self.game_model.text
+        else:
+            # Большой текст в модели только окном - хэш считается
+            # по тексту упражнения, прочитанному заново по частям
+            text_chunks = ExerciseModel(
+                difficulty=self.settings_model.current_difficulty,
+                level=self.settings_model.current_level,
+                language=self.settings_model.current_language
+            ).iter_exercise_text()
+        return self.session_store.save(
+            self.settings_model.current_language,
+            self.settings_model.current_difficulty,
+            self.settings_model.current_level,
+            text_chunks,
+            self.game_model.keystroke_log,
+            self.game_model.exercise_time_seconds)
+
     def save_record(self, chars_typed, total_chars,
                     correct_keystrokes, elapsed_time):
         # Сохраняем результат
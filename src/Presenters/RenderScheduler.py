@@ -0,0 +1,64 @@
+import curses
+import math
+
+
+class RenderScheduler:
+    """
+    Планировщик кадров упражнения. Нажатия только помечают экран
+    грязным, а отрисовка происходит не чаще одного раза за кадр
+    (frame_rate раз в секунду) и не реже раза в hud_interval секунд,
+    чтобы строка состояния с таймером не замирала без ввода.
+    """
+
+    def __init__(self, frame_rate: int = 60, hud_interval: float = 0.5):
+        """
+        Args:
+            frame_rate: Максимальное число кадров в секунду
+            hud_interval: Как часто обновлять строку состояния без ввода
+        """
+        self.frame_interval = 1 / frame_rate
+        self.hud_interval = hud_interval
+        self.dirty = True
+        self.frames = 0
+        self._next_frame = 0.0
+        self._next_hud = 0.0
+
+    def mark_dirty(self) -> None:
+        """Помечает, что на экране есть изменения для следующего кадра."""
+        self.dirty = True
+
+    def is_due(self, now: float) -> bool:
+        """
+        Проверяет, пора ли рисовать кадр.
+        Args:
+            now: Текущее время time.monotonic()
+        """
+        return (self.dirty and now >= self._next_frame) or \
+            now >= self._next_hud
+
+    def flush(self, now: float) -> None:
+        """
+        Выводит на терминал всё, что за кадр было нарисовано
+        через noutrefresh, одним вызовом doupdate.
+        Args:
+            now: Время, в которое нарисован кадр
+        """
+        curses.doupdate()
+        self.dirty = False
+        self.frames += 1
+        self._next_frame = now + self.frame_interval
+        self._next_hud = now + self.hud_interval
+
+    def wait_ms(self, now: float, deadline: float) -> int:
+        """
+        Возвращает, сколько миллисекунд можно ждать ввода: до
+        следующего кадра (если есть изменения), обновления строки
+        состояния или конца упражнения.
+        Args:
+            now: Текущее время time.monotonic()
+            deadline: Время окончания упражнения
+        """
+        wake = min(deadline, self._next_hud)
+        if self.dirty:
+            wake = min(wake, self._next_frame)
+        return max(1, math.ceil((wake - now) * 1000))
@@ -0,0 +1,117 @@
+import random
+import time
+from itertools import chain
+
+from src.Models.Clock import VirtualClock
+from src.Models.GameModel import GameModel
+from src.Models.SettingsModel import SettingsModel
+from src.Models.TypistProfile import TypistProfile
+from src.Presenters.GamePresenter import GamePresenter
+from src.Presenters.RecordPresenter import RecordPresenter
+from src.Views.ExerciseView import ExerciseView
+from src.Views.HeadlessWindow import (HeadlessWindow, ScriptedInput,
+                                      headless_curses)
+
+# Клавиша, которой сценарий отвечает на экраны "нажмите любую клавишу"
+PROMPT_KEY = ord("q")
+
+
+def keys_from_log(text: str, log):
+    """
+    Превращает журнал нажатий упражнения в сценарий ввода.
+    Нажатия воспроизводятся записанными кодами клавиш. Если код
+    неизвестен (0), верное нажатие - символом текста, ошибочное -
+    заведомо неверным символом.
+    Args:
+        text: Текст упражнения
+        log: Журнал нажатий (KeystrokeLogView)
+    Returns:
+        list: События сценария (задержка, код клавиши)
+    """
+    events = []
+    previous = None
+    with log.keys() as keys:
+        for (timestamp_ns, position, is_correct), key in zip(log, keys):
+            delay = 0.0 if previous is None \
+                else (timestamp_ns - previous) / 1e9
+            previous = timestamp_ns
+            if not key:
+                char = text[position]
+                if not is_correct:
+                    char = "#" if char != "#" else "$"
+                key = ord(char)
+            events.append((delay, key))
+    return events
+
+
+def replay_session(settings_model: SettingsModel = None, keys=None,
+                   profile: TypistProfile = None, text: str = None,
+                   exercise_seconds: float = 5, seed: int = 0,
+                   record_model=None, latency_model=None,
+                   profiler=None) -> dict:
+    """
+    Проигрывает сессию упражнения через настоящий GamePresenter
+    без терминала и на виртуальных часах, с максимальной скоростью.
+
+    Args:
+        settings_model: Язык, сложность и уровень упражнения
+        keys: Записанный сценарий нажатий (задержка, код клавиши);
+            если не задан, нажатия порождает profile
+        profile: Синтетический наборщик (по умолчанию TypistProfile())
+        text: Текст упражнения вместо текста из настроек
+        exercise_seconds: Длительность упражнения
+        seed: Зерно генератора для синтетических нажатий
+        record_model: Модель истории, куда сохранить результат
+        latency_model: Файл метрик задержки ввода (время по
+            виртуальным часам, то есть только ожидание кадра)
+        profiler: Профилировщик цикла упражнения (SessionProfiler)
+
+    Returns:
+        dict: result - результат упражнения, keystrokes - обработано
+            нажатий, wall_seconds - реальное время, keys_per_second -
+            пропускная способность, virtual_seconds - время сессии
+    """
+    settings_model = settings_model or SettingsModel()
+    profile = profile or TypistProfile()
+    clock = VirtualClock()
+    game_model = GameModel()
+    game_model.set_exercise_time(exercise_seconds)
+    presenter = None
+
+    def events():
+        yield None, PROMPT_KEY
+        # Стартовый экран показан - текст упражнения уже выбран
+        if keys is not None:
+            yield from keys
+        elif text is not None:
+            yield from profile.keys(text, exercise_seconds,
+                                    random.Random(seed))
+        else:
+            chars = chain.from_iterable(
+                presenter.exercise_model.iter_exercise_text())
+            yield from profile.keys(chars, exercise_seconds,
+                                    random.Random(seed))
+
+    window = HeadlessWindow(ScriptedInput(events(), clock))
+    started = time.perf_counter()
+    with headless_curses(window):
+        presenter = GamePresenter(window, game_model, settings_model,
+                                  record_model, clock=clock,
+                                  latency_model=latency_model,
+                                  profiler=profiler)
+        if text is None:
+            result = presenter.start_game()
+        else:
+            game_model.set_level(text)
+            presenter.exercise_view = ExerciseView(text)
+            result = presenter._run_exercise()
+        if record_model is not None:
+            RecordPresenter(window, game_model, settings_model,
+                            record_model).save_exercise_rec(result)
+    wall_seconds = time.perf_counter() - started
+
+    keystrokes = len(game_model.keystroke_log)
+    return {"result": result, "keystrokes": keystrokes,
+            "wall_seconds": wall_seconds,
+            "keys_per_second": keystrokes / wall_seconds,
+            "virtual_seconds": clock.now}
@@ -1,8 +1,12 @@
 import curses
+import os
 
 from src.Models.GameModel import GameModel
+from src.Models.LatencyModel import LatencyModel
 from src.Models.RecordModel import RecordModel
+from src.Models.SessionRecording import SessionStore
 from src.Models.SettingsModel import SettingsModel
+from src.Models.SqliteRecordModel import SqliteRecordModel
 from src.Presenters.ListPresenter import ListPresenter
 from src.Presenters.RecordPresenter import RecordPresenter
 from src.Presenters.GamePresenter import GamePresenter
@@ -17,28 +21,47 @@ class RootPresenter:
     Отвечает за обработку пользовательского ввода и обновление отображения.
     """
 
-    def __init__(self, stdscr: curses.window):
+    def __init__(self, stdscr: curses.window, exercise_profiler=None,
+                 terminals: list = None):
         """
         Инициализирует структуру.
+
+        Args:
+            stdscr: Окно curses
+            exercise_profiler: Профилировщик, который включается
+                только на время упражнений (обычных и турнирных)
+            terminals: Окна TerminalWindow других терминалов для
+                одновременных матчей турнира
         """
 
         self.stdscr = stdscr
 
         self.settings_model = SettingsModel()
         self.game_model = GameModel()
-        self.record_model = RecordModel()
+        # Хранилище рекордов: JSON-журнал или SQLite (RECORDS_BACKEND=sqlite)
+        if os.environ.get("RECORDS_BACKEND") == "sqlite":
+            self.record_model = SqliteRecordModel()
+        else:
+            self.record_model = RecordModel()
         self.tournament_model = None
+        # Замеры задержки ввода пишутся в файл из LATENCY_METRICS
+        latency_file = os.environ.get("LATENCY_METRICS")
+        latency_model = LatencyModel(latency_file) if latency_file else None
 
         self.game_presenter = GamePresenter(stdscr, self.game_model,
                                             self.settings_model,
-                                            self.record_model)
+                                            self.record_model,
+                                            latency_model=latency_model,
+                                            profiler=exercise_profiler)
 
         self.list_presenter = ListPresenter(self.settings_model)
-        self.tournament_presenter = TournamentPresenter(stdscr)
+        self.tournament_presenter = TournamentPresenter(
+            stdscr, profiler=exercise_profiler, terminals=terminals)
 
         self.record_presenter = RecordPresenter(stdscr, self.game_model,
                                                 self.settings_model,
-                                                self.record_model)
+                                                self.record_model,
+                                                SessionStore())
 
         self._setup_terminal()
         self.list_presenter.show_language_selection()
@@ -175,6 +198,7 @@ class RootPresenter:
         Возвращает терминал в стандартное состояние.
         """
 
+        self.record_model.close()
         curses.nocbreak()
         self.stdscr.keypad(False)
         curses.echo()
@@ -0,0 +1,132 @@
+import asyncio
+import curses
+
+from src.Models.GameModel import GameModel
+from src.Models.SettingsModel import Difficulty, Language, Level, \
+    SettingsModel
+from src.Models.tournament.Protocol import DEFAULT_PORT, MAX_LINE, \
+    exercise_hash, read_message, send_message
+from src.Presenters.GamePresenter import GamePresenter
+from src.Views.TournamentView import TournamentView
+
+
+class TournamentClient:
+    """
+    Клиент сетевого турнира: подключается к TournamentServer и играет
+    матчи игрока на его терминале. Упражнение идет в обычном
+    GamePresenter, результат уходит на сервер.
+    """
+
+    def __init__(self, stdscr: curses.window, name: str,
+                 host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                 clock=None, profiler=None):
+        """
+        :param stdscr: экран
+        :param name: имя игрока
+        :param host: адрес сервера
+        :param port: порт сервера
+        :param clock: часы (по умолчанию системные)
+        :param profiler: профилировщик циклов упражнений
+        """
+        self.stdscr = stdscr
+        self.name = name
+        self.host = host
+        self.port = port
+        self.settings_model = SettingsModel()
+        self.game_model = GameModel()
+        self.game_presenter = GamePresenter(
+            stdscr, self.game_model, self.settings_model, clock=clock,
+            profiler=profiler)
+        self.tournament_view = TournamentView()
+        self.results = []
+
+    def run(self):
+        """
+        Играет турнир до конца.
+        :return: победитель или None, если игрока не приняли или
+            сервер закрыл соединение
+        """
+        return asyncio.run(self.play())
+
+    async def play(self):
+        """Цикл сообщений сервера."""
+        reader, writer = await asyncio.open_connection(
+            self.host, self.port, limit=MAX_LINE)
+        try:
+            await send_message(writer, {"type": "join", "name": self.name})
+            while (message := await read_message(reader)) is not None:
+                match message.get("type"):
+                    case "joined":
+                        self.tournament_view.show_message(self.stdscr, [
+                            f"Турнир на {self.host}:{self.port}",
+                            f"Игроков: {message['players']} из "
+                            f"{message['expected']}, ждем остальных"])
+                    case "match":
+                        await self._play_match(message, writer)
+                    case "match_result":
+                        self._show_match_result(message)
+                    case "wait":
+                        self.tournament_view.show_message(self.stdscr, [
+                            f"Раунд {message['round']}",
+                            "В этом раунде вы не играете, ждите"])
+                    case "standings":
+                        self.tournament_view.show_standings(
+                            self.stdscr, message["round"],
+                            [(place, name.encode("utf-8"), *scores)
+                             for place, name, *scores in message["rows"]])
+                    case "finished":
+                        curses.flushinp()
+                        self.tournament_view.show_winer(
+                            self.stdscr, message["winner"])
+                        return message["winner"]
+                    case "error":
+                        self.tournament_view.show_message(self.stdscr, [
+                            "Ошибка", message.get("message", "")])
+                        return None
+        finally:
+            writer.close()
+        return None
+
+    async def _play_match(self, message: dict, writer) -> None:
+        """Играет упражнение матча и отправляет результат."""
+        self.settings_model.current_language = Language(message["language"])
+        self.settings_model.current_difficulty = \
+            Difficulty(message["difficulty"])
+        self.settings_model.current_level = Level(message["level"])
+        if exercise_hash(self.settings_model.current_language,
+                         self.settings_model.current_difficulty,
+                         self.settings_model.current_level) != \
+                message["text_hash"]:
+            # Другая версия упражнений - матч не может быть честным
+            await send_message(writer, {
+                "type": "error",
+                "message": "Exercise text differs from the server"})
+            self.tournament_view.show_message(self.stdscr, [
+                "Текст упражнения отличается от текста на сервере",
+                "Матч засчитан как поражение"])
+            return
+
+        self.game_model.set_exercise_time(message["seconds"])
+        self.tournament_view.show_vs(self.stdscr,
+                                     self.name.encode("utf-8"),
+                                     message["opponent"].encode("utf-8"))
+        curses.flushinp()
+        # Упражнение блокирует поток, поэтому идет вне цикла событий
+        result = await asyncio.to_thread(self.game_presenter.start_game)
+        self.results.append(result)
+        await send_message(writer, {"type": "result",
+                                    "round": message["round"],
+                                    "result": result})
+        self.tournament_view.show_message(self.stdscr, [
+            f"Раунд {message['round']}",
+            "Результат отправлен, ждем соперника"])
+
+    def _show_match_result(self, message: dict) -> None:
+        """Итог матча игрока."""
+        won = message["winner"] == self.name
+        self.tournament_view.show_message(self.stdscr, [
+            f"Раунд {message['round']}: "
+            f"{'победа' if won else 'поражение'}",
+            f"Правильных нажатий: "
+            f"{message['result']['correct_keystrokes']}, у соперника "
+            f"{message['opponent_result']['correct_keystrokes']}"])
@@ -1,11 +1,15 @@
 import curses
-import time
 
+from src.Models.Clock import SystemClock
 from src.Models.GameModel import GameModel
 from src.Models.SettingsModel import SettingsModel
+from src.Models.tournament.MatchRules import match_winner, \
+    update_best_result
+from src.Models.tournament.TournamentFormats import TournamentFormat, \
+    create_table
 from src.Models.tournament.TournamentStatsModel import TournamentStatsModel
-from src.Models.tournament.TournamentTable import TournamentTable
 from src.Presenters.GamePresenter import GamePresenter
+from src.Presenters.HeatPresenter import HeatPresenter
 from src.Presenters.TournamentStatPresenter import TournamentStatPresenter
 from src.Views.TournamentView import TournamentView
 
@@ -15,15 +19,27 @@ class TournamentPresenter:
     Презентер турнира. Отвечает за прохождения турнира
     """
 
-    def __init__(self, stdscr: curses.window):
+    def __init__(self, stdscr: curses.window, clock=None,
+                 stat_model: TournamentStatsModel = None, profiler=None,
+                 terminals: list = None):
         """
         Инициализация
         :param stdscr: экран
+        :param clock: часы (по умолчанию системные)
+        :param stat_model: модель статистики турниров
+        :param profiler: профилировщик циклов упражнений
+        :param terminals: окна TerminalWindow других терминалов; если
+            они есть, матчи тура играются заездами одновременно
         """
         self.stdscr = stdscr
+        self.terminals = list(terminals or [])
+        self.clock = clock if clock is not None else SystemClock()
+        self.stat_model = stat_model
+        self.profiler = profiler
         self.settings_model = None
         self.game_model = GameModel()
         self.stat_presenter = None
+        self.game_presenter = None
         self.tournament_view = TournamentView()
         self.tour_model = None
         self.gamers_count = 0
@@ -37,6 +53,7 @@ class TournamentPresenter:
         self.stat_presenter = TournamentStatPresenter(self.stdscr,
                                                       self.game_model,
                                                       settings_model,
+                                                      self.stat_model or
                                                       TournamentStatsModel())
         self.settings_model = settings_model
 
@@ -44,68 +61,109 @@ class TournamentPresenter:
         gamers = self.tournament_view.show_init_gamer(
             self.stdscr, self.gamers_count)
         is_big_text = self.tournament_view.is_big_text(self.stdscr)
-        self.tour_model = TournamentTable(
-            gamers, self.settings_model, is_big_text)
+        tournament_format = TournamentFormat(
+            self.tournament_view.choose_format(self.stdscr))
+        self.tour_model = create_table(tournament_format, gamers,
+                                       self.settings_model, is_big_text)
 
-        game_tournament_presenter = GamePresenter(
-            self.stdscr, self.game_model, self.settings_model)
+        self.game_presenter = GamePresenter(
+            self.stdscr, self.game_model, self.settings_model,
+            clock=self.clock, profiler=self.profiler)
 
-        current_round = 1
-        current_gamers = gamers.copy()
         self.tournament_view.show_start(self.stdscr)
         best_results = {gamer: {} for gamer in gamers}
 
-        while len(current_gamers) > 1:
+        # Пропуски расставлены в сетке, поэтому нечетное число
+        # победителей раунда (например, при 6 игроках) не мешает.
+        # Пары швейцарского тура составляются по итогам предыдущего
+        for current_round in range(1, self.tour_model.rounds + 1):
             self.stdscr.clear()
             self.stdscr.addstr(0, 0, f"Раунд {current_round}")
             self.stdscr.refresh()
-            time.sleep(3)
+            self.clock.sleep(3)
             curses.flushinp()
-            winners = []
-            for i in range(0, len(current_gamers), 2):
-
-                gamer1 = current_gamers[i]
-                gamer2 = current_gamers[i + 1]
-
-                self.tournament_view.show_vs(self.stdscr, gamer1, gamer2)
-                time.sleep(3)
-
-                curses.flushinp()
-                gamer_result1 = game_tournament_presenter.start_game()
-                curses.flushinp()
-                gamer_result2 = game_tournament_presenter.start_game()
-
-                if ("correct_keystrokes" not in best_results[gamer1]) or (
-                        gamer_result1['correct_keystrokes'] >
-                        best_results[gamer1]['correct_keystrokes']):
-                    best_results[gamer1] = gamer_result1
-
-                if ("correct_keystrokes" not in best_results[gamer2]) or (
-                        gamer_result2['correct_keystrokes'] >
-                        best_results[gamer2]['correct_keystrokes']):
-                    best_results[gamer2] = gamer_result2
-
-                if (gamer_result1['correct_keystrokes'] >
-                        gamer_result2['correct_keystrokes']):
-                    winners.append(gamer1)
-                elif (gamer_result1['correct_keystrokes'] <
-                      gamer_result2['correct_keystrokes']):
-                    winners.append(gamer2)
-                elif (gamer_result1['uniformity_score'] >
-                      gamer_result2['uniformity_score']):
-                    winners.append(gamer1)
-                else:
-                    winners.append(gamer2)
-                if is_big_text is False:
-                    self.settings_model.set_random_level()
-
-            current_gamers = winners
-            current_round += 1
+            matches = self.tour_model.round_matches(current_round)
+            if self.terminals:
+                self._play_heats(matches, best_results, is_big_text)
+            else:
+                self._play_matches(matches, best_results, is_big_text)
+
+            # В швейцарской и круговой системах после тура - таблица очков
+            if tournament_format is not TournamentFormat.knockout:
+                self.tournament_view.show_standings(
+                    self.stdscr, current_round,
+                    self.tour_model.standings.table())
+                self.clock.sleep(3)
+
+        winner = self.tour_model.winner
         curses.flushinp()
-        self.tournament_view.show_winer(self.stdscr,
-                                        current_gamers[0].decode("utf-8"))
-        time.sleep(3)
+        self.tournament_view.show_winer(self.stdscr, winner.decode("utf-8"))
+        self.clock.sleep(3)
         self.stat_presenter.save_winner(settings_model.current_language,
                                         settings_model.current_difficulty,
-                                        current_gamers[0].decode("utf-8"),
-                                        best_results[current_gamers[0]])
+                                        winner.decode("utf-8"),
+                                        best_results[winner])
+
+    def _play_matches(self, matches: list, best_results: dict,
+                      is_big_text: bool):
+        """
+        Матчи тура на одном терминале: игроки матча набирают текст
+        по очереди.
+        :param matches: матчи (номер, игрок 1, игрок 2)
+        :param best_results: лучшие результаты игроков
+        :param is_big_text: играть большой текст
+        """
+        for match, gamer1, gamer2 in matches:
+            self.tournament_view.show_vs(self.stdscr, gamer1, gamer2)
+            self.clock.sleep(3)
+
+            curses.flushinp()
+            gamer_result1 = self.game_presenter.start_game()
+            curses.flushinp()
+            gamer_result2 = self.game_presenter.start_game()
+
+            self._record_match(match, gamer1, gamer_result1,
+                               gamer2, gamer_result2, best_results)
+            if is_big_text is False:
+                self.settings_model.set_random_level()
+
+    def _play_heats(self, matches: list, best_results: dict,
+                    is_big_text: bool):
+        """
+        Матчи тура заездами на нескольких терминалах: в заезде
+        столько матчей, сколько пар окон, все игроки заезда набирают
+        один текст одновременно.
+        :param matches: матчи (номер, игрок 1, игрок 2)
+        :param best_results: лучшие результаты игроков
+        :param is_big_text: играть большой текст
+        """
+        windows = [self.stdscr, *self.terminals]
+        heat = HeatPresenter(windows, self.settings_model,
+                             self.game_model.exercise_time_seconds,
+                             clock=self.clock, profiler=self.profiler)
+        per_heat = len(windows) // 2
+        for first in range(0, len(matches), per_heat):
+            heat_matches = matches[first:first + per_heat]
+            # Окна 2k и 2k+1 - игроки k-го матча заезда
+            for number, (_, gamer1, gamer2) in enumerate(heat_matches):
+                self.tournament_view.show_vs(windows[2 * number],
+                                             gamer1, gamer2)
+                self.tournament_view.show_vs(windows[2 * number + 1],
+                                             gamer2, gamer1)
+            self.clock.sleep(3)
+
+            results = heat.play(2 * len(heat_matches))
+            for number, (match, gamer1, gamer2) in enumerate(heat_matches):
+                self._record_match(match, gamer1, results[2 * number],
+                                   gamer2, results[2 * number + 1],
+                                   best_results)
+            if is_big_text is False:
+                self.settings_model.set_random_level()
+
+    def _record_match(self, match, gamer1, result1: dict, gamer2,
+                      result2: dict, best_results: dict):
+        """Записывает результаты и победителя матча."""
+        update_best_result(best_results, gamer1, result1)
+        update_best_result(best_results, gamer2, result2)
+        self.tour_model.set_winner(
+            match, match_winner(gamer1, result1, gamer2, result2))
@@ -0,0 +1,93 @@
+import os
+import random
+import time
+from collections import deque
+
+from src.Models.Clock import VirtualClock
+from src.Models.SettingsModel import SettingsModel
+from src.Models.tournament.TournamentStatsModel import TournamentStatsModel
+from src.Models.TypistProfile import TypistProfile
+from src.Presenters.Replay import PROMPT_KEY
+from src.Presenters.TournamentPresenter import TournamentPresenter
+from src.Views.HeadlessWindow import (HeadlessWindow, ScriptedInput,
+                                      headless_curses)
+from src.Views.TournamentView import TournamentView
+
+
+class _ReplayTournamentView(TournamentView):
+    """Представление турнира, которое сообщает, кто играет следующим."""
+
+    def __init__(self, players: deque):
+        super().__init__()
+        self._players = players
+
+    def show_vs(self, window, gamer1: bytes, gamer2: bytes):
+        self._players.extend((gamer1, gamer2))
+        super().show_vs(window, gamer1, gamer2)
+
+
+def replay_tournament(profiles: dict, settings_model: SettingsModel = None,
+                      exercise_seconds: float = 5, seed: int = 0,
+                      stats_file: str = os.devnull) -> dict:
+    """
+    Проигрывает турнир через настоящий TournamentPresenter без
+    терминала и на виртуальных часах: каждый игрок набирает текст
+    своего матча по своему синтетическому профилю.
+
+    Args:
+        profiles: Профили TypistProfile по именам игроков (bytes)
+        settings_model: Язык и сложность турнира
+        exercise_seconds: Длительность одного упражнения
+        seed: Зерно генератора нажатий
+        stats_file: Куда сохранить статистику победителя
+
+    Returns:
+        dict: winner - победитель, games - сыграно упражнений,
+            keystrokes - обработано нажатий, wall_seconds,
+            keys_per_second и virtual_seconds
+    """
+    settings_model = settings_model or SettingsModel()
+    clock = VirtualClock()
+    rng = random.Random(seed)
+    players = deque()
+    counters = {"games": 0, "keystrokes": 0}
+    presenter = None
+
+    def events():
+        yield None, str(len(profiles)).encode()
+        for name in profiles:
+            yield None, name
+        seen = None
+        while True:
+            # Новый планировщик кадров - начался цикл очередного упражнения
+            scheduler = presenter.game_presenter.scheduler \
+                if presenter.game_presenter is not None else None
+            if scheduler is not None and scheduler is not seen:
+                seen = scheduler
+                profile = profiles.get(players.popleft(), TypistProfile())
+                counters["games"] += 1
+                for event in profile.keys(presenter.game_model.text,
+                                          exercise_seconds, rng):
+                    counters["keystrokes"] += 1
+                    yield event
+            # Ответ на любой экран ожидания: старт, выбор большого
+            # текста ("q" - нет), победитель, выход из статистики
+            yield None, PROMPT_KEY
+
+    window = HeadlessWindow(ScriptedInput(events(), clock))
+    started = time.perf_counter()
+    with headless_curses(window):
+        presenter = TournamentPresenter(
+            window, clock=clock,
+            stat_model=TournamentStatsModel(stats_file))
+        presenter.tournament_view = _ReplayTournamentView(players)
+        presenter.game_model.set_exercise_time(exercise_seconds)
+        presenter.tournament(settings_model)
+    wall_seconds = time.perf_counter() - started
+
+    return {"winner": presenter.stat_presenter.current_result["name"],
+            "games": counters["games"],
+            "keystrokes": counters["keystrokes"],
+            "wall_seconds": wall_seconds,
+            "keys_per_second": counters["keystrokes"] / wall_seconds,
+            "virtual_seconds": clock.now}
@@ -1,18 +1,42 @@
 from src.Views.IView import IView
 import curses
-from src.Views.TextOutput import draw_text_with_wrap
+from src.Views.TextLayout import TextLayout
 from typing import Optional
 
+# Строки под текстом: подсказка, отметка корректности, счетчик
+# и лучший результат на начальном экране
+FOOTER_ROWS = 6
+
 
 class ExerciseView(IView):
     """
     Представление для упражнения.
     """
 
-    def __init__(self, exercise_text: str, best_record: Optional[dict] = None):
+    def __init__(self, exercise_text: str, best_record: Optional[dict] = None,
+                 complete: bool = True):
+        """
+        Args:
+            exercise_text: текст упражнения (или его начало)
+            best_record: лучший результат для упражнения
+            complete: весь ли текст передан; иначе продолжение
+                приходит через extend_text
+        """
         self.exercise_text = exercise_text
         self.best_record = best_record
+        self.complete = complete
         self.index_column = 0
+        self.top_line = 0
+        self._drawn_end = 0
+        self._painted = False
+        self._highlighted = None
+        self._feedback = None
+        self._counter = None
+        self._state = None
+        self._state_changed = False
+        self._hud = None
+        self._hud_text = None
+        self.layout = None
         self._initialize_colors()
 
     def _initialize_colors(self) -> None:
@@ -34,8 +58,8 @@ class ExerciseView(IView):
         """
         window.clear()
 
-        self.index_column = draw_text_with_wrap(window,
-                                                self.exercise_text, 1, 0)
+        self.index_column = self._get_layout(window).draw(
+            window, max_lines=self._text_rows(window), top=self.top_line)
 
         window.addstr(self.index_column + 1, 0,
                       "Нажмите любую клавишу, чтобы начать...")
@@ -62,14 +86,57 @@ class ExerciseView(IView):
             window: окно из библиотеки curses, где отрисовывать
         """
         window.clear()
-        draw_text_with_wrap(window, self.exercise_text, 1, 0)
-        window.move(self.index_column + 1, 0)
+        self._paint_text(window)
         window.refresh()
 
+    def resize(self, window: curses.window) -> None:
+        """
+        Пересчитывает раскладку текста под новый размер окна
+        и перерисовывает экран упражнения (вызывается на KEY_RESIZE).
+
+        Args:
+            window: окно из библиотеки curses, где отрисовывать
+        """
+        old = self.layout
+        if old is not None:
+            # Новая раскладка начинается с первой видимой строки
+            _, max_x = window.getmaxyx()
+            self.layout = TextLayout(old.text, max_x, 1, 0,
+                                     base=old.base, complete=old.complete)
+            self.top_line = 0
+        self._paint_text(window)
+        if self._state is not None:
+            self.update_display(window, *self._state)
+        else:
+            window.refresh()
+
+    def extend_text(self, text: str, complete: bool = True) -> None:
+        """
+        Дописывает продолжение текста упражнения (потоковый режим).
+        Новые строки появятся на экране при следующем обновлении.
+
+        Args:
+            text: продолжение текста
+            complete: является ли продолжение последним
+        """
+        if self.layout is None:
+            self.exercise_text += text
+        else:
+            self.layout.extend(text, complete)
+        self.complete = complete
+
+    @property
+    def text_end(self) -> int:
+        """Абсолютная позиция конца переданного представлению текста."""
+        if self.layout is None:
+            return len(self.exercise_text)
+        return self.layout.end
+
     def update_display(self, window: curses.window, is_correct: bool,
                        current_position: int, correct_keystrokes: int) -> None:
         """
-        Обновить экран (окно) после нажатия.
+        Обновить экран (окно) после нажатия сразу, без планировщика
+        кадров: set_state, отрисовка изменений и refresh.
 
         Args:
             window: окно из библиотеки curses, где отрисовывать
@@ -77,62 +144,205 @@ class ExerciseView(IView):
             current_position: нынешняя позиция в тексте
             correct_keystrokes: количество правильных нажатий
         """
+        self.set_state(is_correct, current_position, correct_keystrokes)
+        self._apply_state(window)
+        window.refresh()
 
-        window.erase()
-        window.move(0, 0)
+    def set_state(self, is_correct: bool, current_position: int,
+                  correct_keystrokes: int) -> None:
+        """
+        Запоминает состояние после нажатия, ничего не рисуя.
+        Нарисовано оно будет при следующем render.
+
+        Args:
+            is_correct: было ли нажатие корректным
+            current_position: нынешняя позиция в тексте
+            correct_keystrokes: количество правильных нажатий
+        """
+        self._state = (is_correct, current_position, correct_keystrokes)
+        self._state_changed = True
+
+    def set_hud(self, elapsed: float, remaining: float,
+                wpm: float) -> None:
+        """
+        Запоминает данные строки состояния над текстом: прошедшее
+        и оставшееся время и текущую скорость.
 
-        passed_text = self.exercise_text[:current_position - 1]
-        current_char = self.exercise_text[current_position - 1]
-        remaining_text = self.exercise_text[current_position:]
-        y, x = 1, 0
+        Args:
+            elapsed: прошло секунд с начала упражнения
+            remaining: осталось секунд до конца упражнения
+            wpm: текущая скорость набора
+        """
+        self._hud_text = (f"Time: {elapsed:.0f}s | Left: {remaining:.0f}s"
+                          f" | Speed: {wpm:.1f} WPM")
 
+    def render(self, window: curses.window) -> None:
+        """
+        Рисует накопленные с прошлого кадра изменения и строку
+        состояния в виртуальный экран (noutrefresh). На терминал
+        кадр выводит curses.doupdate.
+
+        Args:
+            window: окно из библиотеки curses, где отрисовывать
+        """
+        if self._state_changed:
+            self._apply_state(window)
+        if self._hud_text != self._hud:
+            # Строка состояния перерисовывается, только если изменилась
+            self._paint_line(window, 0, self._hud_text, curses.A_BOLD)
+            self._hud = self._hud_text
+            position = self._state[1] if self._state else self.layout.base
+            self._move_cursor(window, position)
+        window.noutrefresh()
+
+    def _apply_state(self, window: curses.window) -> None:
+        """
+        Рисует последнее запомненное состояние.
+        Перерисовываются только изменившиеся ячейки: прошлый символ
+        под курсором, новый символ под курсором, строка с отметкой
+        корректности и счетчик. Когда курсор уходит за нижнюю видимую
+        строку, текст прокручивается и пройденные строки забываются.
+
+        Args:
+            window: окно из библиотеки curses, где отрисовывать
+        """
+        if not self._painted:
+            self._paint_text(window)
+
+        is_correct, current_position, correct_keystrokes = self._state
+        self._state_changed = False
         color_pair = 2 if is_correct else 1
+        layout = self.layout
+        rows = self._text_rows(window)
+
+        cursor_line = layout.line_of(current_position)
+        if cursor_line >= self.top_line + rows:
+            # Прокручиваем так, чтобы курсор оказался в верхней трети
+            self.top_line = max(cursor_line - rows // 3, 0)
+            layout.drop_lines_before(self.top_line)
+            self._paint_text(window)
+        elif self._drawn_end < layout.base + len(layout):
+            # Дошло продолжение текста - дорисовываем видимые строки
+            line = layout.line_of(self._drawn_end)
+            if line < self.top_line + rows:
+                self._paint_lines(window, line, self.top_line + rows)
+
+        # Прошлый подсвеченный символ возвращаем к обычному виду
+        if self._highlighted is not None:
+            self._paint_cell(window, self._highlighted, 0)
+            self._highlighted = None
+
+        if 0 < current_position <= layout.end:
+            self._paint_cell(window, current_position - 1,
+                             curses.color_pair(color_pair))
+            self._highlighted = current_position - 1
+
         feedback = "CORRECT" if is_correct else "INCORRECT"
-        window.addstr(self.index_column + 2,
-                      0, feedback, curses.color_pair(color_pair))
+        if (feedback, color_pair) != self._feedback:
+            self._paint_line(window, self.index_column + 2, feedback,
+                             curses.color_pair(color_pair))
+            self._feedback = (feedback, color_pair)
 
-        max_y, max_x = window.getmaxyx()
+        if correct_keystrokes != self._counter:
+            self._paint_line(window, self.index_column + 4,
+                             f"Correct keystrokes: {correct_keystrokes}")
+            self._counter = correct_keystrokes
 
-        for char in passed_text:
-            if char == '\n' or x + 2 >= max_x:
-                y += 1
-                x = 0
-                if char == '\n':
-                    continue
+        self._move_cursor(window, current_position)
 
-            window.addch(y, x, char)
-            window.refresh()
-            x += 1
-
-        if current_char:
-            if current_char == '\n' or x + 2 >= max_x:
-                y += 1
-                x = 0
-                if current_char != '\n':
-                    window.addch(y, x,
-                                 current_char, curses.color_pair(color_pair))
-                    x += 1
-            else:
-                window.addch(y, x, current_char, curses.color_pair(color_pair))
-                x += 1
-
-        window.move(y, x)
-        for i in range(y, self.index_column + 4):
-            window.clrtoeol()
+    def _get_layout(self, window: curses.window) -> TextLayout:
+        """
+        Возвращает раскладку текста, при первом вызове строит её
+        под текущую ширину окна.
+        """
+        if self.layout is None:
+            _, max_x = window.getmaxyx()
+            self.layout = TextLayout(self.exercise_text, max_x, 1, 0,
+                                     complete=self.complete)
+        return self.layout
 
-        for char in remaining_text:
-            if char == '\n' or x + 2 >= max_x:
-                y += 1
-                x = 0
-                window.move(y, 0)
-            if char != '\n':
-                window.addch(y, x, char)
-                x += 1
+    @staticmethod
+    def _text_rows(window: curses.window) -> int:
+        """Возвращает число строк экрана, отводимых под текст."""
+        max_y, _ = window.getmaxyx()
+        return max(max_y - 1 - FOOTER_ROWS, 1)
 
-        window.addstr(self.index_column + 4, 0,
-                      f"Correct keystrokes: {correct_keystrokes}")
+    def _paint_text(self, window: curses.window) -> None:
+        """
+        Полностью отрисовывает текст упражнения по раскладке.
+        Дальше экран обновляется только по изменившимся ячейкам.
 
-        window.refresh()
+        Args:
+            window: окно из библиотеки curses, где отрисовывать
+        """
+        window.erase()
+        layout = self._get_layout(window)
+        rows = self._text_rows(window)
+        self.index_column = self._paint_lines(window, self.top_line,
+                                              self.top_line + rows)
+        if not layout.complete:
+            # Текст ещё дочитывается - место под него резервируем сразу
+            self.index_column = layout.start_y + rows
+        self._painted = True
+        self._highlighted = None
+        self._feedback = None
+        self._hud = None
+        self._counter = None
+        self._move_cursor(window, layout.base)
+
+    def _paint_lines(self, window: curses.window, first: int,
+                     last: int) -> int:
+        """
+        Рисует строки текста [first, last) на их местах на экране.
+        Returns:
+            Первая строка экрана после видимого текста
+        """
+        layout = self.layout
+        last = min(last, layout.line_count)
+        for line in range(max(first, layout.first_line), last):
+            y, x = layout.cell(layout.line_starts[line - layout.first_line])
+            try:
+                window.addstr(y - self.top_line, x, layout.line_text(line))
+            except curses.error:
+                pass
+        self._drawn_end = layout.base + len(layout)
+        return layout.start_y + max(last - self.top_line, 0)
+
+    def _paint_cell(self, window: curses.window, position: int,
+                    attr: int) -> None:
+        """Перерисовывает ячейку одного символа текста."""
+        layout = self.layout
+        if position < layout.base or position >= layout.end:
+            return
+        char = layout.char(position)
+        if char == '\n':
+            return
+        y, x = layout.cell(position)
+        line = y - layout.start_y
+        if not self.top_line <= line < self.top_line + self._text_rows(window):
+            return
+        try:
+            window.addch(y - self.top_line, x, char, attr)
+        except curses.error:
+            pass
+
+    def _paint_line(self, window: curses.window, y: int,
+                    text: str, attr: int = 0) -> None:
+        """Перерисовывает служебную строку целиком."""
+        try:
+            window.move(y, 0)
+            window.clrtoeol()
+            window.addstr(y, 0, text, attr)
+        except curses.error:
+            pass
+
+    def _move_cursor(self, window: curses.window, position: int) -> None:
+        """Ставит курсор на символ, который нужно набрать следующим."""
+        y, x = self.layout.cell(position)
+        try:
+            window.move(y - self.top_line, x)
+        except curses.error:
+            pass
 
     def show_results_screen(self, window: curses.window, chars_typed: int,
                             total_chars: int, correct_keystrokes: int,
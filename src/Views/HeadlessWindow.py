@@ -0,0 +1,181 @@
+import curses
+from contextlib import contextmanager
+
+from src.Models.Clock import VirtualClock
+
+
+class ScriptExhausted(Exception):
+    """Ввод ждут без таймаута, а сценарий ввода закончился."""
+
+
+class ScriptedInput:
+    """
+    Сценарий ввода для окна без терминала. Событие - пара
+    (задержка, клавиша):
+        задержка - секунды после предыдущего выданного события,
+            или None, если событие ждет экрана, который блокирующе
+            ждет ввода (стартовый экран, меню), и во время упражнения
+            с таймаутом не выдается;
+        клавиша - код для getch или bytes-строка для getstr.
+    События читаются из итератора по одному, поэтому сценарий может
+    строиться на ходу (например, по тексту очередного упражнения).
+    """
+
+    def __init__(self, events, clock: VirtualClock):
+        """
+        Args:
+            events: Итерируемые события (задержка, клавиша)
+            clock: Виртуальные часы, которые сдвигает ожидание ввода
+        """
+        self.clock = clock
+        self.delivered = 0
+        self._events = iter(events)
+        self._next = None
+        self._last = clock.now
+
+    def _peek(self):
+        if self._next is None:
+            self._next = next(self._events, None)
+        return self._next
+
+    def read(self, timeout_ms: int):
+        """
+        Выдает следующее событие, если оно наступает в пределах
+        таймаута, иначе сдвигает часы на таймаут и возвращает None.
+        Args:
+            timeout_ms: Таймаут в миллисекундах, отрицательный - ждать
+                без ограничения
+        Raises:
+            ScriptExhausted: если ждать без таймаута больше нечего
+        """
+        event = self._peek()
+        blocking = timeout_ms < 0
+        if event is None or (event[0] is None and not blocking):
+            if blocking:
+                raise ScriptExhausted()
+            self.clock.advance(timeout_ms / 1000)
+            return None
+
+        delay, key = event
+        if delay is not None:
+            due = self._last + delay
+            if not blocking and due > self.clock.now + timeout_ms / 1000:
+                self.clock.advance(timeout_ms / 1000)
+                return None
+            self.clock.advance_to(due)
+
+        self._next = None
+        self._last = self.clock.now
+        self.delivered += 1
+        return key
+
+    def flush(self) -> None:
+        """Отбрасывает уже наступившие нажатия (как curses.flushinp)."""
+        while True:
+            event = self._peek()
+            if event is None or event[0] is None or \
+                    self._last + event[0] > self.clock.now:
+                return
+            self._next = None
+
+
+class HeadlessWindow:
+    """
+    Окно с интерфейсом curses.window без терминала: вывод только
+    считается, ввод берется из сценария, ожидание ввода двигает
+    виртуальные часы.
+    """
+
+    def __init__(self, script: ScriptedInput,
+                 height: int = 40, width: int = 120):
+        """
+        Args:
+            script: Сценарий ввода
+            height: Высота окна
+            width: Ширина окна
+        """
+        self.script = script
+        self.height = height
+        self.width = width
+        self.encoding = "utf-8"
+        self.writes = 0
+        self.refreshes = 0
+        self._timeout_ms = -1
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    def addch(self, *args):
+        self.writes += 1
+
+    def addstr(self, *args):
+        self.writes += 1
+
+    def refresh(self):
+        self.refreshes += 1
+
+    def noutrefresh(self):
+        self.refreshes += 1
+
+    def move(self, y, x):
+        pass
+
+    def clrtoeol(self):
+        pass
+
+    def erase(self):
+        pass
+
+    def clear(self):
+        pass
+
+    def keypad(self, flag):
+        pass
+
+    def nodelay(self, flag):
+        self._timeout_ms = 0 if flag else -1
+
+    def timeout(self, delay):
+        self._timeout_ms = delay
+
+    def getch(self):
+        key = self.script.read(self._timeout_ms)
+        if key is None:
+            return -1
+        if isinstance(key, bytes):
+            raise ValueError(f"getch() got a line from the script: {key}")
+        return key
+
+    def getstr(self, *args):
+        line = self.script.read(-1)
+        if not isinstance(line, bytes):
+            raise ValueError(f"getstr() got a key from the script: {line}")
+        return line
+
+
+@contextmanager
+def headless_curses(window: HeadlessWindow):
+    """
+    Подменяет на время воспроизведения функции модуля curses, которые
+    требуют инициализированного терминала (цвета, doupdate, flushinp).
+    Args:
+        window: Окно без терминала, чей сценарий сбрасывает flushinp
+    """
+    replacements = {
+        "start_color": lambda: None,
+        "init_pair": lambda *args: None,
+        "color_pair": lambda number: 0,
+        "doupdate": lambda: None,
+        "flushinp": window.script.flush,
+        "echo": lambda: None,
+        "noecho": lambda: None,
+        "curs_set": lambda visibility: None,
+    }
+    originals = {name: getattr(curses, name) for name in replacements}
+    for name, function in replacements.items():
+        setattr(curses, name, function)
+    try:
+        yield window
+    finally:
+        for name, function in originals.items():
+            setattr(curses, name, function)
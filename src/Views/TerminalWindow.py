@@ -0,0 +1,249 @@
+import codecs
+import curses
+import os
+import select
+import termios
+import tty
+from collections import deque
+
+# Цвета curses 0-7 совпадают по порядку с цветами ANSI
+ANSI_DEFAULT_FOREGROUND = 39
+ANSI_DEFAULT_BACKGROUND = 49
+# Размер окна, если терминал его не сообщает
+DEFAULT_SIZE = (24, 80)
+READ_SIZE = 4096
+# Сколько ждать продолжения escape-последовательности, прежде чем
+# считать Escape отдельной клавишей (как ESCDELAY в curses)
+ESCAPE_DELAY = 0.05
+
+
+class TerminalWindow:
+    """
+    Окно с интерфейсом curses.window на другом терминале (tty или pty).
+    В модуле curses нет newterm, поэтому второй экран ведется без
+    curses: вывод - последовательности ANSI, ввод - терминал в режиме
+    cbreak через termios. Вывод копится в буфере и уходит на терминал
+    одной записью при refresh/noutrefresh, как кадр curses.
+    Окно поддерживает то подмножество curses.window, которое нужно
+    представлениям упражнения и турнира, и fileno() для selectors.
+    Если терминал закрыли, окно помечается hung_up: getch отдает -1,
+    вывод отбрасывается.
+    """
+
+    def __init__(self, path: str = None, fd: int = None):
+        """
+        Args:
+            path: Путь к терминалу, например /dev/pts/3
+            fd: Уже открытый дескриптор терминала (вместо path)
+        """
+        self.path = path
+        self.fd = os.open(path, os.O_RDWR | os.O_NOCTTY) \
+            if fd is None else fd
+        self._owns_fd = fd is None
+        self.encoding = "utf-8"
+        self._saved_mode = termios.tcgetattr(self.fd)
+        tty.setcbreak(self.fd)
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self._keys = deque()
+        # Начало escape-последовательности, остаток которой еще не пришел
+        self._escape = ""
+        self._buffer = []
+        self._timeout_ms = -1
+        self._colors = {}
+        self.hung_up = False
+        # Альтернативный экран, как у curses
+        self._buffer.append("\x1b[?1049h\x1b[2J\x1b[H")
+        self._flush()
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def close(self) -> None:
+        """Возвращает терминалу обычный экран и режим ввода."""
+        self._buffer.append("\x1b[0m\x1b[?1049l")
+        self._flush()
+        try:
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self._saved_mode)
+        except termios.error:
+            # Терминал уже закрыт, возвращать режим некому
+            pass
+        if self._owns_fd:
+            os.close(self.fd)
+
+    def getmaxyx(self):
+        try:
+            size = os.get_terminal_size(self.fd)
+        except OSError:
+            return DEFAULT_SIZE
+        return size.lines or DEFAULT_SIZE[0], \
+            size.columns or DEFAULT_SIZE[1]
+
+    def _sgr(self, attr: int) -> str:
+        """Последовательность ANSI для атрибутов curses."""
+        codes = ["0"]
+        if attr & curses.A_BOLD:
+            codes.append("1")
+        if attr & curses.A_UNDERLINE:
+            codes.append("4")
+        if attr & curses.A_REVERSE:
+            codes.append("7")
+        pair = (attr & curses.A_COLOR) >> 8
+        if pair:
+            if pair not in self._colors:
+                try:
+                    foreground, background = curses.pair_content(pair)
+                except curses.error:
+                    foreground = background = -1
+                foreground = 30 + foreground if foreground >= 0 \
+                    else ANSI_DEFAULT_FOREGROUND
+                background = 40 + background if background >= 0 \
+                    else ANSI_DEFAULT_BACKGROUND
+                self._colors[pair] = f"{foreground};{background}"
+            codes.append(self._colors[pair])
+        return f"\x1b[{';'.join(codes)}m"
+
+    def _write_at(self, y: int, x: int, text: str, attr: int) -> None:
+        height, width = self.getmaxyx()
+        if not 0 <= y < height or not 0 <= x < width:
+            raise curses.error("addstr() returned ERR")
+        self._buffer.append(f"\x1b[{y + 1};{x + 1}H{self._sgr(attr)}")
+        # Как в curses: что не влезло в строку, переносится на следующую
+        while len(text) > width - x:
+            self._buffer.append(text[:width - x])
+            text = text[width - x:]
+            y, x = y + 1, 0
+            if y >= height:
+                raise curses.error("addstr() returned ERR")
+            self._buffer.append(f"\x1b[{y + 1};1H")
+        self._buffer.append(text)
+
+    def addstr(self, *args):
+        """addstr(y, x, строка[, атрибуты]) как у curses.window."""
+        y, x, text, *attr = args
+        self._write_at(y, x, text, attr[0] if attr else 0)
+
+    def addch(self, *args):
+        """addch(y, x, символ[, атрибуты]) как у curses.window."""
+        y, x, char, *attr = args
+        if isinstance(char, int):
+            char = chr(char)
+        self._write_at(y, x, char, attr[0] if attr else 0)
+
+    def move(self, y, x):
+        self._buffer.append(f"\x1b[{y + 1};{x + 1}H")
+
+    def clrtoeol(self):
+        self._buffer.append("\x1b[0m\x1b[K")
+
+    def erase(self):
+        self._buffer.append("\x1b[0m\x1b[2J\x1b[H")
+
+    def clear(self):
+        self.erase()
+
+    def _flush(self) -> None:
+        data = "".join(self._buffer).encode(self.encoding, "replace")
+        self._buffer.clear()
+        if self.hung_up:
+            return
+        try:
+            while data:
+                written = os.write(self.fd, data)
+                data = data[written:]
+        except OSError:
+            self.hung_up = True
+
+    def refresh(self):
+        self._flush()
+
+    def noutrefresh(self):
+        self._flush()
+
+    def keypad(self, flag):
+        pass
+
+    def nodelay(self, flag):
+        self._timeout_ms = 0 if flag else -1
+
+    def timeout(self, delay):
+        self._timeout_ms = delay
+
+    def flushinp(self) -> None:
+        """Отбрасывает непрочитанный ввод (как curses.flushinp)."""
+        if not self.hung_up:
+            termios.tcflush(self.fd, termios.TCIFLUSH)
+        self._keys.clear()
+        self._escape = ""
+
+    def _read_keys(self) -> None:
+        """Читает пришедшие байты и раскладывает их на коды клавиш."""
+        try:
+            data = os.read(self.fd, READ_SIZE)
+        except OSError:
+            data = b""
+        if not data:
+            # Терминал закрыт: у pty после закрытия ведущей стороны
+            # select сообщает о готовности, а чтение дает EIO
+            self.hung_up = True
+            self._escape = ""
+            return
+        text = self._escape + self._decoder.decode(data)
+        self._escape = ""
+        index = 0
+        while index < len(text):
+            char = text[index]
+            if char == "\x1b":
+                end = self._escape_end(text, index)
+                if end is None:
+                    # Последовательность пришла не целиком: остаток
+                    # придет следующим чтением
+                    self._escape = text[index:]
+                    return
+                if end > index + 1:
+                    # Стрелки и функциональные клавиши упражнению не нужны
+                    index = end
+                    continue
+            self._keys.append(ord(char))
+            index += 1
+
+    @staticmethod
+    def _escape_end(text: str, index: int):
+        """
+        Конец escape-последовательности, которая начинается в text[index].
+        Returns:
+            Индекс после последовательности (index + 1 - одиночный
+            Escape) или None, если текст кончился раньше нее
+        """
+        start = index + 1
+        if start == len(text):
+            return None
+        if text[start] not in "[O":
+            return start
+        end = start + 1
+        while end < len(text) and not "\x40" <= text[end] <= "\x7e":
+            end += 1
+        return end + 1 if end < len(text) else None
+
+    def _wait_input(self, timeout) -> bool:
+        """Ждет ввода не дольше timeout секунд (None - без ограничения)."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        return bool(ready)
+
+    def getch(self):
+        if self.hung_up:
+            return self._keys.popleft() if self._keys else -1
+        if not self._keys and not self._escape:
+            timeout = None if self._timeout_ms < 0 \
+                else self._timeout_ms / 1000
+            if self._wait_input(timeout):
+                self._read_keys()
+        while self._escape and not self._keys:
+            # Остаток последовательности ждем не дольше ESCAPE_DELAY,
+            # иначе это был одиночный Escape
+            if self._wait_input(ESCAPE_DELAY):
+                self._read_keys()
+            else:
+                if self._escape == "\x1b":
+                    self._keys.append(27)
+                self._escape = ""
+        return self._keys.popleft() if self._keys else -1
@@ -0,0 +1,209 @@
+import curses
+import unicodedata
+from array import array
+
+
+def char_width(char: str) -> int:
+    """Возвращает ширину символа в ячейках терминала."""
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+
+class TextLayout:
+    """
+    Раскладка текста по ячейкам экрана с переносом по словам.
+    Строится один раз для пары (текст, ширина окна) и хранит
+    для каждого символа его ячейку (y, x) и начала строк.
+
+    Для потокового текста раскладку можно дополнять (extend)
+    и отбрасывать пройденные строки (drop_lines_before). Позиции
+    символов и номера строк при этом остаются абсолютными:
+    base - позиция первого хранимого символа, first_line - номер
+    первой хранимой строки.
+    """
+
+    def __init__(self, text: str, width: int,
+                 start_y: int = 0, start_x: int = 0,
+                 base: int = 0, complete: bool = True):
+        """
+        Args:
+            text: Текст для раскладки
+            width: Ширина окна в ячейках
+            start_y: Строка, с которой начинается текст
+            start_x: Столбец, с которого начинается первая строка
+            base: Абсолютная позиция первого символа текста
+            complete: Весь ли текст передан (иначе последнее слово
+                ждет продолжения в extend)
+        """
+        self.text = ""
+        self.width = width
+        self.start_y = start_y
+        self.start_x = start_x
+        self.base = base
+        self.first_line = 0
+        self.complete = False
+        self._ys = array("i")
+        self._xs = array("i")
+        self.line_starts = array("q", [base])
+        self._y, self._x = start_y, start_x
+        self.extend(text, complete)
+
+    def extend(self, text: str, complete: bool = True) -> None:
+        """
+        Дописывает текст в конец и раскладывает его.
+        Args:
+            text: Продолжение текста
+            complete: Является ли это продолжение последним
+        """
+        self.text += text
+        self.complete = complete
+        self._build()
+
+    def drop_lines_before(self, line: int) -> None:
+        """
+        Отбрасывает строки раскладки до строки line (не включая её).
+        Args:
+            line: Абсолютный номер первой строки, которую нужно оставить
+        """
+        count = line - self.first_line
+        if count <= 0:
+            return
+        count = min(count, len(self.line_starts) - 1)
+        cut = self.line_starts[count] - self.base
+        self.text = self.text[cut:]
+        del self._ys[:cut]
+        del self._xs[:cut]
+        del self.line_starts[:count]
+        self.base += cut
+        self.first_line += count
+
+    def _build(self) -> None:
+        """Раскладывает ещё не разложенную часть текста за один проход."""
+        text = self.text
+        limit = max(self.width - 1, 1)
+        ys, xs = self._ys, self._xs
+        y, x = self._y, self._x
+        i, n = len(ys), len(text)
+
+        while i < n:
+            char = text[i]
+            if char == "\n":
+                ys.append(y)
+                xs.append(x)
+                y, x = y + 1, 0
+                i += 1
+                self.line_starts.append(self.base + i)
+                continue
+
+            if char == " ":
+                if x > limit:
+                    y, x = y + 1, 0
+                    self.line_starts.append(self.base + i)
+                ys.append(y)
+                xs.append(x)
+                x += 1
+                i += 1
+                continue
+
+            # Слово целиком переносим, если оно не помещается в строку
+            end, word_width = i, 0
+            while end < n and text[end] not in " \n":
+                word_width += char_width(text[end])
+                end += 1
+            if end == n and not self.complete:
+                # Конец слова ещё не пришел, раскладываем его позже
+                break
+            if x > 0 and x + word_width > limit:
+                y, x = y + 1, 0
+                self.line_starts.append(self.base + i)
+
+            for k in range(i, end):
+                width = char_width(text[k])
+                # Слишком длинное слово режем по символам
+                if x > 0 and x + width > limit:
+                    y, x = y + 1, 0
+                    self.line_starts.append(self.base + k)
+                ys.append(y)
+                xs.append(x)
+                x += width
+            i = end
+
+        self._y, self._x = y, x
+
+    def __len__(self) -> int:
+        return len(self._ys)
+
+    @property
+    def end(self) -> int:
+        """Абсолютная позиция после последнего хранимого символа."""
+        return self.base + len(self.text)
+
+    @property
+    def line_count(self) -> int:
+        """Количество строк раскладки, включая отброшенные."""
+        return self.first_line + len(self.line_starts) if self.text or \
+            self.first_line else 0
+
+    @property
+    def end_y(self) -> int:
+        """Первая свободная строка после текста."""
+        return self.start_y + self.line_count
+
+    def cell(self, position: int) -> tuple[int, int]:
+        """
+        Возвращает ячейку (y, x) символа по его абсолютной позиции.
+        Для позиции за концом разложенного текста возвращает ячейку
+        после последнего символа.
+        """
+        index = position - self.base
+        if index >= len(self._ys):
+            return self._y, self._x
+        return self._ys[index], self._xs[index]
+
+    def char(self, position: int) -> str:
+        """Возвращает символ по абсолютной позиции."""
+        return self.text[position - self.base]
+
+    def line_of(self, position: int) -> int:
+        """Возвращает абсолютный номер строки символа."""
+        return self.cell(position)[0] - self.start_y
+
+    def line_text(self, line: int) -> str:
+        """Возвращает текст строки раскладки без перевода строки."""
+        index = line - self.first_line
+        start = self.line_starts[index] - self.base
+        if index + 1 < len(self.line_starts):
+            end = self.line_starts[index + 1] - self.base
+        else:
+            end = len(self._ys)
+        return self.text[start:end].rstrip("\n")
+
+    def draw(self, window: curses.window, max_lines: int = None,
+             color_pair: int = 0, top: int = None) -> int:
+        """
+        Выводит текст по раскладке, не выходя за нижний край окна.
+
+        Args:
+            window: Окно curses
+            max_lines: Максимальное число строк для вывода
+            color_pair: Цветовая пара curses
+            top: Абсолютный номер строки, которая выводится первой
+                (по умолчанию первая хранимая строка)
+
+        Returns:
+            Первая строка после выведенного текста
+        """
+        if top is None:
+            top = self.first_line
+        max_y, _ = window.getmaxyx()
+        lines = min(self.line_count - top, max_y - 1 - self.start_y)
+        if max_lines is not None:
+            lines = min(lines, max_lines)
+
+        for line in range(top, top + max(lines, 0)):
+            y, x = self.cell(self.line_starts[line - self.first_line])
+            try:
+                window.addstr(y - top, x, self.line_text(line), color_pair)
+            except curses.error:
+                pass
+
+        return self.start_y + max(lines, 0)
@@ -107,3 +107,59 @@ class TournamentView(IView):
             return True
         else:
             return False
+
+    def choose_format(self, stdscr: curses.window) -> int:
+        """
+        Выбор формата турнира.
+        :param stdscr: окно приложения
+        :return: 0 - на выбывание, 1 - швейцарская система,
+            2 - круговой турнир
+        """
+        stdscr.clear()
+        stdscr.addstr(0, 0, "Выберите формат турнира")
+        stdscr.addstr(1, 0, "1 - на выбывание")
+        stdscr.addstr(2, 0, "2 - швейцарская система")
+        stdscr.addstr(3, 0, "3 - круговой")
+        stdscr.move(4, 0)
+        stdscr.refresh()
+        key = stdscr.getch()
+        if key == ord("2"):
+            return 1
+        if key == ord("3"):
+            return 2
+        return 0
+
+    def show_standings(self, window: curses.window, round_number: int,
+                       rows: list):
+        """
+        Таблица очков после тура: столько первых мест, сколько
+        помещается в окне.
+        :param window: окно приложения
+        :param round_number: сыгранный тур
+        :param rows: строки (место, игрок, очки, победы, поражения,
+            Бухгольц)
+        """
+        max_y, max_x = window.getmaxyx()
+        window.clear()
+        window.addstr(0, 0, f"Таблица после раунда {round_number}",
+                      curses.color_pair(3))
+        window.addstr(1, 0, "Место  Игрок               Очки  В-П  Бух.")
+        for y_pos, (place, gamer, points, wins, losses, buchholz) in \
+                enumerate(rows[:max(0, max_y - 3)], 2):
+            line = f"{place:>5}  {gamer.decode('utf-8')[:18]:<18}  " \
+                   f"{points:>4}  {wins}-{losses}  {buchholz:>4}"
+            window.addstr(y_pos, 0, line[:max_x - 1], curses.color_pair(
+                2 if place == 1 else 1))
+        window.refresh()
+
+    def show_message(self, window: curses.window, lines: list):
+        """
+        Экран с сообщением сетевого турнира.
+        :param window: окно приложения
+        :param lines: строки сообщения, первая выделяется
+        """
+        window.clear()
+        for y_pos, line in enumerate(lines):
+            window.addstr(y_pos, 0, line, curses.color_pair(
+                3 if y_pos == 0 else 1))
+        window.refresh()
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+
+from src.Models.ExerciseBundle import (BUNDLE_NAME, MAGIC, ExerciseBundle,
+                                       build_bundle, write_bundle)
+from src.Models.ExerciseModel import ExerciseModel, exercise_cache
+from src.Models.SettingsModel import Difficulty, Level, Language
+
+
+class TestExerciseBundle(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.exercises_path = self.tmp_dir.name + "/"
+        exercise_cache.clear()
+
+    def tearDown(self):
+        exercise_cache.clear()
+        self.tmp_dir.cleanup()
+
+    def make_model(self, level):
+        model = ExerciseModel(Difficulty.simple, level, Language.Russian)
+        model.exercises_path = self.exercises_path
+        return model
+
+    def test_write_and_read(self):
+        path = os.path.join(self.tmp_dir.name, "test.bundle")
+        write_bundle(path, {(0, 0, 0): "first", (2, 1, 5): "второй 第二"})
+
+        bundle = ExerciseBundle(path)
+        self.assertEqual(len(bundle), 2)
+        self.assertEqual(bundle.get(2, 1, 5), "второй 第二")
+        self.assertEqual(bundle.get(0, 0, 0), "first")
+        self.assertIsNone(bundle.get(1, 1, 1))
+        bundle.close()
+
+    def test_model_reads_bundle_and_falls_back_to_files(self):
+        model = self.make_model(Level.l1)
+        with open(model._get_file_path(), "w", encoding="utf-8") as f:
+            f.write("текст из пакета")
+        build_bundle(self.exercises_path)
+        # Пакет читается вместо отдельного файла
+        os.remove(model._get_file_path())
+        self.assertEqual(model.get_exercise_text(), "текст из пакета")
+
+        # Текста нет в пакете - читается отдельный файл
+        loose = self.make_model(Level.l2)
+        with open(loose._get_file_path(), "w", encoding="utf-8") as f:
+            f.write("отдельный файл")
+        self.assertEqual(loose.get_exercise_text(), "отдельный файл")
+
+    def test_corrupt_bundle_falls_back_to_files(self):
+        model = self.make_model(Level.l1)
+        with open(model._get_file_path(), "w", encoding="utf-8") as f:
+            f.write("отдельный файл")
+        bundle_path = self.exercises_path + BUNDLE_NAME
+
+        for data in (b"", b"NOTABNDL" + bytes(8), MAGIC + b"\x05"):
+            with self.subTest(data=data):
+                exercise_cache.clear()
+                with open(bundle_path, "wb") as f:
+                    f.write(data)
+                self.assertEqual(model.get_exercise_text(), "отдельный файл")
+                self.assertEqual("".join(model.iter_exercise_text()),
+                                 "отдельный файл")
+
+    def test_iter_text_splits_multibyte_chars(self):
+        path = os.path.join(self.tmp_dir.name, "test.bundle")
+        text = "второй 第二 " * 50
+        write_bundle(path, {(2, 1, 5): text})
+
+        bundle = ExerciseBundle(path)
+        # Части по 5 байт режут многобайтовые символы посередине
+        chunks = list(bundle.iter_text(2, 1, 5, chunk_size=5))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), text)
+        self.assertIsNone(bundle.iter_text(0, 0, 0))
+        bundle.close()
+
+    def test_model_streams_loose_file(self):
+        model = self.make_model(Level.big_text)
+        with open(model._get_file_path(), "w", encoding="utf-8") as f:
+            f.write("большой текст " * 100)
+
+        chunks = list(model.iter_exercise_text(chunk_size=64))
+        self.assertEqual(len(chunks[0]), 64)
+        self.assertEqual("".join(chunks), "большой текст " * 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
-from src.Models.ExerciseModel import ExerciseModel
+from src.Models.ExerciseModel import ExerciseModel, exercise_cache
 from src.Models.SettingsModel import Difficulty, Level, Language
 
 
@@ -18,6 +21,48 @@ class TestExerciseModel(unittest.TestCase):
         expected_path = "exercises/English_simple_l1.txt"
         self.assertEqual(self.exercise._get_file_path(), expected_path)
 
+    def test_exercise_text_cache(self):
+        """Тестирование кэша текстов упражнений"""
+        exercise_cache.clear()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.exercise.exercises_path = tmp_dir + "/"
+            path = self.exercise._get_file_path()
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("first")
+
+            self.assertEqual(self.exercise.get_exercise_text(), "first")
+            with patch("builtins.open") as mock_open:
+                self.assertEqual(self.exercise.get_exercise_text(), "first")
+                mock_open.assert_not_called()
+
+            # Файл изменился - запись кэша сбрасывается
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("second text")
+            self.assertEqual(self.exercise.get_exercise_text(), "second text")
+
+            info = exercise_cache.cache_info()
+            self.assertEqual((info["hits"], info["misses"]), (1, 2))
+        exercise_cache.clear()
+
+    def test_cache_separates_exercise_directories(self):
+        """Одинаковые по времени и размеру файлы разных каталогов"""
+        exercise_cache.clear()
+        texts = []
+        with tempfile.TemporaryDirectory() as first_dir, \
+                tempfile.TemporaryDirectory() as second_dir:
+            for tmp_dir, text in ((first_dir, "first"),
+                                  (second_dir, "other")):
+                model = ExerciseModel(Difficulty(0), Level(0), Language(0))
+                model.exercises_path = tmp_dir + "/"
+                with open(model._get_file_path(), "w",
+                          encoding="utf-8") as f:
+                    f.write(text)
+                os.utime(model._get_file_path(),
+                         ns=(1_700_000_000_000_000_000,) * 2)
+                texts.append(model.get_exercise_text())
+        self.assertEqual(texts, ["first", "other"])
+        exercise_cache.clear()
+
 
 if __name__ == '__main__':
     unittest.main()
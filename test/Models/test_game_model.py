@@ -1,3 +1,4 @@
+import statistics
 import unittest
 from src.Models.GameModel import GameModel
 
@@ -18,3 +19,98 @@ class TestGameModel(unittest.TestCase):
         # Проверяем неправильное нажатие
         wrong_ans = self.test_game_model.process_keystroke("-")
         self.assertEqual(False, wrong_ans)
+
+    def test_keystroke_log(self):
+        self.test_game_model.set_exercise_text(self.test_text)
+        self.test_game_model.process_keystroke("T", 1_000)
+        self.test_game_model.process_keystroke("-", 251_000)
+        log = self.test_game_model.keystroke_log
+
+        self.assertEqual(len(log), 2)
+        self.assertEqual(log[0], (1_000, 0, True))
+        self.assertEqual(log[1], (251_000, 1, False))
+        self.assertEqual(list(log.intervals_ns()), [250_000])
+        with log.timestamps() as timestamps:
+            self.assertTrue(timestamps.readonly)
+            self.assertEqual(timestamps.tolist(), [1_000, 251_000])
+
+        # Журнал можно дополнять после освобождения представления
+        self.test_game_model.process_keystroke("s")
+        self.assertEqual(len(log), 3)
+
+        self.test_game_model.set_exercise_text(self.test_text)
+        self.assertEqual(len(log), 0)
+
+    def test_process_keystrokes_batch(self):
+        self.test_game_model.set_exercise_text(self.test_text)
+        is_correct = self.test_game_model.process_keystrokes(
+            [("T", 100), ("e", 200), ("x", 300)])
+
+        self.assertFalse(is_correct)
+        self.assertEqual(self.test_game_model.current_position, 3)
+        self.assertEqual(self.test_game_model.correct_keystrokes, 2)
+        self.assertEqual([entry[0] for entry in
+                          self.test_game_model.keystroke_log],
+                         [100, 200, 300])
+
+    def test_batch_stops_at_end_of_text(self):
+        self.test_game_model.set_exercise_text("ab")
+        is_correct = self.test_game_model.process_keystrokes(
+            [("a", 100), ("b", 200), ("c", 300), ("d", 400)])
+
+        # Лишние нажатия после конца текста не портят результат
+        self.assertTrue(is_correct)
+        self.assertTrue(self.test_game_model.is_completed)
+        self.assertEqual(len(self.test_game_model.keystroke_log), 2)
+
+    def test_live_metrics(self):
+        text = "abcdefghij" * 5
+        self.test_game_model.set_exercise_text(text)
+        intervals = [100_000_000 + 7_000_000 * (i % 5) for i in range(49)]
+        timestamp = 0
+        for i, char in enumerate(text):
+            self.test_game_model.process_keystroke(
+                char if i % 10 else "-", timestamp)
+            if i < len(intervals):
+                timestamp += intervals[i]
+
+        live = self.test_game_model.live_metrics
+        self.assertAlmostEqual(live.accuracy, 90.0)
+        self.assertAlmostEqual(live.mean_interval,
+                               statistics.fmean(intervals) / 1e9)
+        self.assertAlmostEqual(live.interval_variance,
+                               statistics.pvariance(intervals) / 1e18)
+        # Скорость по последним 20 интервалам
+        span = sum(intervals[-20:]) / 1e9
+        self.assertAlmostEqual(live.wpm, (20 / 5) / (span / 60))
+
+        self.test_game_model.set_exercise_text(text)
+        self.assertEqual(live.keystrokes, 0)
+        self.assertEqual(live.wpm, 0)
+
+    def test_stream_keeps_window_of_text(self):
+        read = []
+
+        def chunks():
+            for i in range(1000):
+                read.append(i)
+                yield "abcdefghij"
+
+        self.test_game_model.set_exercise_stream(chunks(), window_size=50)
+        # Первое нажатие принимается до того, как прочитан весь текст
+        self.assertTrue(self.test_game_model.process_keystroke("a"))
+        self.assertLess(len(read), 10)
+
+        for i in range(1, 9_000):
+            self.test_game_model.process_keystroke("abcdefghij"[i % 10])
+        self.assertEqual(self.test_game_model.correct_keystrokes, 9_000)
+        self.assertLessEqual(len(self.test_game_model.text), 120)
+        self.assertGreater(self.test_game_model.text_offset, 8_000)
+        self.assertFalse(self.test_game_model.is_completed)
+        self.assertEqual(self.test_game_model.keystroke_log[-1][1], 8_999)
+
+        for i in range(9_000, 10_000):
+            self.test_game_model.process_keystroke("abcdefghij"[i % 10])
+        self.assertTrue(self.test_game_model.is_text_loaded)
+        self.assertTrue(self.test_game_model.is_completed)
+        self.assertEqual(self.test_game_model.total_chars, 10_000)
@@ -0,0 +1,79 @@
+import os
+import random
+import tempfile
+import unittest
+
+from src.Models.LatencyModel import (LatencyHistogram, LatencyModel,
+                                     LatencyRecorder)
+from src.Models.SettingsModel import Difficulty, Language, Level
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_buckets_cover_values(self):
+        for value in list(range(100)) + [1_000, 16_667, 123_456, 10 ** 9]:
+            index = LatencyHistogram.bucket_of(value)
+            self.assertLessEqual(value, LatencyHistogram.bucket_limit(index))
+            if index:
+                self.assertGreater(value,
+                                   LatencyHistogram.bucket_limit(index - 1))
+
+    def test_percentiles_within_bucket_error(self):
+        rnd = random.Random(0)
+        values = [rnd.randint(100, 50_000) for _ in range(10_000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.add(value * 1000)
+
+        values.sort()
+        for percent in (50, 95, 99):
+            exact = values[-(-len(values) * percent // 100) - 1]
+            self.assertGreaterEqual(histogram.percentile(percent), exact)
+            self.assertLessEqual(histogram.percentile(percent),
+                                 exact * 17 / 16)
+        self.assertEqual(histogram.percentile(100), values[-1])
+        self.assertEqual(histogram.to_dict()["max_us"], values[-1])
+
+    def test_empty(self):
+        self.assertEqual(LatencyHistogram().to_dict(),
+                         {"count": 0, "p50_us": 0, "p95_us": 0,
+                          "p99_us": 0, "max_us": 0, "mean_us": 0})
+
+
+class TestLatencyRecorder(unittest.TestCase):
+
+    def test_stages(self):
+        recorder = LatencyRecorder()
+        recorder.processed([("a", 1_000_000), ("b", 2_000_000)], 3_000_000)
+        recorder.processed([("c", 4_000_000)], 4_500_000)
+        recorder.painted(10_000_000)
+        recorder.processed([("d", 11_000_000)], 11_000_000)
+
+        summary = recorder.to_dict()
+        self.assertEqual(summary["process"]["count"], 4)
+        self.assertEqual(summary["process"]["max_us"], 2_000)
+        self.assertEqual(summary["paint"]["count"], 3)
+        self.assertEqual(summary["paint"]["max_us"], 7_000)
+        self.assertEqual(summary["total"]["max_us"], 9_000)
+        self.assertEqual(summary["unpainted"], 1)
+
+
+class TestLatencyModel(unittest.TestCase):
+
+    def test_sessions_are_appended(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model = LatencyModel(os.path.join(tmp_dir, "latency.jsonl"))
+            self.assertEqual(model.get_last_sessions(), [])
+
+            for frame_rate in (30, 60):
+                model.save_session(Language.English, Difficulty.simple,
+                                   Level.l2, LatencyRecorder(), frame_rate)
+
+            sessions = model.get_last_sessions()
+            self.assertEqual([s["frame_rate"] for s in sessions], [60, 30])
+            self.assertEqual(sessions[0]["level"], "Level 1")
+            self.assertEqual(sessions[0]["total"]["count"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+
+from src.Models import Metrics
+from src.Models.KeystrokeLog import KeystrokeLog, KeystrokeLogView
+from src.Models.Metrics import compute_metrics
+
+
+def make_timestamps(count, seed=0):
+    rnd = random.Random(seed)
+    timestamps, now = [], 1_000_000
+    for _ in range(count):
+        now += rnd.randint(50_000_000, 400_000_000)
+        timestamps.append(now)
+    return timestamps
+
+
+class TestMetrics(unittest.TestCase):
+
+    def test_matches_presenter_formula(self):
+        timestamps = make_timestamps(200)
+        elapsed_time = 60.0
+        metrics = compute_metrics(timestamps, 200, 190, elapsed_time,
+                                  use_numpy=False)
+
+        # Формула, которой раньше считал GamePresenter
+        intervals = [(b - a) / 1e9
+                     for a, b in zip(timestamps, timestamps[1:])]
+        ideal_interval = elapsed_time / 200
+        avg_deviation = sum(abs(i - ideal_interval)
+                            for i in intervals) / len(intervals)
+        score = 100 - min(100, int(avg_deviation / ideal_interval * 100))
+
+        self.assertEqual(metrics["uniformity_score"], score)
+        self.assertAlmostEqual(metrics["avg_deviation"], avg_deviation)
+        self.assertAlmostEqual(metrics["wpm"], 40.0)
+        self.assertAlmostEqual(metrics["accuracy"], 95.0)
+        # 199 интервалов - медиана ровно сотый по порядку
+        self.assertAlmostEqual(metrics["interval_p50"],
+                               sorted(intervals)[99])
+
+    def test_burst_speed(self):
+        # 10 быстрых нажатий по 0.1 с среди медленных по 1 с
+        timestamps = [0]
+        for interval in [1.0] * 5 + [0.1] * 10 + [1.0] * 5:
+            timestamps.append(timestamps[-1] + int(interval * 1e9))
+        metrics = compute_metrics(timestamps, 20, 20, 20.0,
+                                  use_numpy=False)
+        self.assertAlmostEqual(metrics["burst_wpm"], 120.0)
+
+    def test_empty_session(self):
+        metrics = compute_metrics([], 0, 0, 5.0)
+        self.assertEqual(metrics["wpm"], 0)
+        self.assertEqual(metrics["uniformity_score"], 100)
+        self.assertEqual(metrics["burst_wpm"], 0)
+
+    def test_reads_keystroke_log_view(self):
+        log = KeystrokeLog()
+        for position, timestamp in enumerate(make_timestamps(50)):
+            log.append(timestamp, position, True)
+
+        with KeystrokeLogView(log).timestamps() as timestamps:
+            metrics = compute_metrics(timestamps, 50, 50, 10.0,
+                                      use_numpy=False)
+        self.assertEqual(metrics, compute_metrics(
+            [entry[0] for entry in KeystrokeLogView(log)], 50, 50, 10.0,
+            use_numpy=False))
+
+    @unittest.skipIf(Metrics.np is None, "NumPy is not installed")
+    def test_numpy_matches_fallback(self):
+        log = KeystrokeLog()
+        for position, timestamp in enumerate(make_timestamps(1000)):
+            log.append(timestamp, position, position % 7 != 0)
+
+        with KeystrokeLogView(log).timestamps() as timestamps:
+            fast = compute_metrics(timestamps, 1000, 857, 240.0,
+                                   use_numpy=True)
+            slow = compute_metrics(timestamps, 1000, 857, 240.0,
+                                   use_numpy=False)
+        for key in slow:
+            self.assertAlmostEqual(fast[key], slow[key], places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.Models.RecordJournal import RecordJournal
+
+
+def make_record(wpm):
+    return {"timestamp": f"2025-05-06 00:00:{wpm:02d}",
+            "language": "English", "difficulty": "simple",
+            "level": "Level 0", "wpm": wpm}
+
+
+class TestRecordJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.records_file = os.path.join(self.tmp_dir.name, "records.json")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def open_journal(self, compact_after=500):
+        journal = RecordJournal(self.records_file, compact_after)
+        return journal, journal.load()
+
+    def test_migrates_legacy_file_once(self):
+        with open(self.records_file, "w", encoding="utf-8") as f:
+            json.dump({"records": [make_record(1), make_record(2)]}, f,
+                      indent=4)
+
+        journal, records = self.open_journal()
+        self.assertEqual(records, [make_record(1), make_record(2)])
+        journal.append(make_record(3))
+        journal.close()
+
+        # Старый файл больше не читается: история в снимке и журнале
+        with open(self.records_file, "w", encoding="utf-8") as f:
+            json.dump({"records": []}, f)
+        journal, records = self.open_journal()
+        self.assertEqual(records,
+                         [make_record(1), make_record(2), make_record(3)])
+        journal.close()
+
+    def test_drops_torn_last_line(self):
+        journal, _ = self.open_journal()
+        journal.append(make_record(1))
+        journal.close()
+        with open(journal.journal_file, "a", encoding="utf-8") as f:
+            f.write('{"wpm": 2, "acc')
+
+        journal, records = self.open_journal()
+        journal.append(make_record(3))
+        journal.close()
+
+        journal, records = self.open_journal()
+        self.assertEqual(records, [make_record(1), make_record(3)])
+        journal.close()
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        journal, _ = self.open_journal(compact_after=3)
+        for wpm in range(7):
+            journal.append(make_record(wpm))
+        journal.close()
+
+        journal, records = self.open_journal(compact_after=3)
+        journal.close()
+        self.assertEqual([r["wpm"] for r in records], list(range(7)))
+        self.assertFalse(os.path.exists(journal.folding_file))
+        with open(journal.snapshot_file, encoding="utf-8") as f:
+            self.assertGreaterEqual(len(f.readlines()), 4)
+
+    def test_finishes_interrupted_compaction(self):
+        journal, _ = self.open_journal()
+        journal.append(make_record(1))
+        journal.append(make_record(2))
+        journal.close()
+        # Падение сразу после того, как журнал был отложен на сжатие
+        os.replace(journal.journal_file, journal.folding_file)
+        with open(journal.journal_file, "w", encoding="utf-8") as f:
+            f.write('{"generation": 1}\n' +
+                    json.dumps(make_record(3)) + '\n')
+
+        journal, records = self.open_journal()
+        journal.close()
+        self.assertEqual(records,
+                         [make_record(1), make_record(2), make_record(3)])
+        self.assertFalse(os.path.exists(journal.folding_file))
+
+    def test_read_tail(self):
+        journal, _ = self.open_journal()
+        for wpm in range(5):
+            journal.append(make_record(wpm))
+        journal.compact(background=False)
+        journal.append(make_record(5))
+        with open(journal.journal_file, "a", encoding="utf-8") as f:
+            f.write('{"wpm": 6, "acc')
+
+        self.assertEqual([r["wpm"] for r in journal.read_tail(3)], [3, 4, 5])
+        self.assertEqual([r["wpm"] for r in journal.read_tail(10)],
+                         list(range(6)))
+        journal.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
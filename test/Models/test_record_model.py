@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.Models.RecordModel import RecordModel
+from src.Models.SettingsModel import Language, Difficulty, Level
+
+
+class TestRecordModel(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.records_file = os.path.join(self.tmp_dir.name, "records.json")
+        self.model = RecordModel(self.records_file)
+
+    def tearDown(self):
+        self.model.close()
+        self.tmp_dir.cleanup()
+
+    def save(self, model, level, chars_typed):
+        model.save_record(Language.English, Difficulty.simple, level,
+                          chars_typed, 100, chars_typed, 6.0)
+
+    def test_best_record_index(self):
+        self.save(self.model, Level.l1, 30)
+        self.save(self.model, Level.l1, 50)
+        self.save(self.model, Level.l2, 40)
+
+        best = self.model.get_best_record(Language.English,
+                                          Difficulty.simple, Level.l1)
+        self.assertEqual(best["chars_typed"], 50)
+        self.assertEqual(self.model.get_best_record()["chars_typed"], 50)
+        self.assertIsNone(self.model.get_best_record(Language.Russian))
+
+        # Индекс строится заново при загрузке
+        self.model.close()
+        self.model = RecordModel(self.records_file)
+        best = self.model.get_best_record(level=Level.l2)
+        self.assertEqual(best["chars_typed"], 40)
+
+    def test_lazy_loading(self):
+        for chars_typed in range(10, 50):
+            self.save(self.model, Level.l1, chars_typed)
+        self.model.storage.compact(background=False)
+        self.save(self.model, Level.l3, 5)
+        self.model.close()
+
+        self.model = RecordModel(self.records_file)
+        last = self.model.get_last_records(3)
+        best = self.model.get_best_record(Language.English,
+                                          Difficulty.simple, Level.l1)
+        # Ни последние записи, ни лучший результат не требуют
+        # разбора всей истории
+        self.assertIsNone(self.model._records)
+
+        self.assertEqual([r["chars_typed"] for r in last], [48, 49, 5])
+        self.assertEqual(best["chars_typed"], 49)
+        self.assertEqual(last, self.model.records["records"][-3:])
+        self.assertEqual(len(self.model.records["records"]), 41)
+
+    def test_constructor_creates_no_files(self):
+        with open(self.records_file, "w", encoding="utf-8") as f:
+            json.dump({"records": [RecordModel.make_record(
+                Language.English, Difficulty.simple, Level.l1,
+                20, 100, 20, 6.0)]}, f)
+        self.model.close()
+
+        self.model = RecordModel(self.records_file)
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["records.json"])
+        # История прежнего формата читается без переноса
+        self.assertEqual(self.model.get_last_records()[0]["chars_typed"], 20)
+        self.assertEqual(self.model.get_best_record()["chars_typed"], 20)
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["records.json"])
+
+        # Перенос - при первой записи
+        self.save(self.model, Level.l1, 30)
+        self.assertTrue(os.path.exists(self.model.storage.snapshot_file))
+        self.assertEqual(len(self.model.records["records"]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
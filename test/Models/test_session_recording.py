@@ -0,0 +1,121 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.Models.GameModel import GameModel
+from src.Models.KeystrokeLog import KeystrokeLog, KeystrokeLogView
+from src.Models.SessionRecording import (SessionHeader, SessionStore,
+                                         iter_events, read_header,
+                                         text_hash, write_session)
+from src.Models.SettingsModel import Difficulty, Language, Level
+
+TEXT = "Съешь же ещё этих мягких булок 我家住在山边 " * 10
+
+
+def make_log(count, seed=0):
+    rnd = random.Random(seed)
+    log, now = KeystrokeLog(), 5_000_000_000
+    for position in range(count):
+        now += rnd.randint(50_000, 900_000_000)
+        char = TEXT[position % len(TEXT)]
+        is_correct = rnd.random() < 0.9
+        log.append(now, position, is_correct,
+                   ord(char if is_correct else "#"))
+    return KeystrokeLogView(log)
+
+
+class TestSessionRecording(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, "session.trec")
+
+    def make_header(self, compressed=True):
+        digest, length = text_hash(TEXT)
+        return SessionHeader(Language.Russian, Difficulty.hard,
+                             Level.big_text, digest, length, 600, 0,
+                             started_at=1_700_000_000,
+                             compressed=compressed)
+
+    def test_round_trip(self):
+        log = make_log(3_000)
+        start = log[0][0]
+        for compressed in (True, False):
+            write_session(self.path, self.make_header(compressed), log)
+
+            header = read_header(self.path)
+            self.assertEqual(header.language, Language.Russian)
+            self.assertEqual(header.level, Level.big_text)
+            self.assertEqual(header.events, 3_000)
+            self.assertEqual(header.started_at, 1_700_000_000)
+            self.assertEqual(header.text_hash, text_hash(TEXT)[0])
+            self.assertEqual(header.compressed, compressed)
+
+            # Маленькие блоки режут varint на границах блоков
+            events = list(iter_events(self.path, chunk_size=7))
+            self.assertEqual(len(events), 3_000)
+            for (time_ns, position, key, is_correct), entry in \
+                    zip(events, log):
+                self.assertLessEqual(abs(time_ns - (entry[0] - start)), 500)
+                self.assertEqual(position, entry[1])
+                self.assertEqual(is_correct, entry[2])
+            with log.keys() as keys:
+                self.assertEqual([event[2] for event in events],
+                                 [chr(key) for key in keys])
+
+    def test_session_is_compact(self):
+        # Десять минут набора на 100 WPM
+        log = make_log(5_000)
+        size = write_session(self.path, self.make_header(), log)
+        as_json = json.dumps([{"timestamp": t, "position": p, "correct": c}
+                              for t, p, c in log])
+        self.assertLess(size, 5_000 * 5)
+        self.assertLess(size * 10, len(as_json))
+
+    def test_timestamps_going_back(self):
+        log = KeystrokeLog()
+        for timestamp_ns in (1_000_000, 900_000, 3_000_000):
+            log.append(timestamp_ns, len(log), True, ord("a"))
+        write_session(self.path, self.make_header(), KeystrokeLogView(log))
+        self.assertEqual([event[0] for event in iter_events(self.path)],
+                         [0, -100_000, 2_000_000])
+
+    def test_text_hash_by_chunks(self):
+        chunks = [TEXT[i:i + 17] for i in range(0, len(TEXT), 17)]
+        self.assertEqual(text_hash(iter(chunks)), text_hash(TEXT))
+        self.assertEqual(text_hash(TEXT)[1], len(TEXT))
+
+    def test_not_a_recording(self):
+        with open(self.path, "wb") as f:
+            f.write(b"{\"records\": []}")
+        with self.assertRaises(ValueError):
+            read_header(self.path)
+
+    def test_store_keeps_every_session(self):
+        game_model = GameModel()
+        game_model.set_exercise_text("abc")
+        game_model.process_keystrokes([("a", 100_000), ("x", 300_000)])
+
+        # Тильда в пути каталога не путается с номером записи
+        directory = os.path.join(self.tmp_dir.name, "~", "sessions")
+        store = SessionStore(directory)
+        with patch("time.time", return_value=1_700_000_000):
+            paths = [store.save(Language.English, Difficulty.simple,
+                                Level.l1, game_model.text,
+                                game_model.keystroke_log, 30)
+                     for _ in range(12)]
+
+        self.assertEqual(len(set(paths)), 12)
+        self.assertTrue(all(os.path.dirname(path) == directory
+                            for path in paths))
+        self.assertEqual(store.list_sessions(), paths)
+        self.assertEqual(list(iter_events(paths[1])),
+                         [(0, 0, "a", True), (200_000, 1, "x", False)])
+
+
+if __name__ == '__main__':
+    unittest.main()
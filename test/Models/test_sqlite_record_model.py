@@ -0,0 +1,76 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.Models.RecordModel import RecordModel
+from src.Models.SettingsModel import Language, Difficulty, Level
+from src.Models.SqliteRecordModel import SqliteRecordModel
+
+
+class TestSqliteRecordModel(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.records_file = os.path.join(self.tmp_dir.name, "records.json")
+        self.json_model = RecordModel(self.records_file)
+        self.sqlite_model = SqliteRecordModel(
+            os.path.join(self.tmp_dir.name, "records.sqlite3"),
+            self.records_file)
+
+    def tearDown(self):
+        self.json_model.close()
+        self.sqlite_model.close()
+        self.tmp_dir.cleanup()
+
+    def save(self, timestamp, level, chars_typed, time_elapsed):
+        with patch("src.Models.RecordModel.datetime") as mock_datetime:
+            mock_datetime.now.return_value.strftime.return_value = timestamp
+            for model in (self.json_model, self.sqlite_model):
+                model.save_record(Language.English, Difficulty.simple, level,
+                                  chars_typed, 50, chars_typed - 1,
+                                  time_elapsed)
+
+    def test_same_answers_as_json_model(self):
+        self.save("2025-05-06 00:00:03", Level.l1, 20, 5.0)
+        self.save("2025-05-06 00:00:01", Level.l1, 40, 5.0)
+        self.save("2025-05-06 00:00:02", Level.l2, 30, 5.0)
+        self.save("2025-05-06 00:00:02", Level.l2, 30, 5.0)
+
+        for count in (1, 2, 10):
+            self.assertEqual(self.sqlite_model.get_last_records(count),
+                             self.json_model.get_last_records(count))
+        for filters in ({}, {"level": Level.l2},
+                        {"language": Language.English, "level": Level.l1},
+                        {"language": Language.Russian}):
+            self.assertEqual(self.sqlite_model.get_best_record(**filters),
+                             self.json_model.get_best_record(**filters))
+        self.assertEqual(self.sqlite_model.records, self.json_model.records)
+
+    def test_imports_json_history_into_empty_database(self):
+        self.save("2025-05-06 00:00:01", Level.l1, 40, 5.0)
+        self.json_model.close()
+
+        imported = SqliteRecordModel(
+            os.path.join(self.tmp_dir.name, "imported.sqlite3"),
+            self.records_file)
+        self.assertEqual(imported.records, self.json_model.records)
+        imported.close()
+
+    def test_imports_legacy_file_without_creating_journal(self):
+        record = RecordModel.make_record(Language.English, Difficulty.simple,
+                                         Level.l1, 40, 50, 39, 5.0)
+        with open(self.records_file, "w", encoding="utf-8") as f:
+            json.dump({"records": [record]}, f)
+
+        imported = SqliteRecordModel(
+            os.path.join(self.tmp_dir.name, "imported.sqlite3"),
+            self.records_file)
+        self.assertEqual(imported.records, {"records": [record]})
+        imported.close()
+        self.assertFalse(any(name.endswith(".jsonl")
+                             for name in os.listdir(self.tmp_dir.name)))
+
+
+if __name__ == '__main__':
+    unittest.main()
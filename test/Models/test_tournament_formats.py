@@ -0,0 +1,127 @@
+import random
+import unittest
+
+from src.Models.SettingsModel import Level, SettingsModel
+from src.Models.tournament.RoundRobinTable import RoundRobinTable
+from src.Models.tournament.Standings import Standings
+from src.Models.tournament.SwissTable import SwissTable
+from src.Models.tournament.TournamentFormats import TournamentFormat, \
+    create_table
+from src.Models.tournament.TournamentTable import TournamentTable
+
+
+def play(table, rng):
+    """Играет все туры таблицы со случайными победителями."""
+    pairs = []
+    for round_number in range(1, table.rounds + 1):
+        for match, gamer1, gamer2 in table.round_matches(round_number):
+            pairs.append(frozenset((gamer1, gamer2)))
+            table.set_winner(match, rng.choice((gamer1, gamer2)))
+    return pairs
+
+
+class TestStandings(unittest.TestCase):
+
+    def test_incremental_groups(self):
+        standings = Standings(["a", "b", "c", "d"])
+        standings.record_match(0, 1)
+        standings.record_match(2, 3)
+        self.assertEqual(standings.groups, {0: {1, 3}, 1: {0, 2}})
+        standings.record_match(2, 0)
+        standings.record_bye(1)
+        self.assertEqual(standings.top_score, 2)
+        self.assertEqual(standings.leaders(), ["c"])
+        self.assertEqual(standings.groups, {0: {3}, 1: {0, 1}, 2: {2}})
+        self.assertTrue(standings.have_played(0, 2))
+        self.assertFalse(standings.have_played(0, 3))
+
+    def test_ranking_tiebreak(self):
+        standings = Standings(["a", "b", "c", "d"])
+        standings.record_match(0, 1)
+        standings.record_match(2, 3)
+        standings.record_match(1, 3)
+        # У a, b и c по очку, но соперник c не набрал ни одного
+        self.assertEqual(standings.ranking(), [0, 1, 2, 3])
+        self.assertEqual(standings.table(limit=1), [(1, "a", 1, 1, 0, 1)])
+
+
+class TestSwissTable(unittest.TestCase):
+
+    def test_no_rematches(self):
+        for count in (2, 4, 7, 16, 33, 100):
+            table = SwissTable(list(range(count)), SettingsModel(), False)
+            pairs = play(table, random.Random(count))
+            self.assertEqual(len(pairs), len(set(pairs)))
+            self.assertEqual(len(pairs), table.rounds * (count // 2))
+            self.assertEqual(table.byes, table.rounds * (count % 2))
+            self.assertEqual(table.rematches, 0)
+            self.assertEqual(table.winner,
+                             table.standings.ranking()[0])
+
+    def test_pairs_by_score(self):
+        table = SwissTable(list("abcdefgh"), SettingsModel(), False)
+        for match, gamer1, _ in table.round_matches(1):
+            table.set_winner(match, gamer1)
+        second = table.round_matches(2)
+        # Победители первого тура играют между собой
+        winners = set(table.standings.leaders())
+        self.assertEqual({gamer1 for _, gamer1, _ in second[:2]} |
+                         {gamer2 for _, _, gamer2 in second[:2]}, winners)
+
+    def test_bye_goes_to_different_players(self):
+        table = SwissTable(list("abcde"), SettingsModel(), False)
+        play(table, random.Random(0))
+        self.assertEqual(sorted(table.standings.byes), [0, 0, 1, 1, 1])
+
+    def test_round_order(self):
+        table = SwissTable(list("abcd"), SettingsModel(), False)
+        table.round_matches(1)
+        with self.assertRaises(ValueError):
+            table.round_matches(2)
+        with self.assertRaises(ValueError):
+            table.set_winner(0, "z")
+        self.assertIsNone(table.winner)
+
+
+class TestRoundRobinTable(unittest.TestCase):
+
+    def test_everyone_meets_everyone(self):
+        for count in (2, 3, 6, 9):
+            gamers = list(range(count))
+            table = RoundRobinTable(gamers, SettingsModel(), False)
+            pairs = play(table, random.Random(count))
+            self.assertEqual(len(pairs), count * (count - 1) // 2)
+            self.assertEqual(len(set(pairs)), len(pairs))
+            self.assertEqual(sum(table.standings.points), len(pairs))
+            self.assertIsNotNone(table.winner)
+
+    def test_rounds_and_byes(self):
+        table = RoundRobinTable(list("abcde"), SettingsModel(), False)
+        self.assertEqual((table.rounds, table.byes), (5, 5))
+        for round_number in range(1, 6):
+            self.assertEqual(len(table.round_matches(round_number)), 2)
+
+    def test_played_match_is_not_repeated(self):
+        table = RoundRobinTable(list("abcd"), SettingsModel(), False)
+        match, gamer1, _ = table.round_matches(1)[0]
+        table.set_winner(match, gamer1)
+        self.assertEqual(len(table.round_matches(1)), 1)
+        with self.assertRaises(ValueError):
+            table.set_winner(match, gamer1)
+
+
+class TestTournamentFormats(unittest.TestCase):
+
+    def test_create_table(self):
+        settings = SettingsModel()
+        self.assertIsInstance(create_table(TournamentFormat.knockout,
+                                           ["a", "b"], settings, False),
+                              TournamentTable)
+        self.assertIsInstance(create_table(TournamentFormat.swiss,
+                                           ["a", "b"], settings, True),
+                              SwissTable)
+        self.assertEqual(settings.current_level, Level.big_text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from src.Models.TypistProfile import TypistProfile
+from src.Models.tournament.Protocol import read_message, send_message
+from src.Models.tournament.TournamentBot import play_bot
+from src.Models.tournament.TournamentFormats import TournamentFormat
+from src.Models.tournament.TournamentServer import TournamentServer
+
+
+def quiet(*args):
+    pass
+
+
+async def run_with_bots(server: TournamentServer, profiles: dict,
+                        time_scale: float = 0.0):
+    """Турнир на сервере, все места которого заняли боты."""
+    port = await server.start()
+    bots = [play_bot(name, profile, port=port, time_scale=time_scale)
+            for name, profile in profiles.items()]
+    report, *winners = await asyncio.gather(server.run(), *bots)
+    return report, winners
+
+
+class TestTournamentServer(unittest.TestCase):
+
+    def test_knockout_with_bots(self):
+        profiles = {f"bot{i}": TypistProfile(wpm=20 + i, accuracy=0.9)
+                    for i in range(4)}
+        profiles["fast"] = TypistProfile(wpm=150, accuracy=1)
+        del profiles["bot0"]
+        server = TournamentServer(4, exercise_seconds=3, port=0, log=quiet)
+        report, winners = asyncio.run(run_with_bots(server, profiles))
+        self.assertEqual(report["winner"], "fast")
+        self.assertEqual(winners, ["fast"] * 4)
+        self.assertEqual((report["rounds"], report["matches"]), (2, 3))
+        self.assertEqual(report["best_result"]["accuracy"], 100)
+
+    def test_swiss_with_bots(self):
+        profiles = {f"bot{i}": TypistProfile() for i in range(5)}
+        server = TournamentServer(5, exercise_seconds=2, port=0,
+                                  tournament_format=TournamentFormat.swiss,
+                                  log=quiet)
+        report, _ = asyncio.run(run_with_bots(server, profiles))
+        self.assertEqual((report["rounds"], report["matches"]), (3, 6))
+        self.assertEqual(server.table.byes, 3)
+
+    def test_round_takes_one_exercise(self):
+        seconds = 0.5
+        profiles = {f"bot{i}": TypistProfile() for i in range(8)}
+        server = TournamentServer(8, exercise_seconds=seconds, port=0,
+                                  log=quiet)
+        started = time.perf_counter()
+        report, _ = asyncio.run(run_with_bots(server, profiles,
+                                              time_scale=1.0))
+        wall = time.perf_counter() - started
+        # Подряд было бы 7 матчей по 2 упражнения
+        self.assertLess(wall, 7 * 2 * seconds / 2)
+        for round_seconds in report["round_seconds"]:
+            self.assertGreaterEqual(round_seconds, seconds * 0.9)
+
+    def test_rejects_players_over_capacity(self):
+        async def scenario():
+            server = TournamentServer(4, exercise_seconds=1, port=0,
+                                      log=quiet)
+            port = await server.start()
+            # Все подключаются одновременно, одному места не хватит
+            return await asyncio.wait_for(asyncio.gather(
+                server.run(), *(play_bot(f"bot{i}", port=port, time_scale=0)
+                                for i in range(5))), 10)
+
+        async def slow_send(writer, message):
+            # Отправка уступает цикл, как при медленном соединении:
+            # пока идет рассылка joined, подключаются остальные
+            await asyncio.sleep(0.01)
+            return await send_message(writer, message)
+
+        with patch("src.Models.tournament.TournamentServer.send_message",
+                   slow_send):
+            report, *winners = asyncio.run(scenario())
+        self.assertEqual(winners.count(None), 1)
+        self.assertEqual(winners.count(report["winner"]), 4)
+        self.assertEqual(report["matches"], 3)
+
+    def test_forfeit_and_rejected_names(self):
+        async def scenario():
+            server = TournamentServer(2, exercise_seconds=1, port=0,
+                                      start_grace=5, log=quiet)
+            port = await server.start()
+            tournament = asyncio.create_task(server.run())
+            bot = asyncio.create_task(play_bot("bot", port=port,
+                                               time_scale=0))
+            await asyncio.sleep(0.1)
+
+            # Имя занято - сервер отвечает ошибкой
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await send_message(writer, {"type": "join", "name": "bot"})
+            self.assertEqual((await read_message(reader))["type"], "error")
+            writer.close()
+
+            # Игрок принимает матч, но отключается без результата
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await send_message(writer, {"type": "join", "name": "quitter"})
+            while (await read_message(reader))["type"] != "match":
+                pass
+            writer.close()
+            return await tournament, await bot
+
+        started = time.perf_counter()
+        report, winner = asyncio.run(scenario())
+        # Отключение засчитывается сразу, без ожидания таймаута
+        self.assertLess(time.perf_counter() - started, 5)
+        self.assertEqual(report["winner"], "bot")
+        self.assertEqual(winner, "bot")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import random
+import unittest
+
+from src.Models.TypistProfile import ProfileDistribution, TypistProfile
+from src.Models.tournament.MatchRules import match_winner, \
+    update_best_result
+from src.Models.tournament.TournamentSimulator import make_profiles, \
+    simulate_exercise, simulate_tournament
+from src.Models.tournament.TournamentFormats import TournamentFormat
+
+
+class TestMatchRules(unittest.TestCase):
+
+    def test_match_winner(self):
+        def result(correct, uniformity):
+            return {"correct_keystrokes": correct,
+                    "uniformity_score": uniformity}
+
+        self.assertEqual(match_winner("a", result(10, 0),
+                                      "b", result(9, 90)), "a")
+        self.assertEqual(match_winner("a", result(9, 90),
+                                      "b", result(10, 0)), "b")
+        self.assertEqual(match_winner("a", result(10, 80),
+                                      "b", result(10, 70)), "a")
+        self.assertEqual(match_winner("a", result(10, 70),
+                                      "b", result(10, 70)), "b")
+
+    def test_update_best_result(self):
+        best_results = {"a": {}}
+        update_best_result(best_results, "a", {"correct_keystrokes": 5})
+        update_best_result(best_results, "a", {"correct_keystrokes": 3})
+        update_best_result(best_results, "b", {"correct_keystrokes": 1})
+        self.assertEqual(best_results, {"a": {"correct_keystrokes": 5},
+                                        "b": {"correct_keystrokes": 1}})
+
+
+class TestTournamentSimulator(unittest.TestCase):
+
+    def test_make_profiles(self):
+        profiles = make_profiles(
+            12, ProfileDistribution(wpm=(80, 0), accuracy=(2, 0)))
+        self.assertEqual(list(profiles)[:2], [b"player01", b"player02"])
+        self.assertEqual(len(profiles), 12)
+        for profile in profiles.values():
+            self.assertEqual(profile.wpm, 80)
+            self.assertEqual(profile.accuracy, 1.0)
+
+    def test_simulate_exercise(self):
+        text = "abcde " * 200
+        result, keys = simulate_exercise(
+            text, TypistProfile(wpm=60, accuracy=1), 10, random.Random(0))
+        self.assertEqual(result["correct_keystrokes"], keys)
+        self.assertAlmostEqual(result["elapsed_time"], 10)
+        self.assertAlmostEqual(result["wpm"], 60, delta=6)
+
+    def test_byes_for_odd_brackets(self):
+        report = simulate_tournament(make_profiles(7), exercise_seconds=2,
+                                     workers=1)
+        self.assertEqual(report["rounds"], 3)
+        self.assertEqual(report["matches"], 6)
+        self.assertEqual(report["byes"], 1)
+        self.assertIn(report["winner"], make_profiles(7))
+
+    def test_strongest_typist_wins(self):
+        profiles = make_profiles(
+            16, ProfileDistribution(wpm=(20, 2), accuracy=(0.9, 0)))
+        profiles[b"player11"] = TypistProfile(wpm=120, accuracy=1)
+        report = simulate_tournament(profiles, big_text=True,
+                                     exercise_seconds=5, workers=1)
+        self.assertEqual(report["winner"], b"player11")
+        self.assertEqual(report["best_result"]["accuracy"], 100)
+        self.assertGreater(report["matches_per_second_per_core"], 0)
+
+    def test_same_bracket_with_process_pool(self):
+        profiles = make_profiles(40)
+        inline = simulate_tournament(profiles, exercise_seconds=3,
+                                     workers=1)
+        pooled = simulate_tournament(profiles, exercise_seconds=3,
+                                     workers=2)
+        self.assertEqual(pooled["winner"], inline["winner"])
+        self.assertEqual(pooled["keystrokes"], inline["keystrokes"])
+        self.assertEqual(pooled["workers"], 2)
+
+    def test_swiss_format(self):
+        profiles = make_profiles(
+            9, ProfileDistribution(wpm=(20, 2), accuracy=(0.9, 0)))
+        profiles[b"player4"] = TypistProfile(wpm=120, accuracy=1)
+        report = simulate_tournament(profiles, big_text=True,
+                                     exercise_seconds=3, workers=1,
+                                     tournament_format=TournamentFormat.swiss)
+        self.assertEqual(report["rounds"], 4)
+        self.assertEqual(report["matches"], 16)
+        self.assertEqual(report["byes"], 4)
+        self.assertEqual(report["winner"], b"player4")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -33,3 +33,62 @@ class TestTournamentTable(unittest.TestCase):
         self.assertEqual(test_tournament_table.table,
                          {"player1": player1, "player2": player2,
                           "player3": player3, "player4": player4})
+
+    def test_bracket_with_byes(self):
+        gamers = [f"player{i}" for i in range(1, 7)]
+        table = TournamentTable(gamers, self.test_settings_model, False)
+        self.assertEqual(table.rounds, 3)
+        self.assertEqual(table.byes, 2)
+        self.assertEqual(table.table["player1"].tour, 3)
+
+        bye_gamers = [gamer for gamer, node in table.table.items()
+                      if node.opponent is None]
+        self.assertEqual(len(bye_gamers), 2)
+        self.assertEqual(len(table.round_matches(1)), 2)
+
+        played = 0
+        for round_number in range(1, table.rounds + 1):
+            for match, gamer1, gamer2 in table.round_matches(round_number):
+                table.set_winner(match, min(gamer1, gamer2))
+                played += 1
+        self.assertEqual(played, 5)
+        self.assertEqual(table.winner, "player1")
+
+        # Пропуск в первом туре в путь не попадает
+        path = table.path("player1")
+        self.assertEqual([entry[0] for entry in path], [2, 3])
+        self.assertTrue(all(won for _, _, won in path))
+        self.assertFalse(table.path("player6")[-1][2])
+
+    def test_winner_must_play_the_match(self):
+        table = TournamentTable(self.test_gamers, self.test_settings_model,
+                                False)
+        match, gamer1, gamer2 = table.round_matches(1)[0]
+        with self.assertRaises(ValueError):
+            table.set_winner(match, "player3")
+        table.set_winner(match, gamer2)
+        self.assertEqual(table.path(gamer1), [(1, gamer2, False)])
+        # Соперник по финалу еще не известен
+        self.assertEqual(table.path(gamer2),
+                         [(1, gamer1, True), (2, None, None)])
+
+    def test_large_bracket(self):
+        gamers = list(range(10_000))
+        table = TournamentTable(gamers, self.test_settings_model, False)
+        self.assertEqual(table.rounds, 14)
+        self.assertEqual(table.byes, 16_384 - 10_000)
+        self.assertEqual(len(table.round_matches(1)), 10_000 - 8_192)
+        # Пропуски разнесены: в половинах, четвертях и восьмушках
+        # сетки их число отличается не больше чем на один
+        first = table.size // 2
+        byes = [table.slots[node] != -1 for node in range(first, 2 * first)]
+        for parts in (2, 4, 8):
+            size = first // parts
+            counts = [sum(byes[i:i + size]) for i in range(0, first, size)]
+            self.assertLessEqual(max(counts) - min(counts), 1)
+
+    def test_single_gamer(self):
+        table = TournamentTable(["solo"], self.test_settings_model, False)
+        self.assertEqual(table.rounds, 0)
+        self.assertEqual(table.winner, "solo")
+        self.assertEqual(table.path("solo"), [])
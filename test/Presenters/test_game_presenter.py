@@ -37,9 +37,17 @@ class TestGamePresenter(unittest.TestCase):
 
             return is_correct
 
-        # Используем MagicMock для process_keystroke
+        def mock_process_keystrokes(keys) -> bool:
+            is_correct = False
+            for key_char, timestamp_ns in keys:
+                is_correct = mock_process_keystroke(key_char)
+            return is_correct
+
+        # Используем MagicMock для process_keystroke(s)
         self.mock_game_model.process_keystroke = MagicMock(
             side_effect=mock_process_keystroke)
+        self.mock_game_model.process_keystrokes = MagicMock(
+            side_effect=mock_process_keystrokes)
 
         self.presenter = GamePresenter(
             stdscr=self.mock_stdscr,
@@ -50,13 +58,14 @@ class TestGamePresenter(unittest.TestCase):
 
         self.presenter.exercise_view = MagicMock()
 
-    @patch('time.time')
-    def test_run_exercise_basic_flow(self, mock_time):
+    @patch('curses.doupdate')
+    @patch('time.monotonic')
+    def test_run_exercise_basic_flow(self, mock_time, mock_doupdate):
         test_text = "test text"
         self.mock_game_model.text = test_text
 
         # Симулируем ввод символов
-        input_chars = [ord(c) for c in test_text] + [-1]
+        input_chars = [ord(c) for c in test_text] + [-1] * 5
         self.mock_stdscr.getch.side_effect = input_chars
 
         # Эмулируем время
@@ -70,7 +79,58 @@ class TestGamePresenter(unittest.TestCase):
             self.mock_stdscr)
         self.presenter.exercise_view.show_exercise.assert_called_once_with(
             self.mock_stdscr)
-        self.mock_stdscr.nodelay.assert_called_once_with(True)
+        # Ввод ждется блокирующе, самое большее до обновления
+        # строки состояния
+        self.mock_stdscr.nodelay.assert_not_called()
+        self.mock_stdscr.timeout.assert_any_call(500)
+        self.mock_stdscr.timeout.assert_called_with(-1)
+        # Нажатия только запоминаются, экран обновляет планировщик
+        self.presenter.exercise_view.update_display.assert_not_called()
+        self.presenter.exercise_view.set_state.assert_called()
+        self.presenter.exercise_view.render.assert_called_with(
+            self.mock_stdscr)
+        self.assertEqual(mock_doupdate.call_count,
+                         self.presenter.scheduler.frames)
+
+    @patch('curses.doupdate')
+    @patch('time.monotonic')
+    def test_run_exercise_stops_at_deadline(self, mock_time, mock_doupdate):
+        self.mock_stdscr.getch.side_effect = [ord('a'), -1, -1]
+        mock_time.side_effect = [0, 0, 4.75, 5, 5]
+
+        result = self.presenter._run_exercise()
+
+        self.assertEqual(result['elapsed_time'], 5)
+        # Последнее ожидание не выходит за конец упражнения
+        self.mock_stdscr.timeout.assert_any_call(250)
+        self.mock_game_model.process_keystrokes.assert_not_called()
+
+    @patch('curses.doupdate')
+    @patch('time.monotonic')
+    def test_queued_keys_are_processed_in_one_batch(self, mock_time,
+                                                    mock_doupdate):
+        text = "abcdefghij" * 100
+        self.mock_game_model.text = text + "!"
+        # Стартовая клавиша, затем 1000 нажатий уже в очереди терминала
+        self.mock_stdscr.getch.side_effect = \
+            [ord(" ")] + [ord(c) for c in text] + [-1] * 3
+        mock_time.side_effect = [0, 0, 1, 5, 5]
+
+        result = self.presenter._run_exercise()
+
+        batch = self.mock_game_model.process_keystrokes.call_args[0][0]
+        self.mock_game_model.process_keystrokes.assert_called_once()
+        self.assertEqual(len(batch), 1000)
+        # У каждого нажатия свое время, порядок сохраняется
+        timestamps = [timestamp for _, timestamp in batch]
+        self.assertEqual(timestamps, sorted(timestamps))
+        self.assertEqual(self.mock_game_model.current_position, 1000)
+        self.assertEqual(result['correct_keystrokes'], 1000)
+
+        view = self.presenter.exercise_view
+        view.set_state.assert_called_once_with(True, 1000, 1000)
+        # Первый кадр рисуется до ввода, после пачки - ровно один
+        self.assertEqual(view.render.call_count, 2)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,164 @@
+import os
+import select
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.Models.ExerciseModel import ExerciseModel
+from src.Models.SettingsModel import SettingsModel
+from src.Presenters.HeatPresenter import HeatPresenter
+from src.Views.TerminalWindow import TerminalWindow
+
+
+class _Terminal:
+    """Псевдотерминал игрока: окно на ведомой стороне, чтение вывода
+    и ввод клавиш - на ведущей."""
+
+    def __init__(self):
+        self.master, self.slave = os.openpty()
+        self.window = TerminalWindow(fd=self.slave)
+        self.output = bytearray()
+        self.closed = False
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def _read(self):
+        # Чтение с таймаутом: заблокированный read держал бы ведущую
+        # сторону открытой и после ее закрытия
+        while not self.closed:
+            ready, _, _ = select.select([self.master], [], [], 0.05)
+            if not ready:
+                continue
+            try:
+                chunk = os.read(self.master, 65536)
+            except OSError:
+                break
+            if not chunk:
+                break
+            self.output += chunk
+
+    def type(self, text: str, delay: float):
+        for char in text:
+            os.write(self.master, char.encode("utf-8"))
+            time.sleep(delay)
+
+    def hang_up(self):
+        """Закрывает терминал игрока, как закрытое окно эмулятора."""
+        self.closed = True
+        self._reader.join()
+        os.close(self.master)
+
+    def close(self):
+        os.close(self.slave)
+        if not self.closed:
+            self.hang_up()
+
+
+@patch("curses.doupdate")
+@patch("curses.flushinp")
+@patch("curses.color_pair", return_value=0)
+@patch("curses.init_pair")
+@patch("curses.start_color")
+class TestHeatPresenter(unittest.TestCase):
+
+    def setUp(self):
+        self.terminals = [_Terminal(), _Terminal()]
+        self.settings = SettingsModel()
+        settings = self.settings
+        self.text = ExerciseModel(settings.current_difficulty,
+                                  settings.current_level,
+                                  settings.current_language
+                                  ).get_exercise_text()
+
+    def tearDown(self):
+        for terminal in self.terminals:
+            terminal.close()
+
+    def play(self, exercise_seconds: float, scripts: list,
+             quits: dict = None, profiler=None):
+        """
+        Заезд, в котором игроки вводят свои строки одновременно.
+        quits - кто закрывает терминал: номер окна -> "start" (вместо
+        нажатия на стартовом экране) или "race" (после своей строки).
+        """
+        quits = quits or {}
+        heat = HeatPresenter([terminal.window
+                              for terminal in self.terminals],
+                             self.settings, exercise_seconds,
+                             profiler=profiler)
+
+        def type_script(index, terminal, script):
+            terminal.type(script, 0.01)
+            if quits.get(index) == "race":
+                terminal.hang_up()
+
+        def players():
+            # Стартовый экран: нажатие после того, как ввод сброшен;
+            # до старта всех игроков нажатия не засчитываются
+            time.sleep(0.3)
+            for index, terminal in enumerate(self.terminals):
+                if quits.get(index) == "start":
+                    terminal.hang_up()
+                else:
+                    terminal.type(" ", 0)
+            time.sleep(0.2)
+            typists = [threading.Thread(target=type_script,
+                                        args=(index, terminal, script))
+                       for index, (terminal, script) in enumerate(
+                           zip(self.terminals, scripts))
+                       if quits.get(index) != "start"]
+            for typist in typists:
+                typist.start()
+            for typist in typists:
+                typist.join()
+
+        thread = threading.Thread(target=players)
+        thread.start()
+        started = time.perf_counter()
+        results = heat.play()
+        wall = time.perf_counter() - started
+        thread.join()
+        return results, wall
+
+    def test_players_type_simultaneously(self, *mocks):
+        results, wall = self.play(1, [self.text[:20], "#" * 20])
+        self.assertEqual(results[0]["correct_keystrokes"], 20)
+        self.assertEqual(results[1]["correct_keystrokes"], 0)
+        # Оба упражнения идут одновременно, а не одно за другим
+        self.assertLess(wall, 1.9)
+        for result in results:
+            self.assertAlmostEqual(result["elapsed_time"], 1, delta=0.2)
+        for terminal in self.terminals:
+            self.assertIn(self.text[:10].encode("utf-8"), terminal.output)
+
+    def test_escape_ends_one_player(self, *mocks):
+        results, _ = self.play(1, [self.text[:5] + "\x1b", self.text[:10]])
+        self.assertEqual(results[0]["correct_keystrokes"], 5)
+        self.assertLess(results[0]["elapsed_time"], 0.5)
+        self.assertEqual(results[1]["correct_keystrokes"], 10)
+        self.assertAlmostEqual(results[1]["elapsed_time"], 1, delta=0.2)
+
+    def test_closed_terminal_ends_one_player(self, *mocks):
+        results, _ = self.play(1, [self.text[:5], self.text[:10]],
+                               quits={0: "race"})
+        self.assertEqual(results[0]["correct_keystrokes"], 5)
+        self.assertLess(results[0]["elapsed_time"], 0.5)
+        self.assertTrue(self.terminals[0].window.hung_up)
+        self.assertEqual(results[1]["correct_keystrokes"], 10)
+        self.assertAlmostEqual(results[1]["elapsed_time"], 1, delta=0.2)
+
+    def test_closed_terminal_on_start_screen(self, *mocks):
+        results, _ = self.play(1, [self.text[:10], ""], quits={1: "start"})
+        self.assertEqual(results[0]["correct_keystrokes"], 10)
+        self.assertEqual(results[1]["correct_keystrokes"], 0)
+
+    def test_profiler_covers_race(self, *mocks):
+        profiler = MagicMock()
+        self.play(0.3, ["", ""], profiler=profiler)
+        profiler.__enter__.assert_called_once()
+        profiler.__exit__.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
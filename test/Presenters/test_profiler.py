@@ -0,0 +1,68 @@
+import os
+import pstats
+import tempfile
+import unittest
+
+from src.Presenters.Profiler import SessionProfiler
+from src.Presenters.Replay import replay_session
+
+TEXT = "the quick brown fox jumps over the lazy dog " * 20
+
+
+def allocate():
+    return [str(number) for number in range(10_000)]
+
+
+class TestSessionProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def test_off_without_environment(self):
+        self.assertIsNone(SessionProfiler.from_environment({}))
+        profiler = SessionProfiler.from_environment(
+            {"TYPING_PROFILE": "exercise", "TYPING_PROFILE_MEMORY": "1",
+             "TYPING_PROFILE_DIR": self.tmp_dir.name})
+        self.assertEqual(profiler.mode, "exercise")
+        self.assertTrue(profiler.trace_memory)
+        self.assertEqual(profiler.output_root, self.tmp_dir.name)
+
+        with self.assertRaises(ValueError):
+            SessionProfiler("menu")
+
+    def test_reports(self):
+        profiler = SessionProfiler("session", trace_memory=True,
+                                   output_root=self.tmp_dir.name)
+        with profiler:
+            kept = allocate()
+        directory = profiler.save()
+
+        stats = pstats.Stats(os.path.join(directory, "session.prof"))
+        functions = {name for _, _, name in stats.stats}
+        self.assertIn("allocate", functions)
+        with open(os.path.join(directory, "allocations.txt"),
+                  encoding="utf-8") as f:
+            report = f.read()
+        self.assertIn("section 1: peak", report)
+        self.assertIn("test_profiler.py", report)
+        self.assertEqual(len(kept), 10_000)
+
+    def test_exercise_loop_only(self):
+        profiler = SessionProfiler("exercise",
+                                   output_root=self.tmp_dir.name)
+        for _ in range(2):
+            replay_session(text=TEXT, exercise_seconds=2, profiler=profiler)
+        directory = profiler.save()
+
+        self.assertEqual(profiler.sections, 2)
+        stats = pstats.Stats(os.path.join(directory, "exercise.prof"))
+        functions = {name for _, _, name in stats.stats}
+        self.assertIn("process_keystrokes", functions)
+        # Стартовый экран упражнения в профиль не попадает
+        self.assertNotIn("draw", functions)
+        self.assertNotIn("_run_exercise", functions)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from unittest.mock import patch
+
+from src.Presenters.RenderScheduler import RenderScheduler
+
+
+@patch('curses.doupdate')
+class TestRenderScheduler(unittest.TestCase):
+
+    def test_burst_is_drawn_once_per_frame(self, mock_doupdate):
+        scheduler = RenderScheduler(frame_rate=50)
+        scheduler.flush(0.0)
+
+        # 20 нажатий за 10 мс попадают в один кадр
+        now = 0.0
+        for _ in range(20):
+            now += 0.0005
+            scheduler.mark_dirty()
+            self.assertFalse(scheduler.is_due(now))
+        self.assertEqual(scheduler.wait_ms(now, 60.0), 10)
+
+        self.assertTrue(scheduler.is_due(0.02))
+        scheduler.flush(0.02)
+        self.assertEqual(mock_doupdate.call_count, 2)
+        self.assertFalse(scheduler.dirty)
+
+    def test_idle_wait_until_hud_or_deadline(self, mock_doupdate):
+        scheduler = RenderScheduler(frame_rate=60, hud_interval=0.5)
+        scheduler.flush(10.0)
+
+        self.assertEqual(scheduler.wait_ms(10.0, 60.0), 500)
+        self.assertEqual(scheduler.wait_ms(10.0, 10.2), 200)
+        self.assertTrue(scheduler.is_due(10.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
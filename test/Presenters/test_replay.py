@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+from src.Models.KeystrokeLog import KeystrokeLog, KeystrokeLogView
+from src.Models.LatencyModel import LatencyModel
+from src.Presenters.Replay import (TypistProfile, keys_from_log,
+                                   replay_session)
+
+TEXT = "the quick brown fox jumps over the lazy dog " * 20
+
+
+class TestReplay(unittest.TestCase):
+
+    def test_synthetic_session(self):
+        replay = replay_session(text=TEXT, exercise_seconds=20,
+                                profile=TypistProfile(wpm=60, accuracy=1))
+
+        result = replay["result"]
+        self.assertGreater(replay["keystrokes"], 80)
+        self.assertEqual(result["correct_keystrokes"], replay["keystrokes"])
+        self.assertAlmostEqual(result["elapsed_time"], 20, places=2)
+        self.assertAlmostEqual(result["wpm"], 60, delta=6)
+        self.assertGreater(replay["keys_per_second"], 0)
+
+    def test_recorded_session_is_reproduced(self):
+        keys = [(0.0, ord("t")), (0.2, ord("h")), (0.3, ord("x")),
+                (0.25, ord("q"))]
+        first = replay_session(text=TEXT, keys=keys, exercise_seconds=3)
+        self.assertEqual(first["keystrokes"], 4)
+        self.assertEqual(first["result"]["correct_keystrokes"], 2)
+
+        # Сценарий из журнала нажатий дает тот же результат
+        log = KeystrokeLog()
+        for timestamp_ns, position, is_correct, key in (
+                (0, 0, True, ord("t")), (200_000_000, 1, True, ord("h")),
+                (500_000_000, 2, False, ord("x")),
+                (750_000_000, 3, False, 0)):
+            log.append(timestamp_ns, position, is_correct, key)
+        replayed = keys_from_log(TEXT, KeystrokeLogView(log))
+        # Записанный код воспроизводится как есть, неизвестный - заменой
+        self.assertEqual([key for _, key in replayed],
+                         [ord("t"), ord("h"), ord("x"), ord("#")])
+        second = replay_session(text=TEXT, keys=replayed,
+                                exercise_seconds=3)
+        self.assertEqual(second["result"]["correct_keystrokes"], 2)
+        self.assertEqual(second["result"]["uniformity_score"],
+                         first["result"]["uniformity_score"])
+
+    def test_latency_is_recorded(self):
+        # Нажатие каждые 10 мс при 60 кадрах в секунду
+        keys = [(0.01, ord(char)) for char in TEXT[:100]]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            latency_model = LatencyModel(
+                os.path.join(tmp_dir, "latency.jsonl"))
+            replay_session(text=TEXT, keys=keys, exercise_seconds=2,
+                           latency_model=latency_model)
+            session, = latency_model.get_last_sessions()
+
+        self.assertEqual(session["process"]["count"], 100)
+        self.assertEqual(session["total"]["count"], 100)
+        # По виртуальным часам обработка мгновенна, а ждать кадра
+        # приходится не дольше интервала между кадрами
+        self.assertEqual(session["process"]["max_us"], 0)
+        self.assertLessEqual(session["total"]["max_us"], 16_667)
+        self.assertGreater(session["total"]["p50_us"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
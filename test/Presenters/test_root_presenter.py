@@ -1,7 +1,10 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 import curses
 
+from src.Models.RecordModel import RecordModel
 from src.Presenters.RecordPresenter import RecordPresenter
 from src.Presenters.RootPresenter import RootPresenter
 from src.Views.ListView import ListView
@@ -33,7 +36,12 @@ class TestRootPresenter(unittest.TestCase):
               MockGameModel):
         self.stdscr = MagicMock(curses.window)
         MockInitscr.return_value = self.stdscr
-        self.presenter = RootPresenter(self.stdscr)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        records_file = os.path.join(self.tmp_dir.name, "records.json")
+        with patch('src.Presenters.RootPresenter.RecordModel',
+                   lambda: RecordModel(records_file)):
+            self.presenter = RootPresenter(self.stdscr)
 
     @patch('curses.start_color')
     @patch('curses.init_pair')
@@ -0,0 +1,43 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.Models.TypistProfile import TypistProfile
+from src.Models.tournament.TournamentBot import play_bot
+from src.Models.tournament.TournamentServer import TournamentServer
+from src.Presenters.TournamentClient import TournamentClient
+
+
+class TestTournamentClient(unittest.TestCase):
+
+    @patch("curses.flushinp")
+    @patch("curses.start_color")
+    @patch("curses.init_pair")
+    def test_client_plays_match(self, mock_init_pair, mock_start_color,
+                                mock_flushinp):
+        async def scenario():
+            server = TournamentServer(2, exercise_seconds=5, port=0,
+                                      log=lambda line: None)
+            port = await server.start()
+            client = TournamentClient(MagicMock(), "human", port=port)
+            client.tournament_view = MagicMock()
+            client.game_presenter.start_game = MagicMock(return_value={
+                "correct_keystrokes": 10_000, "uniformity_score": 90})
+            bot = play_bot("bot", TypistProfile(wpm=40), port=port,
+                           time_scale=0)
+            return client, await asyncio.gather(server.run(),
+                                                client.play(), bot)
+
+        client, (report, winner, bot_winner) = asyncio.run(scenario())
+        self.assertEqual((report["winner"], winner, bot_winner),
+                         ("human", "human", "human"))
+        client.game_presenter.start_game.assert_called_once()
+        client.tournament_view.show_vs.assert_called_once_with(
+            client.stdscr, b"human", b"bot")
+        client.tournament_view.show_winer.assert_called_once_with(
+            client.stdscr, "human")
+        self.assertEqual(client.game_model.exercise_time_seconds, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -32,6 +32,7 @@ class TestTournamentPresenter(unittest.TestCase):
         self.presenter.tournament_view.show_init_gamer.return_value = [
             b'Player1', b'Player2', b'Player3', b'Player4']
         self.presenter.tournament_view.is_big_text.return_value = False
+        self.presenter.tournament_view.choose_format.return_value = 0
         self.presenter.game_model.start_game.return_value = {
             'correct_keystrokes': 10,
             'uniformity_score': 5
@@ -54,6 +55,79 @@ class TestTournamentPresenter(unittest.TestCase):
         self.presenter.tournament_view.show_start.assert_called_once()
         self.presenter.stat_presenter.save_winner.assert_called_once()
 
+    @patch("curses.initscr")
+    @patch("curses.flushinp")
+    @patch.object(GamePresenter, 'start_game')
+    @patch.object(TournamentStatPresenter, "save_winner")
+    @patch("time.sleep")
+    def test_tournament_with_odd_winners(self, mock_sleep, mock_save_winner,
+                                         mock_start_game, mock_flushinp,
+                                         mock_initscr):
+        # 6 игроков: после первого раунда раньше оставалось 3 победителя
+        gamers = [f"Player{i}".encode() for i in range(1, 7)]
+        self.presenter.tournament_view.show_init_gamer.return_value = gamers
+        scores = iter(range(1000))
+        mock_start_game.side_effect = lambda: {
+            "correct_keystrokes": next(scores), "uniformity_score": 5}
+
+        self.presenter.tournament(self.settings_model)
+
+        self.assertEqual(self.presenter.tournament_view.show_vs.call_count, 5)
+        self.assertEqual(mock_start_game.call_count, 10)
+        mock_save_winner.assert_called_once()
+
+    @patch("curses.initscr")
+    @patch("curses.flushinp")
+    @patch.object(GamePresenter, 'start_game')
+    @patch.object(TournamentStatPresenter, "save_winner")
+    @patch("time.sleep")
+    def test_swiss_tournament(self, mock_sleep, mock_save_winner,
+                              mock_start_game, mock_flushinp, mock_initscr):
+        gamers = [f"Player{i}".encode() for i in range(1, 7)]
+        self.presenter.tournament_view.show_init_gamer.return_value = gamers
+        self.presenter.tournament_view.choose_format.return_value = 1
+        scores = iter(range(1000))
+        mock_start_game.side_effect = lambda: {
+            "correct_keystrokes": next(scores), "uniformity_score": 5}
+
+        self.presenter.tournament(self.settings_model)
+
+        # 3 тура по 3 матча, таблица очков после каждого тура
+        self.assertEqual(self.presenter.tournament_view.show_vs.call_count, 9)
+        self.assertEqual(
+            self.presenter.tournament_view.show_standings.call_count, 3)
+        mock_save_winner.assert_called_once()
+
+    @patch("curses.initscr")
+    @patch("curses.flushinp")
+    @patch.object(GamePresenter, 'start_game')
+    @patch("src.Presenters.TournamentPresenter.HeatPresenter")
+    @patch.object(TournamentStatPresenter, "save_winner")
+    @patch("time.sleep")
+    def test_tournament_with_heats(self, mock_sleep, mock_save_winner,
+                                   MockHeatPresenter, mock_start_game,
+                                   mock_flushinp, mock_initscr):
+        # Основной экран и три терминала: по 2 матча в заезде
+        self.presenter.terminals = [MagicMock(), MagicMock(), MagicMock()]
+        gamers = [f"Player{i}".encode() for i in range(1, 9)]
+        self.presenter.tournament_view.show_init_gamer.return_value = gamers
+        scores = iter(range(1000))
+        MockHeatPresenter.return_value.play.side_effect = lambda count: [
+            {"correct_keystrokes": next(scores), "uniformity_score": 5}
+            for _ in range(count)]
+
+        self.presenter.tournament(self.settings_model)
+
+        mock_start_game.assert_not_called()
+        heat = MockHeatPresenter.return_value
+        # Раунды по 4, 2 и 1 матчу: 2 + 1 + 1 заезд
+        self.assertEqual([call.args for call in heat.play.call_args_list],
+                         [(4,), (4,), (4,), (2,)])
+        self.assertEqual(self.presenter.tournament_view.show_vs.call_count,
+                         14)
+        self.assertEqual(self.presenter.tour_model.winner, b"Player8")
+        mock_save_winner.assert_called_once()
+
 
 if __name__ == '__main__':
     unittest.main()
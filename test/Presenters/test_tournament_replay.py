@@ -0,0 +1,30 @@
+import os
+import tempfile
+import unittest
+
+from src.Presenters.Replay import TypistProfile
+from src.Presenters.TournamentReplay import replay_tournament
+
+
+class TestTournamentReplay(unittest.TestCase):
+
+    def test_fastest_typist_wins(self):
+        profiles = {b"slow": TypistProfile(wpm=20, accuracy=1),
+                    b"fast": TypistProfile(wpm=90, accuracy=1),
+                    b"mid": TypistProfile(wpm=40, accuracy=1),
+                    b"weak": TypistProfile(wpm=30, accuracy=0.5)}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            replay = replay_tournament(
+                profiles, exercise_seconds=5,
+                stats_file=os.path.join(tmp_dir, "tournament.json"))
+
+        self.assertEqual(replay["winner"], "fast")
+        # Два полуфинала и финал, по упражнению на каждого игрока
+        self.assertEqual(replay["games"], 6)
+        # Паузы между раундами идут по виртуальным часам
+        self.assertGreater(replay["virtual_seconds"], 30)
+        self.assertLess(replay["wall_seconds"], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
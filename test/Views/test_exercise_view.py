@@ -0,0 +1,126 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.Views.ExerciseView import ExerciseView
+
+
+class TestExerciseView(unittest.TestCase):
+
+    @patch('curses.start_color')
+    @patch('curses.init_pair')
+    def make_view(self, text, mock_init_pair, mock_start_color,
+                  complete=True):
+        return ExerciseView(text, complete=complete)
+
+    def setUp(self):
+        self.window = MagicMock()
+        self.window.getmaxyx.return_value = (40, 80)
+
+    def type_text(self, view, count):
+        for position in range(1, count + 1):
+            view.update_display(self.window, True, position, position)
+
+    @patch('curses.color_pair', return_value=0)
+    def test_update_display_single_refresh(self, mock_color_pair):
+        view = self.make_view("Test text")
+        self.type_text(view, 3)
+        self.window.reset_mock()
+
+        view.update_display(self.window, False, 4, 3)
+
+        self.window.refresh.assert_called_once()
+        self.window.erase.assert_not_called()
+
+    @patch('curses.color_pair', return_value=0)
+    def test_update_display_cost_does_not_depend_on_length(
+            self, mock_color_pair):
+        calls = []
+        for text in ("short text " * 10, "long text " * 2000):
+            view = self.make_view(text)
+            self.type_text(view, 50)
+            self.window.reset_mock()
+            view.update_display(self.window, True, 51, 51)
+            calls.append(self.window.addch.call_count +
+                         self.window.addstr.call_count)
+
+        self.assertEqual(calls[0], calls[1])
+        self.assertLessEqual(calls[0], 3)
+
+    @patch('curses.color_pair', return_value=0)
+    def test_update_display_wraps_like_full_paint(self, mock_color_pair):
+        self.window.getmaxyx.return_value = (40, 6)
+        view = self.make_view("abcdefgh")
+        self.type_text(view, 6)
+
+        # При ширине 6 в строку помещается 5 символов, шестой на новой строке
+        self.window.addch.assert_called_with(2, 0, "f", 0)
+
+    @patch('curses.color_pair', return_value=0)
+    def test_resize_rebuilds_layout(self, mock_color_pair):
+        view = self.make_view("one two three")
+        self.type_text(view, 2)
+        layout = view.layout
+
+        self.window.getmaxyx.return_value = (40, 8)
+        view.resize(self.window)
+
+        self.assertIsNot(view.layout, layout)
+        self.assertEqual(view.layout.width, 8)
+
+    @patch('curses.color_pair', return_value=0)
+    def test_render_draws_only_last_state(self, mock_color_pair):
+        view = self.make_view("Test text")
+        view.show_exercise(self.window)
+        self.window.reset_mock()
+
+        for position in range(1, 6):
+            view.set_state(True, position, position)
+        self.window.addch.assert_not_called()
+
+        view.set_hud(1.2, 58.8, 42.0)
+        view.render(self.window)
+        view.render(self.window)
+
+        self.window.refresh.assert_not_called()
+        self.assertEqual(self.window.noutrefresh.call_count, 2)
+        # Подсвечен только последний символ, строка состояния - один раз
+        self.window.addch.assert_called_once_with(1, 4, " ", 0)
+        hud = [c for c in self.window.addstr.call_args_list if c[0][0] == 0]
+        self.assertEqual(len(hud), 1)
+        self.assertEqual(hud[0][0][2],
+                         "Time: 1s | Left: 59s | Speed: 42.0 WPM")
+
+    @patch('curses.color_pair', return_value=0)
+    def test_scrolls_and_forgets_passed_lines(self, mock_color_pair):
+        # Под текст остается 3 строки, в каждой строке по 10 символов
+        self.window.getmaxyx.return_value = (10, 10)
+        view = self.make_view("abcd efgh " * 20)
+        self.type_text(view, 29)
+        self.assertEqual(view.top_line, 0)
+
+        self.window.reset_mock()
+        view.update_display(self.window, True, 30, 30)
+
+        self.assertEqual(view.top_line, 2)
+        self.assertEqual(view.layout.base, 20)
+        self.window.erase.assert_called_once()
+        # Курсор на первой строке после прокрутки
+        self.window.move.assert_called_with(2, 0)
+
+    @patch('curses.color_pair', return_value=0)
+    def test_stream_continuation_is_painted(self, mock_color_pair):
+        view = self.make_view("first sec", complete=False)
+        view.show_exercise(self.window)
+        # Незаконченное слово ждет продолжения
+        self.window.addstr.assert_called_once_with(1, 0, "first ")
+
+        view.extend_text("ond part", complete=True)
+        self.window.reset_mock()
+        view.update_display(self.window, True, 1, 1)
+
+        self.window.addstr.assert_any_call(1, 0, "first second part")
+        self.assertEqual(view.text_end, 17)
+
+
+if __name__ == '__main__':
+    unittest.main()
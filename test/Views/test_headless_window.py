@@ -0,0 +1,58 @@
+import unittest
+
+from src.Models.Clock import VirtualClock
+from src.Views.HeadlessWindow import (HeadlessWindow, ScriptedInput,
+                                      ScriptExhausted)
+
+
+class TestHeadlessWindow(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = VirtualClock()
+
+    def make_window(self, events):
+        return HeadlessWindow(ScriptedInput(events, self.clock))
+
+    def test_timed_keys_advance_clock(self):
+        window = self.make_window([(0.3, ord("a")), (0.5, ord("b"))])
+
+        window.timeout(100)
+        self.assertEqual(window.getch(), -1)
+        self.assertAlmostEqual(self.clock.now, 0.1)
+
+        window.timeout(1000)
+        self.assertEqual(window.getch(), ord("a"))
+        self.assertAlmostEqual(self.clock.now, 0.3)
+
+        # Задержка считается от выдачи предыдущего нажатия
+        window.timeout(-1)
+        self.assertEqual(window.getch(), ord("b"))
+        self.assertAlmostEqual(self.clock.now, 0.8)
+
+        with self.assertRaises(ScriptExhausted):
+            window.getch()
+
+    def test_prompt_keys_wait_for_blocking_read(self):
+        window = self.make_window([(None, ord("q")), (None, b"name")])
+
+        window.timeout(50)
+        self.assertEqual(window.getch(), -1)
+        self.assertAlmostEqual(self.clock.now, 0.05)
+
+        window.timeout(-1)
+        self.assertEqual(window.getch(), ord("q"))
+        self.assertEqual(window.getstr(), b"name")
+
+    def test_flush_drops_only_arrived_keys(self):
+        window = self.make_window([(0.0, ord("a")), (0.0, ord("b")),
+                                   (1.0, ord("c"))])
+        window.script.flush()
+
+        window.timeout(0)
+        self.assertEqual(window.getch(), -1)
+        window.timeout(-1)
+        self.assertEqual(window.getch(), ord("c"))
+
+
+if __name__ == '__main__':
+    unittest.main()
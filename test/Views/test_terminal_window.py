@@ -0,0 +1,82 @@
+import curses
+import os
+import termios
+import time
+import unittest
+from unittest.mock import patch
+
+from src.Views.TerminalWindow import ESCAPE_DELAY, TerminalWindow
+
+
+class TestTerminalWindow(unittest.TestCase):
+
+    def setUp(self):
+        self.master, self.slave = os.openpty()
+        self.window = TerminalWindow(fd=self.slave)
+        os.read(self.master, 1024)
+
+    def tearDown(self):
+        os.close(self.master)
+        os.close(self.slave)
+
+    def output(self) -> bytes:
+        return os.read(self.master, 65536)
+
+    def test_addstr_buffers_until_refresh(self):
+        self.window.addstr(1, 2, "привет", curses.A_BOLD)
+        self.window.addch(2, 0, "x")
+        self.window.noutrefresh()
+        self.assertEqual(self.output(),
+                         "\x1b[2;3H\x1b[0;1mпривет\x1b[3;1H\x1b[0mx"
+                         .encode("utf-8"))
+
+    @patch("curses.pair_content", return_value=(curses.COLOR_WHITE,
+                                                curses.COLOR_RED))
+    def test_color_pair(self, mock_pair_content):
+        self.window.addstr(0, 0, "a", 1 << 8)
+        self.window.refresh()
+        self.assertIn(b"\x1b[0;37;41ma", self.output())
+
+    def test_wrap_and_bounds(self):
+        height, width = self.window.getmaxyx()
+        self.window.addstr(0, width - 2, "abcd")
+        self.window.refresh()
+        self.assertTrue(self.output().endswith(b"ab\x1b[2;1Hcd"))
+        with self.assertRaises(curses.error):
+            self.window.addstr(height, 0, "a")
+
+    def test_getch_decodes_keys(self):
+        os.write(self.master, "aя\x1b[A\x1bOPb\x1b".encode("utf-8"))
+        self.window.timeout(100)
+        self.assertEqual([self.window.getch() for _ in range(5)],
+                         [ord("a"), ord("я"), ord("b"), 27, -1])
+
+    def test_escape_sequence_split_across_reads(self):
+        self.window.nodelay(True)
+        os.write(self.master, b"a\x1b[")
+        self.assertEqual(self.window.getch(), ord("a"))
+        os.write(self.master, b"Ab")
+        # Остаток стрелки дочитывается, Escape не появляется
+        self.assertEqual([self.window.getch() for _ in range(2)],
+                         [ord("b"), -1])
+
+    def test_lone_escape_after_delay(self):
+        self.window.nodelay(True)
+        os.write(self.master, b"\x1b")
+        started = time.perf_counter()
+        self.assertEqual(self.window.getch(), 27)
+        self.assertGreaterEqual(time.perf_counter() - started, ESCAPE_DELAY)
+        self.assertEqual(self.window.getch(), -1)
+
+    def test_flushinp_and_close(self):
+        os.write(self.master, b"abc")
+        self.window.flushinp()
+        self.window.nodelay(True)
+        self.assertEqual(self.window.getch(), -1)
+        self.assertFalse(termios.tcgetattr(self.slave)[3] & termios.ECHO)
+        self.window.close()
+        self.assertTrue(termios.tcgetattr(self.slave)[3] & termios.ECHO)
+
+
+if __name__ == '__main__':
+    unittest.main()
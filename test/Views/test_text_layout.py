@@ -0,0 +1,58 @@
+import unittest
+
+from src.Views.TextLayout import TextLayout
+
+
+class TestTextLayout(unittest.TestCase):
+
+    def test_word_wrap(self):
+        layout = TextLayout("one two three", 9, 1, 0)
+        # "three" не помещается в первую строку и переносится целиком
+        self.assertEqual(list(layout.line_starts), [0, 8])
+        self.assertEqual(layout.cell(8), (2, 0))
+        self.assertEqual(layout.line_text(0), "one two ")
+        self.assertEqual(layout.end_y, 3)
+
+    def test_new_lines(self):
+        layout = TextLayout("ab\ncd", 80, 0, 0)
+        self.assertEqual(layout.cell(2), (0, 2))
+        self.assertEqual(layout.cell(3), (1, 0))
+        self.assertEqual(layout.line_text(0), "ab")
+        self.assertEqual(layout.cell(5), (1, 2))
+
+    def test_long_word_is_split(self):
+        layout = TextLayout("abcdefgh", 5, 0, 0)
+        self.assertEqual(layout.cell(3), (0, 3))
+        self.assertEqual(layout.cell(4), (1, 0))
+
+    def test_wide_chars(self):
+        layout = TextLayout("我家住", 80, 0, 0)
+        self.assertEqual(layout.cell(1), (0, 2))
+        self.assertEqual(layout.cell(3), (0, 6))
+
+    def test_extend_matches_full_layout(self):
+        text = "one two three four five six seven"
+        full = TextLayout(text, 9, 1, 0)
+        layout = TextLayout("", 9, 1, 0, complete=False)
+        for start in range(0, len(text), 4):
+            layout.extend(text[start:start + 4], complete=False)
+        layout.extend("", complete=True)
+
+        self.assertEqual(list(layout.line_starts), list(full.line_starts))
+        for position in range(len(text) + 1):
+            self.assertEqual(layout.cell(position), full.cell(position))
+
+    def test_drop_lines_keeps_absolute_positions(self):
+        layout = TextLayout("one two three four", 9, 1, 0)
+        cell = layout.cell(14)
+        layout.drop_lines_before(1)
+
+        self.assertEqual(layout.base, 8)
+        self.assertEqual(layout.first_line, 1)
+        self.assertEqual(layout.cell(14), cell)
+        self.assertEqual(layout.line_text(1), "three ")
+        self.assertEqual(layout.end_y, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()